@@ -0,0 +1,69 @@
+# benchmarks/ai_cache.py
+
+"""
+Offline check of the AI response cache against the local API stub.
+
+Sends repeated, concurrent and distinct requests through utils/ai_client and
+compares how many reached the stub server with how many were expected, along
+with the latency of a cache miss vs. a hit.
+
+Run from the repo root (no network or API key needed):
+    python -m benchmarks.ai_cache
+"""
+
+import asyncio
+import sys
+import time
+
+from utils import ai_client, ai_stub_server
+
+SYSTEM = "You summarize questionnaire answers."
+MODEL = "claude-3-haiku-20240307"
+CONCURRENT = 10
+
+
+def ask(text: str):
+    return ai_client.create_message(SYSTEM, [{"role": "user", "content": text}], model=MODEL, max_tokens=100)
+
+
+async def main() -> int:
+    ai_client.ANTHROPIC_API_URL = await ai_stub_server.start_stub_server()
+    ai_client.clear_cache()
+    failures = 0
+
+    def check(label: str, expected_calls: int) -> None:
+        nonlocal failures
+        calls = ai_stub_server.stats["requests"]
+        ok = calls == expected_calls
+        failures += not ok
+        print(f"{'ok ' if ok else 'FAIL'} {label:<40} stub requests: {calls} (expected {expected_calls})")
+
+    try:
+        start = time.perf_counter()
+        first = await ask("I like hybrid attacks")
+        miss = time.perf_counter() - start
+
+        start = time.perf_counter()
+        second = await ask("I like hybrid attacks")
+        hit = time.perf_counter() - start
+        check("repeated request served from cache", 1)
+        if first != second:
+            failures += 1
+            print("FAIL cached text differs from the original response")
+
+        await asyncio.gather(*(ask("Queen charge lalo") for _ in range(CONCURRENT)))
+        check(f"{CONCURRENT} concurrent identical requests", 2)
+
+        await ask("Something else entirely")
+        check("distinct request goes to the API", 3)
+
+        print(f"\nmiss {miss * 1000:.2f} ms, hit {hit * 1000:.3f} ms")
+        print(ai_client.get_cache_stats())
+    finally:
+        await ai_stub_server.stop_stub_server()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
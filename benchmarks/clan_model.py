@@ -0,0 +1,142 @@
+# benchmarks/clan_model.py
+
+"""
+Micro-benchmark: cost of building Clan objects.
+
+Compares the old eager model (instance __dict__, emoji parsed in __init__)
+with the slotted model, and with instances shared through the clan registry.
+Reports construction time and retained memory per 1,000 clans.
+
+Run from the repo root:
+    python -m benchmarks.clan_model
+"""
+
+import gc
+import timeit
+import tracemalloc
+
+from utils import clan_registry
+from utils.classes import Clan
+from utils.emoji import EmojiType
+
+CLANS = 1000
+REPEAT = 5
+NUMBER = 20
+
+
+class EagerClan:
+    """The previous Clan: per-instance __dict__ and the emoji parsed up front"""
+
+    def __init__(self, data: dict):
+        self._data = data
+        self.announcement_id = data.get("announcement_id")
+        self.chat_channel_id = data.get("chat_channel_id")
+        self.emoji = data.get("emoji")
+        if self.emoji.count(":") >= 2:
+            try:
+                self.partial_emoji = EmojiType(self.emoji).partial_emoji
+            except (IndexError, ValueError):
+                self.partial_emoji = None
+        else:
+            self.partial_emoji = None
+        self.tag = data.get("tag")
+        self.leader_id = data.get("leader_id")
+        self.leader_role_id = data.get("leader_role_id")
+        self.leadership_channel_id = data.get("leadership_channel_id")
+        self.logo = data.get("logo")
+        self.banner = data.get("banner")
+        self.name = data.get("name")
+        self.profile = data.get("profile")
+        self.role_id = data.get("role_id")
+        self.rules_channel_id = data.get("rules_channel_id")
+        self.status = data.get("status")
+        self.th_attribute = data.get("th_attribute")
+        self.th_requirements = data.get("th_requirements")
+        self.thread_id = data.get("thread_id")
+        self.thread_message_id = data.get("thread_message_id", 0)
+        self.type = data.get("type")
+        self.points = data.get("points")
+        self.recruit_count = data.get("recruit_count", 0)
+        self.placeholder_points = data.get("placeholder_points", 0.0)
+        self.recruit_welcome = data.get("recruit_welcome")
+
+
+def make_docs(count: int) -> list:
+    """Clan documents shaped like settings.clan_data"""
+    return [
+        {
+            "_id": i,
+            "tag": f"#CLAN{i:05d}",
+            "name": f"Clan {i}",
+            "emoji": f"<:Clan_{i}:{1387845120732172329 + i}>",
+            "type": "FWA" if i % 3 == 0 else "Competitive",
+            "status": "Main",
+            "role_id": 1000000000000000000 + i,
+            "leader_id": 2000000000000000000 + i,
+            "leader_role_id": 3000000000000000000 + i,
+            "chat_channel_id": 4000000000000000000 + i,
+            "announcement_id": 5000000000000000000 + i,
+            "leadership_channel_id": 6000000000000000000 + i,
+            "rules_channel_id": 7000000000000000000 + i,
+            "thread_id": 8000000000000000000 + i,
+            "logo": f"https://example.com/logo/{i}.png",
+            "banner": f"https://example.com/banner/{i}.png",
+            "profile": f"Profile text for clan {i}",
+            "th_attribute": "TH14+",
+            "th_requirements": 14,
+            "points": float(i % 50),
+            "recruit_count": i % 7,
+            "recruit_welcome": "Welcome!",
+        }
+        for i in range(count)
+    ]
+
+
+def slotted_with_emoji(data: dict) -> Clan:
+    """Slotted clan whose emoji is actually used (the lazy parse is paid)"""
+    clan = Clan(data)
+    clan.partial_emoji
+    return clan
+
+
+def time_per_1000(build, docs: list) -> float:
+    """Best-of-REPEAT milliseconds to build CLANS objects"""
+    best = min(timeit.repeat(lambda: [build(d) for d in docs], repeat=REPEAT, number=NUMBER))
+    return best / NUMBER * 1000 * (1000 / len(docs))
+
+
+def memory_per_1000(build, docs: list) -> float:
+    """KiB retained by CLANS objects (the documents themselves excluded)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [build(d) for d in docs]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return size / 1024 * (1000 / len(docs))
+
+
+def main() -> None:
+    docs = make_docs(CLANS)
+
+    # Prime the registry so as_clan() can hand back shared instances
+    for data in docs:
+        clan_registry._index(data)
+
+    cases = [
+        ("eager (old)", EagerClan),
+        ("slotted", Clan),
+        ("slotted + emoji", slotted_with_emoji),
+        ("registry shared", clan_registry.as_clan),
+    ]
+
+    print(f"{'model':<18}{'ms / 1000':>12}{'KiB / 1000':>13}")
+    for label, build in cases:
+        print(f"{label:<18}{time_per_1000(build, docs):>12.2f}{memory_per_1000(build, docs):>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/summary_parser.py
+
+"""
+Micro-benchmark: progress detection on AI questionnaire summaries.
+
+Compares the old progress analysis (split the summary once per section, then
+scan its lines) with parse_summary() + section_progress() on summaries of
+growing length (several accounts' answers per section), and checks both give
+the same flags.
+
+Run from the repo root:
+    python -m benchmarks.summary_parser
+"""
+
+import sys
+import timeit
+from typing import Dict
+
+from extensions.events.message.ticket_automation.ai.processors import (
+    ATTACK_STRATEGIES_SECTIONS,
+    CLAN_EXPECTATIONS_SECTIONS,
+)
+from extensions.events.message.ticket_automation.ai.summary_parser import parse_summary, section_progress
+
+ACCOUNTS = (1, 5, 20)
+ENTRIES_PER_ACCOUNT = 6
+NUMBER = 2000
+
+
+def legacy_progress(summary: str, fields: Dict[str, str]) -> dict:
+    """The previous analysis: split the whole summary once per section, then scan its lines"""
+    progress = {flag: False for flag in fields.values()}
+    titles = list(fields)
+
+    for i, (title, flag) in enumerate(fields.items()):
+        marker = f"**{title}:**"
+        if marker not in summary:
+            continue
+        section = summary.split(marker)[1]
+        if i + 1 < len(titles):
+            section = section.split(f"**{titles[i + 1]}:**")[0]
+        if "No input provided" not in section and "{white_arrow}" in section:
+            for line in section.strip().split("\n"):
+                if "{white_arrow}" in line and len(line.split("{white_arrow}")[1].strip()) > 0:
+                    progress[flag] = True
+                    break
+    return progress
+
+
+def single_pass(summary: str, fields: Dict[str, str]) -> dict:
+    return section_progress(parse_summary(summary), fields)
+
+
+def build_summary(fields: Dict[str, str], accounts: int) -> str:
+    """Summary with every account's answers listed under each section"""
+    blocks = []
+    for title in fields:
+        lines = [f"{{red_arrow}} **{title}:**"]
+        lines += [f"{{blank}}{{white_arrow}} {title} answer for account {account}, variant {n}"
+                  for account in range(accounts) for n in range(ENTRIES_PER_ACCOUNT)]
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks)
+
+
+def main() -> int:
+    failures = 0
+    print(f"{'summary':<12} {'accounts':>8} {'chars':>7} {'legacy us':>10} {'parser us':>10}")
+
+    for name, fields in (("attack", ATTACK_STRATEGIES_SECTIONS), ("expectations", CLAN_EXPECTATIONS_SECTIONS)):
+        for accounts in ACCOUNTS:
+            summary = build_summary(fields, accounts)
+            if legacy_progress(summary, fields) != single_pass(summary, fields):
+                failures += 1
+                print(f"FAIL {name} progress differs for {accounts} account(s)")
+
+            old = timeit.timeit(lambda: legacy_progress(summary, fields), number=NUMBER) / NUMBER
+            new = timeit.timeit(lambda: single_pass(summary, fields), number=NUMBER) / NUMBER
+            print(f"{name:<12} {accounts:>8} {len(summary):>7} {old * 1e6:>10.1f} {new * 1e6:>10.1f}")
+
+    # A placeholder bullet must not count as an answer
+    empty = "{red_arrow} **Main Village Strategies:**\n{blank}{white_arrow} No input provided."
+    if section_progress(parse_summary(empty), ATTACK_STRATEGIES_SECTIONS)["has_main_village"]:
+        failures += 1
+        print("FAIL placeholder entry counted as progress")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,137 @@
 from utils.mongo import MongoClient
 import lightbulb
-from utils.classes import Clan
-import time
-
-# Simple cache storage
-_cache = {
-    "clan_types": {"data": None, "timestamp": 0},
-    "th_attribute": {"data": None, "timestamp": 0},
-    "clans": {"data": None, "timestamp": 0},
-    "fwa_clans": {"data": None, "timestamp": 0}
-}
-CACHE_DURATION = 300  # 5 minutes
+import unicodedata
+from typing import Dict, Iterable, List, Set, Tuple
+from utils import clan_registry
+
+# Discord shows at most 25 autocomplete choices
+MAX_CHOICES = 25
+
+# Placeholder choices always offered alongside real values
+EXTRA_CHOICES = ["Demo", "Stuff"]
+
+# Match ranks, best first
+EXACT, NAME_PREFIX, WORD_PREFIX, KEY_PREFIX, SUBSTRING = range(5)
+
+
+def normalize(text) -> str:
+    """Case- and accent-insensitive form used for matching"""
+    text = unicodedata.normalize("NFKD", str(text))
+    return "".join(ch for ch in text if not unicodedata.combining(ch)).casefold().strip()
+
+
+class AutocompleteIndex:
+    """
+    Choices with pre-normalized search keys and a prefix lookup table.
+    The first key is the display name; later keys (e.g. tags) match by prefix too.
+    """
+
+    PREFIX_LENGTH = 2
+
+    def __init__(self, entries: Iterable[Tuple[object, Iterable[str]]]):
+        self._choices: List[object] = []
+        self._keys: List[Tuple[str, ...]] = []
+        self._words: List[Tuple[str, ...]] = []
+        self._prefixes: Dict[str, Set[int]] = {}
+
+        for index, (choice, keys) in enumerate(entries):
+            keys = tuple(normalize(key).lstrip("#") for key in keys if key)
+            words = tuple(word for word in keys[0].split() if word) if keys else ()
+
+            self._choices.append(choice)
+            self._keys.append(keys)
+            self._words.append(words)
+            for term in set(keys) | set(words):
+                for length in range(1, self.PREFIX_LENGTH + 1):
+                    self._prefixes.setdefault(term[:length], set()).add(index)
+
+    def __len__(self) -> int:
+        return len(self._choices)
+
+    def _rank(self, index: int, query: str) -> int:
+        keys = self._keys[index]
+        if query in keys:
+            return EXACT
+        if keys and keys[0].startswith(query):
+            return NAME_PREFIX
+        if any(word.startswith(query) for word in self._words[index]):
+            return WORD_PREFIX
+        if any(key.startswith(query) for key in keys):
+            return KEY_PREFIX
+        if any(query in key for key in keys):
+            return SUBSTRING
+        return -1
+
+    def search(self, query: str, limit: int = MAX_CHOICES) -> list:
+        """Best matches for query, exact and prefix matches first, at most limit results"""
+        query = normalize(query).lstrip("#")
+        if not query:
+            return self._choices[:limit]
+
+        buckets: List[List[int]] = [[] for _ in range(SUBSTRING + 1)]
+
+        # Prefix matches only come from the lookup table
+        candidates = sorted(self._prefixes.get(query[:self.PREFIX_LENGTH], ()))
+        for index in candidates:
+            rank = self._rank(index, query)
+            if rank >= 0:
+                buckets[rank].append(index)
+                if len(buckets[EXACT]) >= limit:
+                    break
+
+        # Fall back to a substring scan only while there's room left
+        found = sum(len(bucket) for bucket in buckets)
+        if found < limit:
+            seen = set(candidates)
+            for index in range(len(self._choices)):
+                if index not in seen and any(query in key for key in self._keys[index]):
+                    buckets[SUBSTRING].append(index)
+                    found += 1
+                    if found >= limit:
+                        break
+
+        ranked = [index for bucket in buckets for index in bucket]
+        return [self._choices[index] for index in ranked[:limit]]
+
+
+# Built indexes, each tagged with the clan registry version it was built from
+_indexes: Dict[str, Tuple[int, AutocompleteIndex]] = {}
+
+
+def _build(kind: str, clans: list) -> AutocompleteIndex:
+    if kind == "clans":
+        return AutocompleteIndex(
+            (f"{c.name} | {c.tag}", (c.name, c.tag))
+            for c in sorted(clans, key=lambda c: (c.name or "").lower())
+        )
+    if kind == "fwa_clans":
+        return AutocompleteIndex(
+            (
+                # Display "Clan Name • #TAG", value "Name|Tag|RoleID" (what the command receives)
+                (f"{c.name} • {c.tag}", f"{c.name}|{c.tag}|{c.role_id if c.role_id is not None else ''}"),
+                (c.name, c.tag)
+            )
+            for c in sorted(clans, key=lambda c: (c.name or "").lower())
+            if c.type == "FWA"
+        )
+
+    # Distinct field values (clan_types / th_attribute)
+    field = "type" if kind == "clan_types" else kind
+    values = sorted({str(c._data.get(field)) for c in clans if c._data.get(field)}) + EXTRA_CHOICES
+    return AutocompleteIndex((value, (value,)) for value in values)
+
+
+async def get_index(mongo: MongoClient, kind: str) -> AutocompleteIndex:
+    """Autocomplete index for kind, rebuilt whenever a clan has changed"""
+    clans = await clan_registry.get_clans(mongo)
+
+    cached = _indexes.get(kind)
+    if cached and cached[0] == clan_registry.version:
+        return cached[1]
+
+    index = _build(kind, clans)
+    _indexes[kind] = (clan_registry.version, index)
+    return index
 
 
 @lightbulb.di.with_di
@@ -18,16 +139,8 @@ async def clan_types(
         ctx: lightbulb.AutocompleteContext[str],
         mongo: MongoClient
 ) -> None:
-    query = ctx.focused.value or ""
-
-    # Check cache
-    now = time.time()
-    if _cache["clan_types"]["data"] is None or (now - _cache["clan_types"]["timestamp"]) > CACHE_DURATION:
-        _cache["clan_types"]["data"] = (await mongo.clans.distinct("type")) + ["Demo", "Stuff"]
-        _cache["clan_types"]["timestamp"] = now
-
-    distinct = _cache["clan_types"]["data"]
-    await ctx.respond([d for d in distinct if query.lower() in d.lower()])
+    index = await get_index(mongo, "clan_types")
+    await ctx.respond(index.search(ctx.focused.value or ""))
 
 
 @lightbulb.di.with_di
@@ -35,16 +148,8 @@ async def th_attribute(
         ctx: lightbulb.AutocompleteContext[str],
         mongo: MongoClient
 ) -> None:
-    query = ctx.focused.value or ""
-
-    # Check cache
-    now = time.time()
-    if _cache["th_attribute"]["data"] is None or (now - _cache["th_attribute"]["timestamp"]) > CACHE_DURATION:
-        _cache["th_attribute"]["data"] = (await mongo.clans.distinct("th_attribute")) + ["Demo", "Stuff"]
-        _cache["th_attribute"]["timestamp"] = now
-
-    distinct = _cache["th_attribute"]["data"]
-    await ctx.respond([d for d in distinct if query.lower() in d.lower()])
+    index = await get_index(mongo, "th_attribute")
+    await ctx.respond(index.search(ctx.focused.value or ""))
 
 
 @lightbulb.di.with_di
@@ -52,17 +157,8 @@ async def clans(
         ctx: lightbulb.AutocompleteContext[str],
         mongo: MongoClient
 ) -> None:
-    query = ctx.focused.value or ""
-
-    # Check cache
-    now = time.time()
-    if _cache["clans"]["data"] is None or (now - _cache["clans"]["timestamp"]) > CACHE_DURATION:
-        clans_data = await mongo.clans.find().to_list(length=None)
-        _cache["clans"]["data"] = [Clan(data=data) for data in clans_data]
-        _cache["clans"]["timestamp"] = now
-
-    clans = _cache["clans"]["data"]
-    await ctx.respond([f"{c.name} | {c.tag}" for c in clans if query.lower() in c.name.lower()])
+    index = await get_index(mongo, "clans")
+    await ctx.respond(index.search(ctx.focused.value or ""))
 
 
 @lightbulb.di.with_di
@@ -71,51 +167,14 @@ async def fwa_clans(
         mongo: MongoClient = lightbulb.di.INJECTED
 ) -> None:
     """Autocomplete for FWA clans only"""
-    query = ctx.focused.value or ""
-
-    # Check cache
-    now = time.time()
-    if _cache["fwa_clans"]["data"] is None or (now - _cache["fwa_clans"]["timestamp"]) > CACHE_DURATION:
-        _cache["fwa_clans"]["data"] = await mongo.clans.find({"type": "FWA"}).to_list(length=None)
-        _cache["fwa_clans"]["timestamp"] = now
-
-    clans = _cache["fwa_clans"]["data"]
-
-    # Filter clans based on query
-    filtered_clans = []
-    for clan in clans:
-        if query.lower() in clan['name'].lower() or query.lower() in clan['tag'].lower():
-            filtered_clans.append(clan)
-
-    # Create list of tuples for clean display
-    choices = []
-    for clan in filtered_clans[:25]:
-        # Display format: "Clan Name • #TAG"
-        display = f"{clan['name']} • {clan['tag']}"
-        # Value format: "Name|Tag|RoleID" (what the command receives)
-        value = f"{clan['name']}|{clan['tag']}|{clan.get('role_id', '')}"
-        choices.append((display, value))
-
-    await ctx.respond(choices)
+    index = await get_index(mongo, "fwa_clans")
+    await ctx.respond(index.search(ctx.focused.value or ""))
 
 
 # Simple preload function to call on bot startup
 async def preload_autocomplete_cache(mongo: MongoClient):
-    """Call this once when your bot starts to preload all caches"""
-    print("[Autocomplete] Preloading caches...")
-
-    # Preload each cache
-    _cache["clan_types"]["data"] = (await mongo.clans.distinct("type")) + ["Demo", "Stuff"]
-    _cache["clan_types"]["timestamp"] = time.time()
-
-    _cache["th_attribute"]["data"] = (await mongo.clans.distinct("th_attribute")) + ["Demo", "Stuff"]
-    _cache["th_attribute"]["timestamp"] = time.time()
-
-    clans_data = await mongo.clans.find().to_list(length=None)
-    _cache["clans"]["data"] = [Clan(data=data) for data in clans_data]
-    _cache["clans"]["timestamp"] = time.time()
-
-    _cache["fwa_clans"]["data"] = await mongo.clans.find({"type": "FWA"}).to_list(length=None)
-    _cache["fwa_clans"]["timestamp"] = time.time()
+    """Build every autocomplete index up front so the first keystroke is instant"""
+    for kind in ("clan_types", "th_attribute", "clans", "fwa_clans"):
+        await get_index(mongo, kind)
 
-    print(f"[Autocomplete] Loaded {len(_cache['clans']['data'])} clans, {len(_cache['fwa_clans']['data'])} FWA clans")
\ No newline at end of file
+    print(f"[Autocomplete] Indexed {len(_indexes['clans'][1])} clans, {len(_indexes['fwa_clans'][1])} FWA clans")
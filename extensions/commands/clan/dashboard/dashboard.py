@@ -23,7 +23,7 @@ from hikari.impl import (
 from utils.constants import RED_ACCENT
 from utils.emoji import emojis
 from utils.mongo import MongoClient
-from utils.classes import Clan
+from utils.clan_registry import get_clans
 
 # Main Clan Dashboard Management
 @lightbulb.di.with_di
@@ -33,8 +33,7 @@ async def dashboard_page(
         mongo: MongoClient = lightbulb.di.INJECTED,
         **kwargs
 ):
-    clan_data = await mongo.clans.find().to_list(length=None)
-    clans = [Clan(data=data) for data in clan_data]
+    clans = await get_clans(mongo)
     components = [
         Container(
             accent_color=RED_ACCENT,
@@ -14,7 +14,7 @@ from extensions.components import register_action
 from utils.mongo import MongoClient
 from utils.cloudinary_client import CloudinaryClient
 from utils.constants import RED_ACCENT, GREEN_ACCENT, BLUE_ACCENT, GOLD_ACCENT, FWA_WAR_BASE, FWA_ACTIVE_WAR_BASE
-from utils.emoji import emojis
+from utils.emoji import th_emoji
 from extensions.commands.clan.dashboard.dashboard import dashboard_page
 
 from hikari.impl import (
@@ -64,12 +64,7 @@ def get_fwa_public_id(th_level: str, base_type: str) -> str:
 def get_th_emoji(th_level: str):
     """Get the appropriate TH emoji object"""
     # Handle _new variants by removing the suffix
-    clean_th_level = th_level.replace("_new", "")
-    th_num = clean_th_level.upper().replace("TH", "")
-    emoji_attr = f"TH{th_num}"
-    if hasattr(emojis, emoji_attr):
-        return getattr(emojis, emoji_attr)
-    return None
+    return th_emoji(th_level.replace("_new", ""))
 
 
 def validate_clash_link(link: str) -> bool:
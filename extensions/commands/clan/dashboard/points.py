@@ -13,6 +13,8 @@ from utils.mongo import MongoClient
 from utils.classes import Clan
 from utils.constants import RED_ACCENT, GREEN_ACCENT, BLUE_ACCENT, GOLD_ACCENT, MAGENTA_ACCENT
 from utils.emoji import emojis
+from utils.points_events import publish_points_change
+from utils.clan_registry import get_clans
 
 from hikari.impl import (
     MessageActionRowBuilder as ActionRow,
@@ -147,8 +149,7 @@ async def clan_points_main(
     """Main clan points dashboard - shows overview and quick stats"""
 
     # Get all clan data
-    clan_data = await mongo.clans.find().to_list(length=None)
-    clans = [Clan(data=data) for data in clan_data]
+    clans = await get_clans(mongo)
 
     # Calculate stats
     total_points = sum(c.points for c in clans)
@@ -236,8 +237,7 @@ async def points_quick_select(
         ]
         return components
 
-    clan_data = await mongo.clans.find().to_list(length=None)
-    clans = [Clan(data=data) for data in clan_data]
+    clans = await get_clans(mongo)
 
     # Sort by points descending
     sorted_clans = sorted(clans, key=lambda c: c.points, reverse=True)
@@ -502,6 +502,7 @@ async def quick_add_submit(
         {"tag": tag},
         {"$inc": {"points": amount}}
     )
+    publish_points_change(tag)
 
     new_points = old_points + amount
 
@@ -712,6 +713,7 @@ async def quick_sub_submit(
         {"tag": tag},
         {"$set": {"points": new_points}}
     )
+    publish_points_change(tag)
 
     # Log the change (negative value for reduction)
     if actual_change > 0:
@@ -997,6 +999,7 @@ async def custom_points_submit(
                 {"tag": tag},
                 {"$set": update_data}
             )
+            publish_points_change(tag)
 
         # Log the points change if any
         if actual_points_change != 0:
@@ -1199,6 +1202,7 @@ async def add_recruit_submit(
         {"tag": tag},
         {"$inc": {"recruit_count": 1}}
     )
+    publish_points_change(tag)
 
     # Get updated clan data
     clan_data = await mongo.clans.find_one({"tag": tag})
@@ -1316,8 +1320,7 @@ async def recruitment_overview(
 ):
     """Show recruitment statistics overview"""
 
-    clan_data = await mongo.clans.find().to_list(length=None)
-    clans = [Clan(data=data) for data in clan_data]
+    clans = await get_clans(mongo)
 
     # Sort by recruit count
     sorted_by_recruits = sorted(clans, key=lambda c: c.recruit_count, reverse=True)
@@ -1370,9 +1373,9 @@ async def month_reset_confirm(
 ):
     """Confirm monthly reset"""
 
-    clans = await mongo.clans.find().to_list(length=None)
-    total_points = sum(c.get("points", 0) for c in clans)
-    clans_affected = sum(1 for c in clans if c.get("points", 0) > 0)
+    clans = await get_clans(mongo)
+    total_points = sum(c.points or 0 for c in clans)
+    clans_affected = sum(1 for c in clans if (c.points or 0) > 0)
 
     components = [
         Container(
@@ -1433,11 +1436,13 @@ async def confirm_month_reset(
                 {"tag": clan["tag"]},
                 {"$set": {"points": new_points}}
             )
+            publish_points_change(clan["tag"])
 
             changes.append(f"{clan['name']}: {old_points:.1f} → {new_points:.1f}")
 
     # Reset all recruit counts
     await mongo.clans.update_many({}, {"$set": {"recruit_count": 0}})
+    publish_points_change()
 
     components = [
         Container(
@@ -27,15 +27,21 @@ from hikari.impl import (
 
 from extensions.components import register_action
 from io import BytesIO
-from PIL import Image
 
 from utils.constants import RED_ACCENT, GREEN_ACCENT
 from utils.classes import Clan
 from utils.emoji import emojis
 from utils.mongo import MongoClient
+from utils.points_events import publish_points_change
+from utils.clan_registry import get_clans, get_clans_by_tags
 from extensions.commands.clan.dashboard import dashboard_page
 from extensions.commands.clan.dashboard import update_clan_info_general
 
+from utils.lazy_import import lazy_import
+
+# PIL is only needed when an image is actually processed
+Image = lazy_import("PIL.Image")
+
 CLAN_MANAGEMENT_ROLE_ID = 1060318031575793694
 ADDITIONAL_MANAGEMENT_ROLE_ID = 1371470242076954706
 CLAN_DELETION_USER_ID = 505227988229554179
@@ -243,6 +249,7 @@ async def handle_role_autocreate(
             "points": 0.0,
             "recruit_count": 0
         })
+        publish_points_change(clan.tag)
 
         # Show success message and go to edit menu
         success_components = [
@@ -323,6 +330,7 @@ async def handle_role_skip(
             "points": 0.0,
             "recruit_count": 0
         })
+        publish_points_change(clan.tag)
 
         # Go directly to edit menu
         new_components = await clan_edit_menu(ctx, clan.tag, mongo=mongo, tag=clan.tag)
@@ -615,6 +623,7 @@ async def handle_confirm_role_selection(
             "points": 0.0,
             "recruit_count": 0
         })
+        publish_points_change(clan.tag)
 
         # Clean up temporary state
         if clan_tag in role_selection_state:
@@ -905,8 +914,7 @@ async def remove_clan_select(
         await ctx.respond(components=components, ephemeral=True)
         return
 
-    clans = await mongo.clans.find().to_list(length=None)
-    clans = [Clan(data=data) for data in clans]
+    clans = await get_clans(mongo)
 
     # Check if pagination is needed (Discord limit is 25 per dropdown)
     if len(clans) <= 25:
@@ -1013,8 +1021,7 @@ async def clan_remove_show_more(
     remaining_tags = stored_data.get("remaining_tags", [])
     current_page = stored_data.get("page", 0)
 
-    clan_data = await mongo.clans.find({"tag": {"$in": remaining_tags}}).to_list(length=None)
-    remaining_clans = [Clan(data=d) for d in clan_data]
+    remaining_clans = await get_clans_by_tags(mongo, remaining_tags)
 
     # Sort by original order (alphabetical)
     remaining_clans = sorted(
@@ -1245,6 +1252,7 @@ async def on_remove_clan_field(
 
         # Delete clan from database
         await mongo.clans.delete_one({"tag": tag})
+        publish_points_change(tag)
 
         # Show deletion confirmation
         # Build components list conditionally to avoid empty Text components
@@ -1283,8 +1291,7 @@ async def choose_clan_select(
         mongo: MongoClient = lightbulb.di.INJECTED,
         **kwargs
 ):
-    clans = await mongo.clans.find().to_list(length=None)
-    clans = [Clan(data=data) for data in clans]
+    clans = await get_clans(mongo)
 
     # Check if pagination is needed (Discord limit is 25 per dropdown)
     if len(clans) <= 25:
@@ -1391,8 +1398,7 @@ async def clan_edit_show_more(
     remaining_tags = stored_data.get("remaining_tags", [])
     current_page = stored_data.get("page", 0)
 
-    clan_data = await mongo.clans.find({"tag": {"$in": remaining_tags}}).to_list(length=None)
-    remaining_clans = [Clan(data=d) for d in clan_data]
+    remaining_clans = await get_clans_by_tags(mongo, remaining_tags)
 
     # Sort by original order (alphabetical)
     remaining_clans = sorted(
@@ -2567,6 +2573,7 @@ async def process_emoji_upload(
             {"tag": tag},
             {"$set": {"emoji": new_emoji.mention}}
         )
+        publish_points_change(tag)
 
         # Success message
         success_components = [
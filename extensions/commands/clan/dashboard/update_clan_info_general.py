@@ -5,7 +5,6 @@ import pymongo
 import hikari
 import coc
 import re
-from PIL import Image
 from io import BytesIO
 import requests
 
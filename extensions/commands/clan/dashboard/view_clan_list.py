@@ -15,7 +15,7 @@ from utils.constants import RED_ACCENT
 from utils.emoji import emojis
 from extensions.components import register_action
 from utils.mongo import MongoClient
-from utils.classes import Clan
+from utils.clan_registry import get_clans
 from extensions.commands.clan.dashboard.dashboard import dashboard_page
 
 @register_action("view_clan_list", group="clan_database")
@@ -26,8 +26,7 @@ async def view_clan_list(
         mongo: MongoClient = lightbulb.di.INJECTED,
         **kwargs
 ):
-    clan_data = await mongo.clans.find().to_list(length=None)
-    clans = [Clan(data=data) for data in clan_data]
+    clans = await get_clans(mongo)
 
     # Build enhanced clan list with formatting
     clan_list = ""
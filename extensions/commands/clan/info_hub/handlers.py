@@ -24,7 +24,7 @@ from extensions.components import register_action
 from utils.mongo import MongoClient
 from utils.classes import Clan
 from utils.constants import RED_ACCENT, GOLD_ACCENT, BLUE_ACCENT, GREEN_ACCENT, MAGENTA_ACCENT
-from .helpers import get_clans_by_type, format_th_requirement, get_league_emoji
+from .helpers import get_clans_by_type, get_clans_by_status, format_th_requirement, get_league_emoji
 from utils.emoji import emojis
 
 # League order for sorting
@@ -258,8 +258,7 @@ async def show_trial_clans(
 ):
     """Show trial clans"""
     # Get clans with status "Trial"
-    clans = await mongo.clans.find({"status": "Trial"}).to_list(length=None)
-    clans = [Clan(data=data) for data in clans]
+    clans = await get_clans_by_status(mongo, "Trial")
 
     # Fetch API data
     clan_api_data = {}
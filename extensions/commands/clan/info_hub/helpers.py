@@ -3,18 +3,13 @@
 from typing import List, Optional
 from utils.mongo import MongoClient
 from utils.classes import Clan
-from utils.emoji import emojis
+from utils import clan_registry
+from utils.emoji import league_emoji, th_emoji
 
 
 async def get_clans_by_type(mongo: MongoClient, clan_type: str) -> List[Clan]:
-    """Get all clans of a specific type from MongoDB"""
-    # Query for clans by type
-    clan_data = await mongo.clans.find({"type": clan_type}).to_list(length=None)
-
-    # Convert to Clan objects
-    clans = [Clan(data=data) for data in clan_data]
-
-    return clans
+    """Get all clans of a specific type from the clan registry"""
+    return await clan_registry.get_clans_by_type(mongo, clan_type)
 
 
 def format_th_requirement(th_level: Optional[int], th_attribute: Optional[str]) -> str:
@@ -22,12 +17,8 @@ def format_th_requirement(th_level: Optional[int], th_attribute: Optional[str])
     if not th_level:
         return "📋 TH Requirement: Not Set"
 
-    # Get the appropriate TH emoji
-    th_emoji_name = f"TH{th_level}"
-    th_emoji = getattr(emojis, th_emoji_name, "🏛️")
-
     # Format the requirement text
-    base_text = f"{th_emoji} TH{th_level}"
+    base_text = f"{th_emoji(th_level) or '🏛️'} TH{th_level}"
 
     if th_attribute:
         if th_attribute == "Max":
@@ -44,37 +35,14 @@ def format_th_requirement(th_level: Optional[int], th_attribute: Optional[str])
 
 def get_league_emoji(league_name: str) -> str:
     """Get the appropriate emoji for a league"""
-    league_emojis = {
-        "Champion League I": emojis.Champ1.partial_emoji,
-        "Champion League II": emojis.Champ2.partial_emoji,
-        "Champion League III": emojis.Champ3.partial_emoji,
-        "Master League I": emojis.Master1.partial_emoji,
-        "Master League II": emojis.Master2.partial_emoji,
-        "Master League III": emojis.Master3.partial_emoji,
-        "Crystal League I": emojis.Crystal1.partial_emoji,
-        "Crystal League II": emojis.Crystal2.partial_emoji,
-        "Crystal League III": emojis.Crystal3.partial_emoji,
-        "Gold League I": emojis.Gold1.partial_emoji,
-        "Gold League II": emojis.Gold2.partial_emoji,
-        "Gold League III": emojis.Gold3.partial_emoji,
-        "Silver League I": emojis.Silver1.partial_emoji,
-        "Silver League II": emojis.Silver2.partial_emoji,
-        "Silver League III": emojis.Silver3.partial_emoji,
-        "Bronze League I": "🥉",
-        "Bronze League II": "🥉",
-        "Bronze League III": "🥉",
-        "Unranked": "🏅"
-    }
-
-    return league_emojis.get(league_name, "🏅")
+    emoji = league_emoji(league_name)
+    if emoji:
+        return emoji.partial_emoji
+    if league_name and league_name.startswith("Bronze League"):
+        return "🥉"
+    return "🏅"
 
 
 async def get_clans_by_status(mongo: MongoClient, status: str) -> List[Clan]:
-    """Get all clans with a specific status from MongoDB"""
-    # Query for clans by status
-    clan_data = await mongo.clans.find({"status": status}).to_list(length=None)
-
-    # Convert to Clan objects
-    clans = [Clan(data=data) for data in clan_data]
-
-    return clans
\ No newline at end of file
+    """Get all clans with a specific status from the clan registry"""
+    return await clan_registry.get_clans_by_status(mongo, status)
\ No newline at end of file
@@ -9,6 +9,7 @@ from utils.mongo                import MongoClient
 from utils.classes              import Clan
 from utils.constants            import RED_ACCENT
 from utils.emoji                import emojis
+from utils.clan_registry        import get_clans, get_clans_by_tags
 
 from hikari.impl import (
     MessageActionRowBuilder         as ActionRow,
@@ -45,8 +46,7 @@ class ListCommand(
         mongo: MongoClient = lightbulb.di.INJECTED,
     ) -> None:
         await ctx.defer(ephemeral=True)
-        clan_data = await mongo.clans.find().to_list(length=None)
-        clans     = [Clan(data=d) for d in clan_data]
+        clans = await get_clans(mongo)
 
         # Sort clans by activity/points for consistent ordering
         clans = sorted(clans, key=lambda c: c.points or 0, reverse=True)
@@ -272,8 +272,7 @@ async def on_clan_show_more(
     user_id = stored_data.get("user_id")
 
     # Fetch clan data for remaining tags
-    clan_data = await mongo.clans.find({"tag": {"$in": remaining_tags}}).to_list(length=None)
-    remaining_clans = [Clan(data=d) for d in clan_data]
+    remaining_clans = await get_clans_by_tags(mongo, remaining_tags)
 
     # Sort by original order (already sorted by points)
     remaining_clans = sorted(
@@ -454,8 +453,7 @@ async def on_clan_back_to_list(
     user_id = stored_data.get("user_id")
 
     # Re-fetch and rebuild original dropdown view
-    clan_data = await mongo.clans.find().to_list(length=None)
-    clans = [Clan(data=d) for d in clan_data]
+    clans = await get_clans(mongo)
 
     # Sort clans by activity/points for consistent ordering
     clans = sorted(clans, key=lambda c: c.points or 0, reverse=True)
@@ -25,6 +25,8 @@ from extensions.components import register_action
 from utils.mongo import MongoClient
 from utils.classes import Clan
 from utils.constants import GREEN_ACCENT, RED_ACCENT
+from utils.user_cache import fetch_user
+from utils.points_events import publish_points_change
 
 from .helpers import get_clan_by_tag, LOG_CHANNEL
 
@@ -108,6 +110,7 @@ async def approve_points(
         {"tag": clan_tag},
         {"$inc": {"points": 1}}
     )
+    publish_points_change(clan_tag)
 
     # Update recruit count for DM recruitment
     if submission_type == "dm_recruit":
@@ -160,7 +163,7 @@ async def approve_points(
 
     # Send DM to user
     try:
-        user = await bot.rest.fetch_user(int(user_id))
+        user = await fetch_user(bot, int(user_id))
         dm_channel = await user.fetch_dm_channel()
 
         dm_components = [
@@ -373,7 +376,7 @@ async def confirm_denial(
 
     # Send DM to user
     try:
-        user = await bot.rest.fetch_user(int(user_id))
+        user = await fetch_user(bot, int(user_id))
         dm_channel = await user.fetch_dm_channel()
 
         dm_components = [
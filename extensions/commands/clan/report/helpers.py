@@ -10,6 +10,7 @@ from hikari.impl import SelectOptionBuilder as SelectOption
 
 from utils.mongo import MongoClient
 from utils.classes import Clan
+from utils.clan_registry import get_clans
 
 # Channel IDs
 APPROVAL_CHANNEL = 1348691451197784074
@@ -80,8 +81,7 @@ async def get_clan_by_tag(mongo: MongoClient, tag: str) -> Optional[Clan]:
 
 async def get_clan_options(mongo: MongoClient) -> List[SelectOption]:
     """Get clan options for select menu"""
-    clan_data = await mongo.clans.find().to_list(length=None)
-    clans = [Clan(data=data) for data in clan_data]
+    clans = await get_clans(mongo)
 
     # Use clans directly without sorting
     options = []
@@ -22,6 +22,7 @@ from extensions.components import register_action
 from utils.constants import RED_ACCENT, GREEN_ACCENT, GOLD_ACCENT
 from utils.mongo import MongoClient
 from utils.emoji import emojis
+from utils.points_events import publish_points_change
 from extensions.commands.clan.report.helpers import get_clan_by_tag, get_clan_options, create_progress_header
 
 # Add the loader for proper integration
@@ -391,6 +392,7 @@ async def process_refund(
             }
         }
     )
+    publish_points_change(clan_tag)
 
     # 2. Mark refund as processed
     recruit_update = await mongo.new_recruits.update_one(
@@ -29,6 +29,7 @@ from utils.mongo import MongoClient
 from utils.classes import Clan
 from utils.constants import BLUE_ACCENT, GREEN_ACCENT, RED_ACCENT, GOLD_ACCENT
 from utils.emoji import emojis
+from utils.points_events import publish_points_change
 
 from .helpers import get_clan_by_tag, get_clan_options, create_progress_header
 
@@ -454,6 +455,7 @@ async def rh_confirm_submission(
             {"tag": clan_tag},
             {"$inc": {"points": 1}}
         )
+        publish_points_change(clan_tag)
 
         # Update last post timestamp
         await mongo.clan_recruitment.update_one(
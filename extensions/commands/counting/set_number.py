@@ -6,6 +6,7 @@ Set the next expected number for the counting channel.
 import hikari
 import lightbulb
 from utils.mongo import MongoClient
+from extensions.events.message.counting_monitor import invalidate_counting_state
 from . import loader, counting
 
 @counting.register()
@@ -52,6 +53,7 @@ class SetNumber(
             },
             upsert=True
         )
+        await invalidate_counting_state(channel_id)
         
         await ctx.respond(
             f"✅ Counting channel configured! The next expected number is **{self.number}**",
@@ -6,6 +6,7 @@ Enable or disable the counting channel.
 import hikari
 import lightbulb
 from utils.mongo import MongoClient
+from extensions.events.message.counting_monitor import invalidate_counting_state
 from . import loader, counting
 
 @counting.register()
@@ -45,6 +46,7 @@ class Toggle(
             {"$set": {"enabled": self.enabled}},
             upsert=True
         )
+        await invalidate_counting_state(channel_id)
         
         status = "enabled" if self.enabled else "disabled"
         await ctx.respond(
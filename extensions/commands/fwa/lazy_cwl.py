@@ -12,15 +12,18 @@ import lightbulb
 import coc
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
-from extensions.commands.fwa import loader, fwa
+from extensions.commands.fwa import fwa
 from extensions.components import register_action
 from utils.mongo import MongoClient
 from utils.constants import RED_ACCENT, GOLD_ACCENT, BLUE_ACCENT, GREEN_ACCENT
 from utils.emoji import emojis
-from utils.classes import Clan
+from utils import bot_data
+from utils.recovery import recovery_step
+from utils.scheduler import scheduler, PERSISTENT, remove_job, needs_backfill, mark_backfilled
+from utils.clan_registry import as_clan, get_clan_docs
+from utils.metrics import request_timer
 
 from hikari.impl import (
     MessageActionRowBuilder as ActionRow,
@@ -33,8 +36,10 @@ from hikari.impl import (
     LinkButtonBuilder as LinkButton,
 )
 
+# Auto-ping jobs live in the shared persistent job store
+AUTOPING_BACKFILL = "lazycwl_autopings"
+
 # Global variables for auto-ping system
-scheduler: Optional[AsyncIOScheduler] = None
 bot_instance: Optional[hikari.GatewayBot] = None
 coc_client: Optional[coc.Client] = None
 mongo_client: Optional[MongoClient] = None
@@ -57,19 +62,20 @@ async def get_discord_ids(player_tags: List[str]) -> Dict[str, Optional[str]]:
     clean_tags = [tag.lstrip('#') for tag in player_tags]
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://api.clashk.ing/discord_links",
-                json=clean_tags,
-                headers={'Content-Type': 'application/json'}
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    # API returns with # prefix
-                    return result
-                else:
-                    print(f"ClashKing API error {response.status}: {await response.text()}")
-                    return {}
+        with request_timer("clashking", "discord_links"):
+            async with aiohttp.ClientSession() as session:
+                async with session.post(
+                    "https://api.clashk.ing/discord_links",
+                    json=clean_tags,
+                    headers={'Content-Type': 'application/json'}
+                ) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        # API returns with # prefix
+                        return result
+                    else:
+                        print(f"ClashKing API error {response.status}: {await response.text()}")
+                        return {}
     except Exception as e:
         print(f"ClashKing API request failed: {e}")
         return {}
@@ -90,8 +96,8 @@ async def create_clan_selector_components(fwa_clans: List[Dict], action_prefix:
 
     options = []
     for clan in fwa_clans:
-        # Use Clan class to properly handle emoji
-        c = Clan(data=clan)
+        # Shared Clan instance (parsed emoji is cached on it)
+        c = as_clan(clan)
 
         kwargs = {
             "label": c.name,
@@ -143,7 +149,7 @@ class LazyCwlSnapshot(
         await ctx.defer(ephemeral=True)
 
         # Get FWA clans from database
-        fwa_clans = await mongo.clans.find({"type": "FWA"}).to_list(length=None)
+        fwa_clans = await get_clan_docs(mongo, "FWA")
 
         if not fwa_clans:
             components = [
@@ -178,7 +184,7 @@ class LazyCwlSnapshot(
 
         # Add individual clan options
         for clan_data in fwa_clans:
-            clan = Clan(data=clan_data)
+            clan = as_clan(clan_data)
             kwargs = {
                 "label": clan.name,
                 "value": clan.tag,
@@ -1022,11 +1028,7 @@ async def process_single_snapshot_reset(
         # Cancel auto-ping if enabled
         autopings_cancelled = False
         if snapshot.get("auto_ping_enabled") and scheduler_instance:
-            try:
-                scheduler_instance.remove_job(f"autopings_{snapshot_id}")
-                autopings_cancelled = True
-            except Exception:
-                pass  # Job might not exist
+            autopings_cancelled = remove_job(f"autopings_{snapshot_id}")
 
         # Deactivate snapshot
         result = await mongo.lazy_cwl_snapshots.update_one(
@@ -1075,7 +1077,7 @@ async def handle_snapshot_select(
     try:
         if selection == "ALL":
             # Process all FWA clans
-            fwa_clans = await mongo.clans.find({"type": "FWA"}).to_list(length=None)
+            fwa_clans = await get_clan_docs(mongo, "FWA")
 
             if not fwa_clans:
                 components = [
@@ -1093,7 +1095,7 @@ async def handle_snapshot_select(
             # Process each clan
             results = []
             for clan_data in fwa_clans:
-                clan = Clan(data=clan_data)
+                clan = as_clan(clan_data)
                 result = await process_single_clan_snapshot(clan.tag, user_id, bot, coc_client, mongo)
                 results.append(result)
 
@@ -1331,9 +1333,14 @@ async def auto_ping_job(snapshot_id: str):
     Periodic job to check and ping missing players automatically.
     Runs at configured interval until 7 days elapsed or snapshot reset.
     """
-    global bot_instance, coc_client, mongo_client, scheduler
+    global bot_instance, coc_client, mongo_client
 
-    if not all([bot_instance, coc_client, mongo_client, scheduler]):
+    # Persisted jobs can fire before on_bot_started has stored the clients
+    bot_instance = bot_instance or bot_data.data.get("bot")
+    coc_client = coc_client or bot_data.data.get("coc_client")
+    mongo_client = mongo_client or bot_data.data.get("mongo")
+
+    if not all([bot_instance, coc_client, mongo_client]):
         print(f"[LazyCWL AutoPing] ERROR: Missing required clients for job {snapshot_id}")
         return
 
@@ -1343,19 +1350,13 @@ async def auto_ping_job(snapshot_id: str):
 
         if not snapshot:
             print(f"[LazyCWL AutoPing] Snapshot {snapshot_id} not found, cancelling job")
-            try:
-                scheduler.remove_job(f"autopings_{snapshot_id}")
-            except:
-                pass
+            remove_job(f"autopings_{snapshot_id}")
             return
 
         # Check if still active and enabled
         if not snapshot.get("active") or not snapshot.get("auto_ping_enabled"):
             print(f"[LazyCWL AutoPing] Snapshot {snapshot_id} no longer active/enabled, cancelling job")
-            try:
-                scheduler.remove_job(f"autopings_{snapshot_id}")
-            except:
-                pass
+            remove_job(f"autopings_{snapshot_id}")
             return
 
         # Check 7-day limit
@@ -1381,10 +1382,7 @@ async def auto_ping_job(snapshot_id: str):
                 )
 
                 # Cancel job
-                try:
-                    scheduler.remove_job(f"autopings_{snapshot_id}")
-                except:
-                    pass
+                remove_job(f"autopings_{snapshot_id}")
 
                 # Send expiry notification to clan channel
                 try:
@@ -1446,75 +1444,45 @@ async def auto_ping_job(snapshot_id: str):
         traceback.print_exc()
 
 
-async def restore_autopings():
-    """Restore auto-ping jobs on bot restart."""
-    global mongo_client, scheduler
+def schedule_autoping_job(snapshot_id: str, interval_minutes: int) -> None:
+    """Persist the recurring auto-ping job for a snapshot"""
+    scheduler.add_job(
+        auto_ping_job,
+        trigger=IntervalTrigger(minutes=interval_minutes),
+        args=[snapshot_id],
+        id=f"autopings_{snapshot_id}",
+        jobstore=PERSISTENT,
+        replace_existing=True,
+        max_instances=1
+    )
+
 
-    if not mongo_client or not scheduler:
-        print("[LazyCWL AutoPing] Cannot restore: missing clients")
+async def backfill_autopings():
+    """Schedule auto-pings enabled before jobs were persisted (runs once)."""
+    if not mongo_client or not await needs_backfill(mongo_client, AUTOPING_BACKFILL):
         return
 
     try:
-        # Find all snapshots with auto-ping enabled
         snapshots = await mongo_client.lazy_cwl_snapshots.find({
             "auto_ping_enabled": True
         }).to_list(length=None)
 
-        if not snapshots:
-            print("[LazyCWL AutoPing] No active auto-pings to restore")
-            return
-
-        now = datetime.now(timezone.utc)
         restored = 0
-        expired = 0
-
         for snapshot in snapshots:
             snapshot_id = snapshot["_id"]
-            started_at = snapshot.get("auto_ping_started_at")
-
-            if not started_at:
+            if scheduler.get_job(f"autopings_{snapshot_id}"):
                 continue
 
-            if started_at.tzinfo is None:
-                started_at = started_at.replace(tzinfo=timezone.utc)
-
-            elapsed = now - started_at
-
-            # Check if expired during downtime
-            if elapsed > timedelta(days=7):
-                print(f"[LazyCWL AutoPing] Snapshot {snapshot['clan_name']} expired during downtime, disabling")
-                await mongo_client.lazy_cwl_snapshots.update_one(
-                    {"_id": snapshot_id},
-                    {"$set": {"auto_ping_enabled": False}}
-                )
-                expired += 1
-                continue
-
-            # Restore job
+            # Expiry is enforced by auto_ping_job on its first run
             interval_minutes = snapshot.get("auto_ping_interval_minutes", 60)
+            schedule_autoping_job(snapshot_id, interval_minutes)
+            restored += 1
 
-            try:
-                scheduler.add_job(
-                    auto_ping_job,
-                    trigger=IntervalTrigger(minutes=interval_minutes),
-                    args=[snapshot_id],
-                    id=f"autopings_{snapshot_id}",
-                    replace_existing=True,
-                    max_instances=1
-                )
-
-                print(f"[LazyCWL AutoPing] Restored auto-ping for {snapshot['clan_name']} (interval: {interval_minutes}min)")
-                restored += 1
-            except Exception as e:
-                print(f"[LazyCWL AutoPing] Failed to restore job for {snapshot['clan_name']}: {e}")
-
-        if restored > 0:
-            print(f"[LazyCWL AutoPing] Restored {restored} auto-ping job(s)")
-        if expired > 0:
-            print(f"[LazyCWL AutoPing] Disabled {expired} expired auto-ping(s)")
+        await mark_backfilled(mongo_client, AUTOPING_BACKFILL)
+        print(f"[LazyCWL AutoPing] Backfilled {restored} auto-ping job(s)")
 
     except Exception as e:
-        print(f"[LazyCWL AutoPing] Error restoring auto-pings: {e}")
+        print(f"[LazyCWL AutoPing] Error backfilling auto-pings: {e}")
         import traceback
         traceback.print_exc()
 
@@ -1748,7 +1716,6 @@ async def handle_reset_select(
     **kwargs
 ) -> None:
     """Handle snapshot selection for reset."""
-    global scheduler
     selection = ctx.interaction.values[0]
 
     try:
@@ -1874,24 +1841,17 @@ async def handle_confirm_reset(
     **kwargs
 ) -> None:
     """Handle confirmation of snapshot reset."""
-    global scheduler
-
     try:
         # First, cancel any active auto-ping jobs
         autopings_cancelled = 0
-        if scheduler:
-            snapshots_with_autopings = await mongo.lazy_cwl_snapshots.find({
-                "active": True,
-                "auto_ping_enabled": True
-            }).to_list(length=None)
-
-            for snapshot in snapshots_with_autopings:
-                snapshot_id = snapshot["_id"]
-                try:
-                    scheduler.remove_job(f"autopings_{snapshot_id}")
-                    autopings_cancelled += 1
-                except Exception:
-                    pass  # Job might not exist
+        snapshots_with_autopings = await mongo.lazy_cwl_snapshots.find({
+            "active": True,
+            "auto_ping_enabled": True
+        }).to_list(length=None)
+
+        for snapshot in snapshots_with_autopings:
+            if remove_job(f"autopings_{snapshot['_id']}"):
+                autopings_cancelled += 1
 
         # Deactivate all active snapshots
         result = await mongo.lazy_cwl_snapshots.update_many(
@@ -2049,14 +2009,9 @@ async def handle_autopings_select_interval(
     **kwargs
 ) -> None:
     """Handle interval selection and start auto-ping job."""
-    global scheduler
-
     interval_minutes = int(ctx.interaction.values[0])
 
     try:
-        if not scheduler:
-            raise Exception("Scheduler not initialized")
-
         # Fetch snapshot
         snapshot = await mongo.lazy_cwl_snapshots.find_one({"_id": snapshot_id})
         if not snapshot:
@@ -2085,15 +2040,8 @@ async def handle_autopings_select_interval(
             }
         )
 
-        # Create APScheduler job
-        scheduler.add_job(
-            auto_ping_job,
-            trigger=IntervalTrigger(minutes=interval_minutes),
-            args=[snapshot_id],
-            id=f"autopings_{snapshot_id}",
-            replace_existing=True,
-            max_instances=1
-        )
+        # Create persistent scheduler job
+        schedule_autoping_job(snapshot_id, interval_minutes)
 
         print(f"[LazyCWL AutoPing] Started auto-ping for {snapshot['clan_name']} (interval: {interval_minutes}min)")
 
@@ -2145,7 +2093,6 @@ async def handle_autopings_stop_select(
     **kwargs
 ) -> None:
     """Handle snapshot selection to stop auto-ping."""
-    global scheduler
 
     snapshot_id = ctx.interaction.values[0]
 
@@ -2166,12 +2113,10 @@ async def handle_autopings_stop_select(
         )
 
         # Cancel APScheduler job
-        if scheduler:
-            try:
-                scheduler.remove_job(f"autopings_{snapshot_id}")
-                print(f"[LazyCWL AutoPing] Stopped auto-ping for {snapshot['clan_name']}")
-            except Exception as e:
-                print(f"[LazyCWL AutoPing] Job not found or already removed: {e}")
+        if remove_job(f"autopings_{snapshot_id}"):
+            print(f"[LazyCWL AutoPing] Stopped auto-ping for {snapshot['clan_name']}")
+        else:
+            print(f"[LazyCWL AutoPing] Job for {snapshot_id} not found or already removed")
 
         # Success response
         ping_count = snapshot.get("auto_ping_count", 0)
@@ -2686,29 +2631,15 @@ async def handle_remove_player_cancel(ctx, action_id: str, **kwargs) -> None:
     await ctx.interaction.edit_initial_response(components=components)
 
 
-@loader.listener(hikari.StartedEvent)
-@lightbulb.di.with_di
-async def on_bot_started(
-    event: hikari.StartedEvent,
-    bot: hikari.GatewayBot = lightbulb.di.INJECTED,
-    coc_api: coc.Client = lightbulb.di.INJECTED,
-    mongo: MongoClient = lightbulb.di.INJECTED,
-):
-    """Initialize scheduler and restore auto-ping jobs on bot startup."""
-    global bot_instance, coc_client, mongo_client, scheduler
+@recovery_step("lazy_cwl_autopings")
+async def on_bot_started() -> None:
+    """Store clients for auto-ping jobs and backfill legacy jobs on bot startup."""
+    global bot_instance, coc_client, mongo_client
 
     # Store clients globally for auto_ping_job access
-    bot_instance = bot
-    coc_client = coc_api
-    mongo_client = mongo
-
-    # Initialize APScheduler only if not already initialized
-    if scheduler is None:
-        scheduler = AsyncIOScheduler(timezone="UTC")
-        scheduler.start()
-        print("[LazyCWL AutoPing] Scheduler initialized")
-
-        # Restore any active auto-ping jobs from MongoDB
-        await restore_autopings()
-    else:
-        print("[LazyCWL AutoPing] Scheduler already initialized, skipping")
\ No newline at end of file
+    bot_instance = bot_data.data["bot"]
+    coc_client = bot_data.data["coc_client"]
+    mongo_client = bot_data.data["mongo"]
+
+    # Persisted jobs restore themselves; only pre-existing auto-pings need scheduling
+    await backfill_autopings()
\ No newline at end of file
@@ -11,8 +11,8 @@ from typing import List
 from extensions.commands.fwa import fwa
 from extensions.components import register_action
 from utils.mongo import MongoClient
-from utils.classes import Clan
 from utils.constants import GOLD_ACCENT
+from utils.clan_registry import as_clan, get_clan_docs
 
 from hikari.impl import (
     MessageActionRowBuilder as ActionRow,
@@ -117,7 +117,7 @@ async def on_verify_win(
     ctx = kwargs.get("ctx")
     
     # Get all FWA clans
-    fwa_clans = await mongo.clans.find({"type": "FWA"}).to_list(length=None)
+    fwa_clans = await get_clan_docs(mongo, "FWA")
     
     if not fwa_clans:
         await ctx.respond("❌ No FWA clans found in the database.", ephemeral=True)
@@ -139,7 +139,7 @@ async def on_verify_win(
         row = ActionRow()
         for j in range(5):
             if i + j < len(fwa_clans) and i + j < 25:
-                clan_obj = Clan(data=fwa_clans[i + j])
+                clan_obj = as_clan(fwa_clans[i + j])
                 clan_tag = clan_obj.tag.lstrip("#")
                 row.add_component(
                     LinkButton(
@@ -171,7 +171,7 @@ async def on_war_weights(
     ctx = kwargs.get("ctx")
     
     # Get all FWA clans
-    fwa_clans = await mongo.clans.find({"type": "FWA"}).to_list(length=None)
+    fwa_clans = await get_clan_docs(mongo, "FWA")
     
     if not fwa_clans:
         await ctx.respond("❌ No FWA clans found in the database.", ephemeral=True)
@@ -193,7 +193,7 @@ async def on_war_weights(
         row = ActionRow()
         for j in range(5):
             if i + j < len(fwa_clans) and i + j < 25:
-                clan_obj = Clan(data=fwa_clans[i + j])
+                clan_obj = as_clan(fwa_clans[i + j])
                 clan_tag = clan_obj.tag.lstrip("#")
                 row.add_component(
                     LinkButton(
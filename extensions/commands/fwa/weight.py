@@ -3,7 +3,7 @@ import hikari
 
 from extensions.commands.fwa import fwa
 from utils.constants import BLUE_ACCENT, GOLD_ACCENT, GREEN_ACCENT, RED_ACCENT
-from utils.emoji import emojis
+from utils.emoji import th_emoji
 
 from hikari.impl import (
     ContainerComponentBuilder as Container,
@@ -59,10 +59,8 @@ def get_th_emoji(th_level: int) -> str:
     if th_level is None:
         return "❓"
 
-    emoji_attr = f"TH{th_level}"
-    if hasattr(emojis, emoji_attr):
-        return str(getattr(emojis, emoji_attr))
-    return "🏛️"
+    emoji = th_emoji(th_level)
+    return str(emoji) if emoji else "🏛️"
 
 
 def calculate_position_in_range(weight: int, th_level: int) -> int:
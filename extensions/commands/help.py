@@ -4,9 +4,7 @@ Integrated help command with AI support using Anthropic Claude.
 Lists all bot commands and provides an AI assistant for questions.
 """
 
-import os
 import asyncio
-import aiohttp
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
@@ -31,12 +29,11 @@ from extensions.components import register_action
 from utils.constants import BLUE_ACCENT, GREEN_ACCENT, RED_ACCENT, GOLD_ACCENT
 from utils.mongo import MongoClient
 from utils.emoji import emojis
+from utils import ai_client
 
 loader = lightbulb.Loader()
 
 # AI Configuration
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
-ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
 AI_MODEL = "claude-3-haiku-20240307"
 MAX_TOKENS = 1500
 
@@ -235,16 +232,8 @@ async def create_category_view(category: str) -> list:
     return [Container(accent_color=BLUE_ACCENT, components=components)]
 
 
-async def call_claude_api(user_question: str) -> str:
-    """Call Claude API for help with bot commands."""
-
-    # Special response for Fayez
-    if "fayez" in user_question.lower():
-        return "https://c.tenor.com/-lFxNI2gjGwAAAAd/tenor.gif"
-
-    if not ANTHROPIC_API_KEY:
-        return "❌ Oops! The AI helper isn't set up yet. Please ask a staff member for help!"
-
+def build_system_prompt() -> str:
+    """AI helper system prompt, including every command in COMMAND_LIST"""
     # Create bot context from command list
     bot_context = "Here are all the bot commands I can help you with:\n\n"
     for category, commands in COMMAND_LIST.items():
@@ -254,7 +243,7 @@ async def call_claude_api(user_question: str) -> str:
             bot_context += f"  • {cmd_name}\n    → {cmd_desc}\n"
         bot_context += "\n"
 
-    system_prompt = f"""You are a friendly Discord bot helper for the Arcane Python bot used by the Kings Alliance Clash of Clans community! You help people use bot commands in simple, easy-to-understand ways with special expertise in the recruitment system.
+    return f"""You are a friendly Discord bot helper for the Arcane Python bot used by the Kings Alliance Clash of Clans community! You help people use bot commands in simple, easy-to-understand ways with special expertise in the recruitment system.
 
 {bot_context}
 
@@ -336,34 +325,38 @@ SPECIAL FOCUS: When users ask about LazyCWL, CWL tracking, or tracking players d
 
 Remember: Make it so easy that anyone can understand, especially the recruitment system! 🌟"""
 
-    headers = {
-        "x-api-key": ANTHROPIC_API_KEY,
-        "anthropic-version": "2023-06-01",
-        "content-type": "application/json"
-    }
 
-    payload = {
-        "model": AI_MODEL,
-        "max_tokens": MAX_TOKENS,
-        "messages": [
-            {
-                "role": "user",
-                "content": user_question
-            }
-        ],
-        "system": system_prompt
-    }
+# The command list is static, so the prompt is built once at import
+HELP_SYSTEM_PROMPT = build_system_prompt()
+
+# Same question (ignoring spacing) within this window reuses the earlier answer
+RESPONSE_CACHE_TTL = 6 * 3600  # seconds
+
+
+async def call_claude_api(user_question: str) -> str:
+    """Call Claude API for help with bot commands."""
+
+    # Special response for Fayez
+    if "fayez" in user_question.lower():
+        return "https://c.tenor.com/-lFxNI2gjGwAAAAd/tenor.gif"
+
+    if not ai_client.is_configured():
+        return "❌ Oops! The AI helper isn't set up yet. Please ask a staff member for help!"
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(ANTHROPIC_API_URL, headers=headers, json=payload) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result["content"][0]["text"]
-                else:
-                    error_text = await response.text()
-                    print(f"[Help AI] API error {response.status}: {error_text}")
-                    return "❌ Oops! Something went wrong. Try asking your question in a different way!"
+        return await ai_client.create_message(
+            HELP_SYSTEM_PROMPT,
+            [{"role": "user", "content": " ".join(user_question.split())}],
+            model=AI_MODEL,
+            max_tokens=MAX_TOKENS,
+            ttl=RESPONSE_CACHE_TTL,
+            tag="help"
+        )
+    except ai_client.AIRequestError as e:
+        print(f"[Help AI] Error calling Claude API: {e}")
+        if e.status is not None:
+            return "❌ Oops! Something went wrong. Try asking your question in a different way!"
+        return "❌ The AI helper is taking a break! Please try again in a moment."
     except Exception as e:
         print(f"[Help AI] Error calling Claude API: {e}")
         return "❌ The AI helper is taking a break! Please try again in a moment."
@@ -12,6 +12,7 @@ from typing import Optional
 
 from extensions.commands.player import loader, player
 from utils.constants import GREEN_ACCENT, RED_ACCENT, GOLD_ACCENT
+from utils.metrics import request_timer
 
 from hikari.impl import (
     ContainerComponentBuilder as Container,
@@ -39,19 +40,20 @@ async def get_discord_id_for_player(player_tag: str) -> Optional[str]:
     clean_tag = player_tag.lstrip('#')
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://api.clashk.ing/discord_links",
-                json=[clean_tag],  # API expects array of tags
-                headers={'Content-Type': 'application/json'}
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    # API returns dict with # prefix: {#TAG: discord_id or None}
-                    return result.get(player_tag)
-                else:
-                    print(f"ClashKing API error {response.status}: {await response.text()}")
-                    return None
+        with request_timer("clashking", "discord_links"):
+            async with aiohttp.ClientSession() as session:
+                async with session.post(
+                    "https://api.clashk.ing/discord_links",
+                    json=[clean_tag],  # API expects array of tags
+                    headers={'Content-Type': 'application/json'}
+                ) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        # API returns dict with # prefix: {#TAG: discord_id or None}
+                        return result.get(player_tag)
+                    else:
+                        print(f"ClashKing API error {response.status}: {await response.text()}")
+                        return None
     except Exception as e:
         print(f"ClashKing API request failed: {e}")
         return None
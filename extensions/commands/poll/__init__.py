@@ -1,23 +1,18 @@
 # extensions/commands/poll/__init__.py
 import lightbulb
-import hikari
-import asyncio
 from datetime import datetime, timezone
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.date import DateTrigger
 from utils.mongo import MongoClient
 from utils import bot_data
+from utils.recovery import recovery_step, CRITICAL
+from utils.scheduler import scheduler, PERSISTENT, needs_backfill, mark_backfilled
 from extensions.components import register_action
 
 loader = lightbulb.Loader()
 poll = lightbulb.Group("poll", "Create and manage polls")
 
-# Initialize scheduler
-scheduler = AsyncIOScheduler(timezone="UTC")
-scheduler.start()
-
-# Flag to track if recovery has already run
-_recovery_completed = False
+# Poll end jobs live in the shared persistent job store
+POLL_BACKFILL = "poll_end_jobs"
 
 # Import submodules to register commands
 from . import create
@@ -40,6 +35,10 @@ async def end_poll(poll_id: str, guild_id: str, channel_id: str, message_id: str
             print(f"[Poll] Failed to end poll {poll_id}: Bot or MongoDB not available")
             return
         
+        # Stop any pending live re-render
+        from .handlers import cancel_poll_render
+        cancel_poll_render(poll_id)
+
         # Update poll status in database
         await mongo.discord_polls.update_one(
             {"_id": poll_id},
@@ -169,63 +168,53 @@ async def end_poll(poll_id: str, guild_id: str, channel_id: str, message_id: str
     except Exception as e:
         print(f"[Poll] Error ending poll {poll_id}: {e}")
 
-# Startup recovery function
-@loader.listener(hikari.StartedEvent)
-async def recover_active_polls(event: hikari.StartedEvent):
-    """Recover active polls after bot restart"""
-    global _recovery_completed
-    
-    # Prevent multiple recovery runs
-    if _recovery_completed:
-        return
-    _recovery_completed = True
-    
-    await asyncio.sleep(5)  # Wait for bot to fully initialize
-    
+def schedule_poll_end(poll_id: str, guild_id: str, channel_id: str, message_id: str, ends_at: datetime):
+    """Persist the job that ends a poll, so it survives restarts"""
+    scheduler.add_job(
+        end_poll,
+        trigger=DateTrigger(run_date=ends_at),
+        args=[poll_id, guild_id, channel_id, message_id],
+        id=f"poll_end_{poll_id}",
+        jobstore=PERSISTENT,
+        replace_existing=True
+    )
+
+
+# One-time backfill for polls created before end jobs were persisted
+@recovery_step("poll_backfill", priority=CRITICAL)
+async def backfill_poll_jobs() -> None:
+    """Schedule end jobs for active polls that predate the persistent job store"""
     mongo = bot_data.data.get("mongo")
-    if not mongo:
-        print("[Poll] MongoDB not available for poll recovery")
+    if not mongo or not await needs_backfill(mongo, POLL_BACKFILL):
         return
-    
-    print("[Poll] Starting poll recovery...")
-    
-    # Find all active polls
+
+    print("[Poll] Backfilling end jobs for legacy polls...")
+
     active_polls = await mongo.discord_polls.find({
         "active": True
     }).to_list(length=None)
-    
-    now = datetime.now(timezone.utc)
-    recovered = 0
-    expired = 0
-    
+
+    scheduled = 0
     for poll_data in active_polls:
         poll_id = poll_data["_id"]
+        if scheduler.get_job(f"poll_end_{poll_id}"):
+            continue
+
         ends_at = poll_data["ends_at"]
-        
-        # Ensure ends_at is timezone-aware
         if ends_at.tzinfo is None:
             ends_at = ends_at.replace(tzinfo=timezone.utc)
-        
-        if ends_at <= now:
-            # Poll expired while bot was down
-            await end_poll(
-                poll_id,
-                poll_data["guild_id"],
-                poll_data["channel_id"],
-                poll_data["message_id"]
-            )
-            expired += 1
-        else:
-            # Reschedule poll end
-            scheduler.add_job(
-                end_poll,
-                trigger=DateTrigger(run_date=ends_at),
-                args=[poll_id, poll_data["guild_id"], poll_data["channel_id"], poll_data["message_id"]],
-                id=f"poll_end_{poll_id}",
-                replace_existing=True
-            )
-            recovered += 1
-    
-    print(f"[Poll] Recovery complete: {recovered} polls rescheduled, {expired} polls marked as expired")
 
-__all__ = ["loader", "poll", "scheduler", "end_poll"]
\ No newline at end of file
+        # Past end times simply fire as soon as the scheduler resumes
+        schedule_poll_end(
+            poll_id,
+            poll_data["guild_id"],
+            poll_data["channel_id"],
+            poll_data["message_id"],
+            ends_at
+        )
+        scheduled += 1
+
+    await mark_backfilled(mongo, POLL_BACKFILL)
+    print(f"[Poll] Backfill complete: {scheduled} poll end job(s) scheduled")
+
+__all__ = ["loader", "poll", "scheduler", "end_poll", "schedule_poll_end"]
\ No newline at end of file
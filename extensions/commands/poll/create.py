@@ -12,7 +12,7 @@ from typing import Optional
 from utils.mongo import MongoClient
 from utils.constants import BLUE_ACCENT, GOLD_ACCENT, GREEN_ACCENT, MAGENTA_ACCENT
 from extensions.components import register_action
-from . import loader, poll, scheduler
+from . import loader, poll
 
 from hikari.impl import (
     ContainerComponentBuilder as Container,
@@ -26,7 +26,6 @@ from hikari.impl import (
     MediaGalleryItemBuilder as MediaItem,
 )
 
-from apscheduler.triggers.date import DateTrigger
 
 # Duration choices
 DURATION_CHOICES = [
@@ -294,6 +293,8 @@ async def handle_poll_modal(
         "description": values["description"],
         "options": options,
         "votes": {},  # user_id: option_id
+        "vote_counts": {str(opt["id"]): 0 for opt in options},  # option_id: count
+        "recent_voters": [],  # most recent {user_id, option_id} entries
         "active": True,
         "ended_reason": None
     }
@@ -301,14 +302,8 @@ async def handle_poll_modal(
     await mongo.discord_polls.insert_one(poll_doc)
     
     # Schedule poll end
-    from . import end_poll as poll_end_func
-    scheduler.add_job(
-        poll_end_func,
-        trigger=DateTrigger(run_date=ends_at),
-        args=[poll_id, poll_data["guild_id"], poll_data["channel_id"], str(message.id)],
-        id=f"poll_end_{poll_id}",
-        replace_existing=True
-    )
+    from . import schedule_poll_end
+    schedule_poll_end(poll_id, poll_data["guild_id"], poll_data["channel_id"], str(message.id), ends_at)
     
     # Clean up button store
     await mongo.button_store.delete_one({"_id": action_id})
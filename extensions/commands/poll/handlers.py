@@ -3,15 +3,18 @@
 Button handlers for poll voting and management.
 """
 
+import asyncio
 import hikari
 import lightbulb
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, List, Set
+from pymongo import ReturnDocument
 
 from utils.mongo import MongoClient
 from utils.constants import BLUE_ACCENT, GREEN_ACCENT, GOLD_ACCENT
 from extensions.components import register_action
-from . import scheduler
+from utils import bot_data
+from utils.scheduler import remove_job
 
 from hikari.impl import (
     ContainerComponentBuilder as Container,
@@ -24,6 +27,15 @@ from hikari.impl import (
     MediaGalleryItemBuilder as MediaItem,
 )
 
+# Live rendering: at most one message edit per poll every POLL_RENDER_INTERVAL seconds
+POLL_RENDER_INTERVAL = 3
+# Number of most recent votes kept on the poll document for the "recent voters" line
+RECENT_VOTERS_LIMIT = 30
+
+_render_tasks: Dict[str, asyncio.Task] = {}
+_dirty_polls: Set[str] = set()
+_last_render: Dict[str, float] = {}
+
 def create_progress_bar(percentage: float, length: int = 20) -> str:
     """Create a visual progress bar with gradient effect"""
     filled = int(percentage / 100 * length)
@@ -72,6 +84,93 @@ def calculate_percentages(votes: Dict[str, int], options: List[dict]) -> Dict[in
     
     return results
 
+def calculate_percentages_from_counts(vote_counts: Dict[str, int], options: List[dict]) -> Dict[int, tuple]:
+    """Calculate percentages from the maintained per-option counters"""
+    counts = {opt["id"]: max(0, vote_counts.get(str(opt["id"]), 0)) for opt in options}
+    total_votes = sum(counts.values())
+
+    results = {}
+    for option_id, count in counts.items():
+        percentage = (count / total_votes) * 100 if total_votes > 0 else 0
+        results[option_id] = (count, percentage)
+
+    return results
+
+async def ensure_vote_counts(mongo: MongoClient, poll_id: str) -> None:
+    """Backfill vote_counts/recent_voters for polls created before counters existed"""
+    # Counted on the server from the votes map as it is at write time, so a vote
+    # recorded between reading and writing can't be left out of the counters
+    votes = {"$objectToArray": {"$ifNull": ["$votes", {}]}}
+    await mongo.discord_polls.update_one(
+        {"_id": poll_id, "vote_counts": {"$exists": False}},
+        [{"$set": {
+            "vote_counts": {"$arrayToObject": {"$map": {
+                "input": "$options",
+                "as": "option",
+                "in": {
+                    "k": {"$toString": "$$option.id"},
+                    "v": {"$size": {"$filter": {
+                        "input": votes,
+                        "as": "vote",
+                        "cond": {"$eq": ["$$vote.v", "$$option.id"]}
+                    }}}
+                }
+            }}},
+            "recent_voters": {"$map": {
+                "input": {"$slice": [votes, -RECENT_VOTERS_LIMIT]},
+                "as": "vote",
+                "in": {"user_id": "$$vote.k", "option_id": "$$vote.v"}
+            }}
+        }}]
+    )
+
+def schedule_poll_render(poll_id: str) -> None:
+    """Mark a poll as changed; votes within the render window are coalesced into one edit"""
+    _dirty_polls.add(poll_id)
+
+    task = _render_tasks.get(poll_id)
+    if task and not task.done():
+        return
+
+    _render_tasks[poll_id] = asyncio.create_task(_render_poll_loop(poll_id))
+
+def cancel_poll_render(poll_id: str) -> None:
+    """Stop pending live renders (used when a poll ends)"""
+    _dirty_polls.discard(poll_id)
+    _last_render.pop(poll_id, None)
+    task = _render_tasks.pop(poll_id, None)
+    if task and not task.done() and task is not asyncio.current_task():
+        task.cancel()
+
+async def _render_poll_loop(poll_id: str) -> None:
+    """Render a poll while it keeps receiving votes, no more often than POLL_RENDER_INTERVAL"""
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            wait = POLL_RENDER_INTERVAL - (loop.time() - _last_render.get(poll_id, float("-inf")))
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            _dirty_polls.discard(poll_id)
+
+            bot = bot_data.data.get("bot")
+            mongo = bot_data.data.get("mongo")
+            if not bot or not mongo:
+                return
+
+            poll_data = await mongo.discord_polls.find_one({"_id": poll_id}, {"votes": 0})
+            if not poll_data or not poll_data.get("active"):
+                return
+
+            await update_poll_message(bot, mongo, poll_data)
+            _last_render[poll_id] = loop.time()
+
+            if poll_id not in _dirty_polls:
+                return
+    finally:
+        if _render_tasks.get(poll_id) is asyncio.current_task():
+            _render_tasks.pop(poll_id, None)
+
 async def update_poll_message(
     bot: hikari.GatewayBot,
     mongo: MongoClient,
@@ -79,9 +178,14 @@ async def update_poll_message(
 ) -> None:
     """Update the poll message with new vote counts"""
     try:
-        # Calculate results
-        results = calculate_percentages(poll_data["votes"], poll_data["options"])
-        total_votes = len(poll_data["votes"])
+        # Calculate results from the maintained counters
+        results = calculate_percentages_from_counts(poll_data.get("vote_counts", {}), poll_data["options"])
+        total_votes = sum(count for count, _ in results.values())
+
+        # Latest vote per user, most recent first
+        latest_votes = {}
+        for entry in reversed(poll_data.get("recent_voters", [])):
+            latest_votes.setdefault(entry["user_id"], entry["option_id"])
         
         # Get emojis from poll data
         emojis = ["🥇", "🥈", "🥉"]
@@ -123,7 +227,7 @@ async def update_poll_message(
             
             # Get recent voters (last 3)
             recent_voters = []
-            for user_id, vote_id in list(poll_data["votes"].items())[-10:]:
+            for user_id, vote_id in latest_votes.items():
                 if vote_id == option["id"] and len(recent_voters) < 3:
                     recent_voters.append(f"<@{user_id}>")
             
@@ -221,37 +325,51 @@ async def handle_poll_vote(
     poll_id, option_id = parts[0], int(parts[1])
     user_id = str(ctx.interaction.user.id)
     
-    # Get poll data
-    poll_data = await mongo.discord_polls.find_one({"_id": poll_id})
+    # Record the vote atomically and get back only this user's previous vote
+    poll_data = await mongo.discord_polls.find_one_and_update(
+        {"_id": poll_id, "active": True, "options.id": option_id},
+        {"$set": {f"votes.{user_id}": option_id}},
+        projection={f"votes.{user_id}": 1, "options": 1, "vote_counts": 1},
+        return_document=ReturnDocument.BEFORE
+    )
     
     if not poll_data:
-        await ctx.respond("❌ Poll not found", ephemeral=True)
-        return
-    
-    if not poll_data["active"]:
-        await ctx.respond("❌ This poll has ended", ephemeral=True)
-        return
-    
-    # Check if option exists
-    valid_options = [opt["id"] for opt in poll_data["options"]]
-    if option_id not in valid_options:
-        await ctx.respond("❌ Invalid option", ephemeral=True)
+        existing = await mongo.discord_polls.find_one({"_id": poll_id}, {"active": 1})
+        if not existing:
+            await ctx.respond("❌ Poll not found", ephemeral=True)
+        elif not existing["active"]:
+            await ctx.respond("❌ This poll has ended", ephemeral=True)
+        else:
+            await ctx.respond("❌ Invalid option", ephemeral=True)
         return
     
     # Get previous vote
-    previous_vote = poll_data["votes"].get(user_id)
+    previous_vote = poll_data.get("votes", {}).get(user_id)
     
-    # Update vote
-    poll_data["votes"][user_id] = option_id
-    
-    # Save to database
-    await mongo.discord_polls.update_one(
-        {"_id": poll_id},
-        {"$set": {f"votes.{user_id}": option_id}}
-    )
+    if "vote_counts" not in poll_data:
+        # Poll predates counters - rebuild them from the votes map once
+        await ensure_vote_counts(mongo, poll_id)
+    elif previous_vote != option_id:
+        counter_update = {f"vote_counts.{option_id}": 1}
+        if previous_vote is not None:
+            counter_update[f"vote_counts.{previous_vote}"] = -1
+        
+        await mongo.discord_polls.update_one(
+            {"_id": poll_id},
+            {
+                "$inc": counter_update,
+                "$push": {
+                    "recent_voters": {
+                        "$each": [{"user_id": user_id, "option_id": option_id}],
+                        "$slice": -RECENT_VOTERS_LIMIT
+                    }
+                }
+            }
+        )
     
-    # Update the poll message
-    await update_poll_message(bot, mongo, poll_data)
+    # Coalesce message edits instead of editing on every click
+    if previous_vote != option_id:
+        schedule_poll_render(poll_id)
     
     # Respond to user
     option = next(opt for opt in poll_data["options"] if opt["id"] == option_id)
@@ -297,10 +415,7 @@ async def handle_poll_end(
         return
     
     # Cancel scheduled job
-    try:
-        scheduler.remove_job(f"poll_end_{poll_id}")
-    except:
-        pass
+    remove_job(f"poll_end_{poll_id}")
     
     # End the poll
     from . import end_poll as poll_end_func
@@ -3,7 +3,6 @@ Recruit bidding system implementation
 Allows bidding on new recruits with time-limited auctions
 """
 
-import asyncio
 import random
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, List
@@ -13,6 +12,7 @@ from bson import ObjectId
 import hikari
 import lightbulb
 from lightbulb.components import MenuContext, ModalContext
+from apscheduler.triggers.date import DateTrigger
 
 from hikari.impl import (
     MessageActionRowBuilder as ActionRow,
@@ -32,8 +32,12 @@ from extensions.components import register_action
 from extensions.commands.recruit import recruit
 from utils.mongo import MongoClient
 from utils.classes import Clan
-from utils.emoji import emojis
+from utils import bot_data
+from utils.scheduler import scheduler, PERSISTENT
+from utils.emoji import emojis, th_emoji
 from utils.constants import RED_ACCENT, GREEN_ACCENT, BLUE_ACCENT, GOLD_ACCENT
+from utils.user_cache import fetch_user
+from utils.points_events import publish_points_change
 
 # Helper function for safe placeholder_points adjustments
 async def safe_adjust_placeholder_points(mongo: MongoClient, clan_tag: str, amount: float, operation: str = "inc"):
@@ -91,16 +95,13 @@ LOG_CHANNEL_ID = 1381395856317747302  # Channel for bid logs
 # Store active bidding sessions with their end times
 active_bidding_sessions: Dict[str, datetime] = {}
 
-# Store bidding tasks for cancellation
-bidding_tasks: Dict[str, asyncio.Task] = {}
+# Bidding end jobs live in the shared persistent job store
+BIDDING_JOB_PREFIX = "bidding_end_"
 
 
 def get_th_emoji(th_level: int) -> Optional[object]:
     """Get the TH emoji for a given level"""
-    emoji_attr = f"TH{th_level}"
-    if hasattr(emojis, emoji_attr):
-        return getattr(emojis, emoji_attr)
-    return None
+    return th_emoji(th_level)
 
 
 @recruit.register()
@@ -456,13 +457,7 @@ async def handle_recruit_selection(
         )
 
         # Schedule the bidding end
-        task = asyncio.create_task(
-            end_bidding_timer(
-                bot, mongo, recruit_id, bidding_session_id,
-                ticket_thread_id, message.id
-            )
-        )
-        bidding_tasks[recruit_id] = task
+        schedule_bidding_end(recruit_id, bidding_session_id, ticket_thread_id, message.id, bid_end_time)
 
     except Exception as e:
         print(f"[Bidding] Error creating bidding message: {e}")
@@ -1217,32 +1212,55 @@ async def confirm_bid_removal(
         "_id": {"$in": [session_id, session.get("_id")]}
     })
 
-async def end_bidding_timer(
-    bot: hikari.GatewayBot,
-    mongo: MongoClient,
+def schedule_bidding_end(
     recruit_id: str,
     session_id: str,
     thread_id: int,
-    message_id: int
+    message_id: int,
+    end_time: datetime
 ):
-    """Timer to end bidding after duration expires"""
-    try:
-        # Wait for bidding duration
-        await asyncio.sleep(BIDDING_DURATION * 60)
+    """Persist the job that closes bidding, so it survives restarts"""
+    scheduler.add_job(
+        end_bidding_job,
+        trigger=DateTrigger(run_date=end_time),
+        args=[recruit_id, session_id, int(thread_id), int(message_id)],
+        id=f"{BIDDING_JOB_PREFIX}{recruit_id}",
+        jobstore=PERSISTENT,
+        replace_existing=True
+    )
 
-        # Process the bidding results
+
+async def end_bidding_job(recruit_id: str, session_id: str, thread_id: int, message_id: int):
+    """End bidding once its duration expires (runs from the persistent job store)"""
+    bot = bot_data.data.get("bot")
+    mongo = bot_data.data.get("mongo")
+    if not bot or not mongo:
+        print(f"[Bidding] Cannot end bidding for recruit {recruit_id}: bot or MongoDB not available")
+        return
+
+    try:
         await process_bidding_end(bot, mongo, recruit_id, session_id, thread_id, message_id)
 
-    except asyncio.CancelledError:
-        print(f"[Bidding] Timer cancelled for recruit {recruit_id}")
     except Exception as e:
-        print(f"[Bidding] Error in timer for recruit {recruit_id}: {e}")
+        print(f"[Bidding] Error ending bidding for recruit {recruit_id}: {e}")
+
+        # Release the recruit so the session can't stay stuck
+        try:
+            update_fields = {"activeBid": False}
+            if "Unknown Channel" in str(e) or "404" in str(e):
+                # Channel doesn't exist, mark ticket as closed
+                update_fields["ticket_open"] = False
+
+            await mongo.new_recruits.update_one(
+                {"_id": ObjectId(recruit_id)},
+                {"$set": update_fields}
+            )
+            await mongo.button_store.delete_one({"_id": session_id})
+        except Exception as reset_error:
+            print(f"[Bidding] Failed to reset activeBid for recruit {recruit_id}: {reset_error}")
+
     finally:
-        # Clean up
-        if recruit_id in active_bidding_sessions:
-            del active_bidding_sessions[recruit_id]
-        if recruit_id in bidding_tasks:
-            del bidding_tasks[recruit_id]
+        active_bidding_sessions.pop(recruit_id, None)
 
 
 async def process_bidding_end(
@@ -1448,6 +1466,7 @@ async def handle_multiple_bids(
                 }
             }
         )
+        publish_points_change(winning_bid["clan_tag"])
         # Safely adjust placeholder points
         await safe_adjust_placeholder_points(mongo, winning_bid["clan_tag"], -winning_bid["amount"])
 
@@ -1462,7 +1481,7 @@ async def handle_multiple_bids(
         clan_data = await mongo.clans.find_one({"tag": bid["clan_tag"]})
         if clan_data:
             clan_name = Clan(data=clan_data).name
-            bidder = await bot.rest.fetch_user(bid["placed_by"])
+            bidder = await fetch_user(bot, bid["placed_by"])
             bidder_name = bidder.display_name if bidder else "Unknown"
         else:
             clan_name = "Unknown Clan"
@@ -1535,9 +1554,5 @@ async def handle_multiple_bids(
 
 # Cleanup on module unload
 def cleanup_tasks():
-    """Cancel all active bidding tasks"""
-    for task in bidding_tasks.values():
-        if not task.done():
-            task.cancel()
-    bidding_tasks.clear()
+    """Forget in-memory bidding sessions (end jobs stay persisted)"""
     active_bidding_sessions.clear()
\ No newline at end of file
@@ -32,6 +32,7 @@ from utils.constants import (
 )
 from utils.emoji import emojis
 from utils.mongo import MongoClient
+from utils.user_cache import fetch_member
 from extensions.components import register_action
 
 @recruit.register()
@@ -67,7 +68,7 @@ async def primary_questions(
 
     ctx: lightbulb.components.MenuContext = kwargs.get("ctx")
     choice = ctx.interaction.values[0]
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await fetch_member(bot, ctx.guild_id, user_id)
     mention_allowed = {
         # don’t auto-parse @everyone or @here
         "parse": [],
@@ -359,7 +360,7 @@ async def on_age_button(
     ctx: lightbulb.components.MenuContext = kwargs["ctx"]
     bracket, user_id = action_id.rsplit("_", 1)
     user_id = int(user_id)
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await fetch_member(bot, ctx.guild_id, user_id)
 
     if int(ctx.user.id) != user_id:
         await ctx.respond(
@@ -510,7 +511,7 @@ async def fwa_questions(
 
     ctx: lightbulb.components.MenuContext = kwargs.get("ctx")
     choice = ctx.interaction.values[0]
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await fetch_member(bot, ctx.guild_id, user_id)
 
     if choice == "get_war_weight":
         components = [
@@ -799,7 +800,7 @@ async def th_select(
 
     ctx: lightbulb.components.MenuContext = kwargs.get("ctx")
     choice = ctx.interaction.values[0]
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await fetch_member(bot, ctx.guild_id, user_id)
     fwa = await get_fwa_base_object(mongo)
 
     # Check if FWA data exists
@@ -917,7 +918,7 @@ async def explanations(
 
     ctx: lightbulb.components.MenuContext = kwargs.get("ctx")
     choice = ctx.interaction.values[0]
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await fetch_member(bot, ctx.guild_id, user_id)
 
     if choice == "what_is_zen":
         components = [
@@ -1177,7 +1178,7 @@ async def keep_it_moving(
 
     ctx: lightbulb.components.MenuContext = kwargs.get("ctx")
     choice = ctx.interaction.values[0]
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await fetch_member(bot, ctx.guild_id, user_id)
 
     if choice == "waiting_response":
         components = [
@@ -6,6 +6,7 @@ from extensions.commands.recruit import recruit
 from extensions.components import register_action
 from utils.mongo import MongoClient
 from utils.classes import Clan
+from utils.clan_registry import as_clan
 from utils.constants import RED_ACCENT
 
 from hikari.impl import (
@@ -48,7 +49,7 @@ class Welcome(
             await ctx.respond("You must have a clan leader role to send welcome messages.", ephemeral=True)
             return
             
-        clans = [Clan(data=d) for d in clan_data]
+        clans = [as_clan(d) for d in clan_data]
 
         options = []
         seen_tags = {}
@@ -8,7 +8,7 @@ import hikari
 
 from extensions.commands.staff import staff
 from utils.mongo import MongoClient
-from .utils import is_leadership, get_all_staff_logs
+from .utils import is_leadership, get_staff_roster, get_staff_stats
 from .embeds import build_main_dashboard, build_empty_state_dashboard
 
 
@@ -36,8 +36,8 @@ class StaffDashboard(
             )
             return
 
-        # Get all staff logs for stats
-        all_logs = await get_all_staff_logs(mongo)
+        # Get roster from the in-memory index
+        all_logs = await get_staff_roster(mongo)
 
         # Check if empty state - show quick start wizard
         if not all_logs:
@@ -50,11 +50,7 @@ class StaffDashboard(
             return
 
         # Calculate stats
-        stats = {
-            'active': sum(1 for log in all_logs if log.get('employment_status') == 'Active'),
-            'on_leave': sum(1 for log in all_logs if log.get('employment_status') == 'On Leave'),
-            'inactive': sum(1 for log in all_logs if log.get('employment_status') in ['Inactive', 'Terminated', 'Staff Banned'])
-        }
+        stats = await get_staff_stats(mongo)
 
         # Build main dashboard with categorized sections
         components = build_main_dashboard(ctx.guild_id, stats, all_logs)
@@ -21,13 +21,23 @@ from hikari.impl import (
 from extensions.components import register_action
 from utils.constants import BLUE_ACCENT, GREEN_ACCENT, GOLD_ACCENT, RED_ACCENT, validate_user_has_role
 from utils.mongo import MongoClient
+from utils.user_cache import fetch_user, fetch_member
 from .utils import (
     is_leadership,
     get_all_staff_logs,
     get_staff_log,
+    get_staff_roster,
+    get_staff_teams,
+    get_staff_in_team,
+    get_staff_by_status,
+    get_staff_updated_since,
+    get_staff_stats,
+    load_staff_index,
+    unindex_staff_log,
     create_staff_log_thread,
     update_forum_log,
     generate_next_case_id,
+    find_case,
     format_discord_timestamp
 )
 from .embeds import build_main_dashboard, build_staff_record_view, build_filter_view, build_user_selection_for_creation, build_team_position_selection, build_staff_select_menu, build_update_position_selection, build_add_position_selection, build_remove_position_selection, build_which_position_to_update_selection, build_case_type_selection, build_remove_case_selection, build_view_cases_menu, build_all_cases_view, build_user_cases_view, build_edit_dates_selection, build_admin_change_selection
@@ -133,7 +143,7 @@ async def handle_user_select(
 
     # Fetch user object
     try:
-        user = await bot.rest.fetch_user(int(selected_user_id))
+        user = await fetch_user(bot, int(selected_user_id))
     except hikari.NotFoundError:
         if in_team_flow:
             await ctx.interaction.edit_initial_response(
@@ -171,12 +181,8 @@ async def handle_user_select(
         print(f"[Staff Dashboard] Viewing log for {user.username} (new ephemeral)")
 
         # Auto-refresh the main dashboard to reset dropdown
-        all_logs_refresh = await get_all_staff_logs(mongo)
-        stats = {
-            'active': sum(1 for log in all_logs_refresh if log.get('employment_status') == 'Active'),
-            'on_leave': sum(1 for log in all_logs_refresh if log.get('employment_status') == 'On Leave'),
-            'inactive': sum(1 for log in all_logs_refresh if log.get('employment_status') in ['Inactive', 'Terminated', 'Staff Banned'])
-        }
+        all_logs_refresh = await get_staff_roster(mongo)
+        stats = await get_staff_stats(mongo)
         dashboard_components = build_main_dashboard(ctx.guild_id, stats, all_logs_refresh)
         await ctx.interaction.edit_message(ctx.interaction.message, components=dashboard_components)
 
@@ -201,7 +207,7 @@ async def handle_view_record(
 
     # Fetch user object
     try:
-        user = await bot.rest.fetch_user(int(user_id))
+        user = await fetch_user(bot, int(user_id))
     except hikari.NotFoundError:
         await ctx.respond("❌ User not found.", ephemeral=True)
         return
@@ -294,7 +300,7 @@ async def handle_team_select(
 
     # Fetch user
     try:
-        user = await bot.rest.fetch_user(int(user_id))
+        user = await fetch_user(bot, int(user_id))
     except hikari.NotFoundError:
         await ctx.respond("❌ User not found.", ephemeral=True)
         return
@@ -328,7 +334,7 @@ async def handle_position_select(
 
     # Fetch user
     try:
-        user = await bot.rest.fetch_user(int(user_id))
+        user = await fetch_user(bot, int(user_id))
     except hikari.NotFoundError:
         await ctx.respond("❌ User not found.", ephemeral=True)
         return
@@ -413,8 +419,8 @@ async def handle_create_submit(
 
     # Fetch user and member objects
     try:
-        user = await bot.rest.fetch_user(int(user_id))
-        member = await bot.rest.fetch_member(ctx.guild_id, int(user_id))
+        user = await fetch_user(bot, int(user_id))
+        member = await fetch_member(bot, ctx.guild_id, int(user_id))
     except hikari.NotFoundError:
         await ctx.interaction.edit_initial_response(
             components=build_error_message("User not found in this server.")
@@ -551,8 +557,8 @@ async def handle_create_submit(
     # Validate user ID
     try:
         user_id = int(user_id_str)
-        user = await bot.rest.fetch_user(user_id)
-        member = await bot.rest.fetch_member(ctx.guild_id, user_id)
+        user = await fetch_user(bot, user_id)
+        member = await fetch_member(bot, ctx.guild_id, user_id)
     except (ValueError, hikari.NotFoundError):
         await ctx.respond("❌ Invalid user ID or user not found in server.", ephemeral=True)
         return
@@ -853,7 +859,7 @@ async def handle_update_position_submit(
 
     # Fetch member for role validation
     try:
-        member = await bot.rest.fetch_member(ctx.guild_id, int(user_id))
+        member = await fetch_member(bot, ctx.guild_id, int(user_id))
     except hikari.NotFoundError:
         member = None
 
@@ -954,7 +960,7 @@ async def handle_update_position_submit(
 
     # Get updated log and return to record view
     log = await get_staff_log(mongo, user_id)
-    user = await bot.rest.fetch_user(int(user_id))
+    user = await fetch_user(bot, int(user_id))
     components = build_staff_record_view(log, user, ctx.guild_id)
 
     await ctx.interaction.edit_initial_response(components=components)
@@ -1184,7 +1190,7 @@ async def handle_add_position_submit(
 
     # Fetch member for role validation
     try:
-        member = await bot.rest.fetch_member(ctx.guild_id, int(user_id))
+        member = await fetch_member(bot, ctx.guild_id, int(user_id))
     except hikari.NotFoundError:
         member = None
 
@@ -1267,7 +1273,7 @@ async def handle_add_position_submit(
 
     # Get updated log and return to record view
     log = await get_staff_log(mongo, user_id)
-    user = await bot.rest.fetch_user(int(user_id))
+    user = await fetch_user(bot, int(user_id))
     components = build_staff_record_view(log, user, ctx.guild_id)
 
     await ctx.interaction.edit_initial_response(components=components)
@@ -1480,7 +1486,7 @@ async def handle_remove_position_submit(
 
     # Get updated log and return to record view
     log = await get_staff_log(mongo, user_id)
-    user = await bot.rest.fetch_user(int(user_id))
+    user = await fetch_user(bot, int(user_id))
     components = build_staff_record_view(log, user, ctx.guild_id)
 
     await ctx.interaction.edit_initial_response(components=components)
@@ -1669,7 +1675,7 @@ async def handle_position_date_submit(
 
     # Get updated log and return to record view
     log = await get_staff_log(mongo, user_id)
-    user = await bot.rest.fetch_user(int(user_id))
+    user = await fetch_user(bot, int(user_id))
     components = build_staff_record_view(log, user, ctx.guild_id)
 
     await ctx.interaction.edit_initial_response(components=components)
@@ -1699,7 +1705,7 @@ async def handle_admin_button(
         return
 
     # Get user
-    user = await bot.rest.fetch_user(int(user_id))
+    user = await fetch_user(bot, int(user_id))
 
     # Build admin change selection view
     components = build_admin_change_selection(ctx.guild_id, user_id, user.username, log)
@@ -1817,7 +1823,7 @@ async def handle_admin_submit(
 
     # Get updated log and return to record view
     log = await get_staff_log(mongo, user_id)
-    user = await bot.rest.fetch_user(int(user_id))
+    user = await fetch_user(bot, int(user_id))
     components = build_staff_record_view(log, user, ctx.guild_id)
 
     await ctx.interaction.edit_initial_response(components=components)
@@ -1846,7 +1852,7 @@ async def handle_case_button(
 
     # Fetch user to get current username
     try:
-        user = await bot.rest.fetch_user(int(user_id))
+        user = await fetch_user(bot, int(user_id))
         username = user.username
     except hikari.NotFoundError:
         username = log.get('username', 'Unknown')
@@ -1937,8 +1943,7 @@ async def handle_case_submit(
         )
         return
 
-    existing_cases = log.get('staff_cases', [])
-    case_id = generate_next_case_id(existing_cases)
+    case_id = await generate_next_case_id(mongo)
 
     # Update database
     await mongo.staff_logs.update_one(
@@ -2044,7 +2049,7 @@ async def handle_case_submit(
 
     # Get updated log and return to record view
     log = await get_staff_log(mongo, user_id)
-    user = await bot.rest.fetch_user(int(user_id))
+    user = await fetch_user(bot, int(user_id))
     components = build_staff_record_view(log, user, ctx.guild_id)
 
     await ctx.interaction.edit_initial_response(components=components)
@@ -2113,7 +2118,7 @@ async def handle_select_case_remove(
 
     # Get updated log and return to record view
     log = await get_staff_log(mongo, user_id)
-    user = await bot.rest.fetch_user(int(user_id))
+    user = await fetch_user(bot, int(user_id))
     components = build_staff_record_view(log, user, ctx.guild_id)
 
     await ctx.interaction.edit_initial_response(components=components)
@@ -2156,8 +2161,12 @@ async def handle_view_all_cases(
     **kwargs
 ):
     """Handle 'View All Cases' button - shows all cases across all staff"""
-    # Get all staff logs
-    all_logs = await get_all_staff_logs(mongo)
+    # Only logs with cases, and only the fields the view reads
+    all_logs = await get_all_staff_logs(
+        mongo,
+        {"staff_cases.0": {"$exists": True}},
+        {"_id": 0, "user_id": 1, "username": 1, "staff_cases": 1}
+    )
 
     # Build all cases view
     components = build_all_cases_view(ctx.guild_id, all_logs)
@@ -2217,21 +2226,14 @@ async def handle_search_case_submit(
     # Get case ID from modal
     search_case_id = ctx.interaction.components[0].components[0].value.strip().upper()
 
-    # Search for the case across all staff logs
-    all_logs = await get_all_staff_logs(mongo)
-
+    # Look up the case through the case ID index
     found_case = None
     found_username = None
 
-    for log in all_logs:
-        staff_cases = log.get('staff_cases', [])
-        for case in staff_cases:
-            if case.get('case_id') == search_case_id:
-                found_case = case
-                found_username = log.get('username', 'Unknown')
-                break
-        if found_case:
-            break
+    result = await find_case(mongo, search_case_id)
+    if result:
+        found_case, found_log = result
+        found_username = found_log.get('username', 'Unknown')
 
     # Build result display
     if found_case:
@@ -2400,7 +2402,7 @@ async def handle_status_select(
 
     # Get updated log and return to record view
     log = await get_staff_log(mongo, user_id)
-    user = await bot.rest.fetch_user(int(user_id))
+    user = await fetch_user(bot, int(user_id))
     components = build_staff_record_view(log, user, ctx.guild_id)
 
     await ctx.interaction.edit_initial_response(components=components)
@@ -2543,7 +2545,7 @@ async def handle_edit_hire_date_submit(
 
     # Get updated log and return to record view
     log = await get_staff_log(mongo, user_id)
-    user = await bot.rest.fetch_user(int(user_id))
+    user = await fetch_user(bot, int(user_id))
     components = build_staff_record_view(log, user, ctx.guild_id)
 
     await ctx.interaction.edit_initial_response(components=components)
@@ -2595,7 +2597,7 @@ async def handle_edit_join_date_submit(
 
     # Get updated log and return to record view
     log = await get_staff_log(mongo, user_id)
-    user = await bot.rest.fetch_user(int(user_id))
+    user = await fetch_user(bot, int(user_id))
     components = build_staff_record_view(log, user, ctx.guild_id)
 
     await ctx.interaction.edit_initial_response(components=components)
@@ -2628,15 +2630,10 @@ async def handle_refresh(
     """Handle 'Refresh Dashboard' button - rebuilds dashboard in the same message with fresh dropdown"""
     import time
 
-    # Get all staff logs
-    all_logs = await get_all_staff_logs(mongo)
-
-    # Calculate stats
-    stats = {
-        'active': sum(1 for log in all_logs if log.get('employment_status') == 'Active'),
-        'on_leave': sum(1 for log in all_logs if log.get('employment_status') == 'On Leave'),
-        'inactive': sum(1 for log in all_logs if log.get('employment_status') in ['Inactive', 'Terminated', 'Staff Banned'])
-    }
+    # Rebuild the roster index so manual database edits show up too
+    await load_staff_index(mongo, force=True)
+    all_logs = await get_staff_roster(mongo)
+    stats = await get_staff_stats(mongo)
 
     # Rebuild main dashboard with fresh unique_id to reset dropdown
     components = build_main_dashboard(ctx.guild_id, stats, all_logs)
@@ -2660,21 +2657,15 @@ async def handle_filter_team(
     **kwargs
 ):
     """Handle 'Filter by Team' button - shows selection for teams"""
-    # Get all logs
-    all_logs = await get_all_staff_logs(mongo)
+    # Get roster from the index
+    all_logs = await get_staff_roster(mongo)
 
     if not all_logs:
         await ctx.respond("❌ No staff logs found.", ephemeral=True)
         return
 
     # Get unique teams
-    teams = set()
-    for log in all_logs:
-        team = log.get('current_team')
-        if team:
-            teams.add(team)
-
-    teams = sorted(list(teams))
+    teams = await get_staff_teams(mongo)
 
     if not teams:
         await ctx.respond("❌ No teams found in staff records.", ephemeral=True)
@@ -2687,7 +2678,7 @@ async def handle_filter_team(
 
     team_sections = []
     for team in teams:
-        team_staff = [log for log in all_logs if log.get('current_team') == team]
+        team_staff = [log for log in await get_staff_in_team(mongo, team) if log.get('current_team') == team]
         staff_list = [f"• <@{log.get('user_id')}> - {log.get('current_position', 'N/A')}" for log in team_staff]
         staff_text = "\n".join(staff_list)
 
@@ -2736,8 +2727,8 @@ async def handle_filter_status(
     **kwargs
 ):
     """Handle 'Filter by Status' button - shows selection for status types"""
-    # Get all logs
-    all_logs = await get_all_staff_logs(mongo)
+    # Get roster from the index
+    all_logs = await get_staff_roster(mongo)
 
     if not all_logs:
         await ctx.respond("❌ No staff logs found.", ephemeral=True)
@@ -2745,11 +2736,8 @@ async def handle_filter_status(
 
     # Group by status
     status_groups = {
-        "Active": [log for log in all_logs if log.get('employment_status') == 'Active'],
-        "On Leave": [log for log in all_logs if log.get('employment_status') == 'On Leave'],
-        "Inactive": [log for log in all_logs if log.get('employment_status') == 'Inactive'],
-        "Terminated": [log for log in all_logs if log.get('employment_status') == 'Terminated'],
-        "Staff Banned": [log for log in all_logs if log.get('employment_status') == 'Staff Banned']
+        status: await get_staff_by_status(mongo, status)
+        for status in ("Active", "On Leave", "Inactive", "Terminated", "Staff Banned")
     }
 
     # Build grouped view
@@ -2818,8 +2806,8 @@ async def handle_filter_role(
     """Handle 'By Team' button - shows team selection dropdown"""
     from utils.constants import STAFF_ROLES
 
-    # Get all logs
-    all_logs = await get_all_staff_logs(mongo)
+    # Get roster from the index
+    all_logs = await get_staff_roster(mongo)
 
     if not all_logs:
         await ctx.respond("❌ No staff logs found.", ephemeral=True)
@@ -2882,8 +2870,8 @@ async def handle_return_team_selection(
     """Handle 'Back to Team Selection' button - returns to team selection dropdown"""
     from utils.constants import STAFF_ROLES
 
-    # Get all logs
-    all_logs = await get_all_staff_logs(mongo)
+    # Get roster from the index
+    all_logs = await get_staff_roster(mongo)
 
     if not all_logs:
         await ctx.interaction.edit_initial_response(
@@ -2955,8 +2943,8 @@ async def handle_team_selected(
 
     selected_team = ctx.interaction.values[0]
 
-    # Get all logs
-    all_logs = await get_all_staff_logs(mongo)
+    # Get roster from the index
+    all_logs = await get_staff_roster(mongo)
 
     if not all_logs:
         await ctx.interaction.edit_initial_response(
@@ -2964,6 +2952,8 @@ async def handle_team_selected(
         )
         return
 
+    team_logs = await get_staff_in_team(mongo, selected_team)
+
     # Build hierarchy for ONLY the selected team
     import time
     unique_id = f"team_{int(time.time() * 1000)}"  # Prefix with "team_" to track context
@@ -2984,8 +2974,8 @@ async def handle_team_selected(
         position_name = role_info["name"]
         staff_in_position = []
 
-        # Find all staff who hold this position
-        for log in all_logs:
+        # Find all staff in this team who hold this position
+        for log in team_logs:
             # Check if it's their primary position
             if log.get('current_team') == selected_team and log.get('current_position') == position_name:
                 staff_in_position.append((log, True))  # True = primary
@@ -3072,29 +3062,16 @@ async def handle_filter_recent(
     """Handle 'Recent Changes' button - shows staff with recent updates"""
     from datetime import timedelta
 
-    # Get all logs
-    all_logs = await get_all_staff_logs(mongo)
+    # Get roster from the index
+    all_logs = await get_staff_roster(mongo)
 
     if not all_logs:
         await ctx.respond("❌ No staff logs found.", ephemeral=True)
         return
 
-    # Filter logs updated in last 7 days
-    now = datetime.now(timezone.utc)
-    seven_days_ago = now - timedelta(days=7)
-
-    recent_logs = []
-    for log in all_logs:
-        last_updated = log.get('metadata', {}).get('last_updated')
-        if last_updated:
-            # Ensure timezone-aware for comparison
-            if last_updated.tzinfo is None:
-                last_updated = last_updated.replace(tzinfo=timezone.utc)
-            if last_updated >= seven_days_ago:
-                recent_logs.append(log)
-
-    # Sort by most recent first
-    recent_logs.sort(key=lambda x: x.get('metadata', {}).get('last_updated', now), reverse=True)
+    # Staff updated in last 7 days, most recent first
+    seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
+    recent_logs = await get_staff_updated_since(mongo, seven_days_ago)
 
     # Build view
     import time
@@ -3263,6 +3240,7 @@ async def handle_delete_confirm_submit(
 
     # Delete from MongoDB
     await mongo.staff_logs.delete_one({"user_id": user_id})
+    unindex_staff_log(user_id)
     print(f"[Staff Dashboard] Deleted MongoDB document for {username} ({user_id})")
 
     # Delete forum thread
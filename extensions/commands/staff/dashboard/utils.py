@@ -3,10 +3,14 @@ Staff Dashboard Utilities
 Core functions for forum operations, formatters, and permission checks
 """
 
+import asyncio
 import hikari
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, List, Optional, Set
+from pymongo import ReturnDocument
+from pymongo.errors import OperationFailure
 from utils.mongo import MongoClient
+from utils.user_cache import fetch_member
 
 # Forum channel ID for staff logs
 STAFF_LOG_FORUM_ID = 1034588368174059570
@@ -25,6 +29,35 @@ LEADERSHIP_ROLES = [
     1345189456038068327,  # Community Manager
 ]
 
+# Case ID sequence (settings.counters)
+CASE_COUNTER_ID = "staff_case_id"
+
+# Statuses counted as "inactive" in dashboard stats
+INACTIVE_STATUSES = ("Inactive", "Terminated", "Staff Banned")
+
+# Fields kept in the in-memory roster index - everything the dashboard lists and
+# filters on, without case, admin or position history
+STAFF_INDEX_PROJECTION = {
+    "_id": 0,
+    "user_id": 1,
+    "username": 1,
+    "display_name": 1,
+    "employment_status": 1,
+    "current_team": 1,
+    "current_position": 1,
+    "additional_positions": 1,
+    "metadata.last_updated": 1,
+}
+
+# Roster index: user_id -> projected log, plus lookups by team and status.
+# Loaded once, then kept current by every write path in this package.
+_staff_index: Dict[str, dict] = {}
+_by_team: Dict[str, Set[str]] = {}  # Primary and additional teams
+_by_status: Dict[str, Set[str]] = {}
+_index_loaded = False
+_index_lock = asyncio.Lock()
+_indexes_ready = False
+
 
 def is_leadership(member: hikari.Member) -> bool:
     """Check if user has leadership permissions"""
@@ -50,22 +83,62 @@ def format_discord_timestamp(dt: datetime, style: str = "F") -> str:
     return f"<t:{unix_timestamp}:{style}>"
 
 
-def generate_next_case_id(existing_cases: list) -> str:
-    """Generate random alphanumeric case ID in format SC-XXXXX"""
-    import random
-    import string
+async def ensure_staff_indexes(mongo: MongoClient) -> None:
+    """Create staff log indexes (once per process)"""
+    global _indexes_ready
+
+    if _indexes_ready:
+        return
+
+    await mongo.staff_logs.create_index([("user_id", 1)])
+    try:
+        # Unique across logs; partial so logs without cases don't all collide on null
+        await mongo.staff_logs.create_index(
+            [("staff_cases.case_id", 1)],
+            unique=True,
+            partialFilterExpression={"staff_cases.case_id": {"$exists": True}}
+        )
+    except OperationFailure as e:
+        # Existing duplicate IDs - still index for lookups, without the guarantee
+        print(f"[Staff Dashboard] Case ID unique index unavailable: {e}")
+        await mongo.staff_logs.create_index([("staff_cases.case_id", 1)])
+
+    _indexes_ready = True
+
+
+async def generate_next_case_id(mongo: MongoClient) -> str:
+    """
+    Allocate the next case ID (SC-00001, SC-00002, ...) from an atomic counter
+    Sequence values are never reused; the index probe only skips legacy random IDs
+    """
+    await ensure_staff_indexes(mongo)
 
-    # Generate unique case ID
     while True:
-        # Create random 5-character alphanumeric ID
-        random_chars = ''.join(random.choices(string.ascii_uppercase + string.digits, k=5))
-        case_id = f"SC-{random_chars}"
+        counter = await mongo.counters.find_one_and_update(
+            {"_id": CASE_COUNTER_ID},
+            {"$inc": {"value": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        case_id = f"SC-{counter['value']:05d}"
 
-        # Check if this ID already exists
-        if not any(case.get('case_id') == case_id for case in existing_cases):
+        if not await mongo.staff_logs.find_one({"staff_cases.case_id": case_id}, {"_id": 1}):
             return case_id
 
 
+async def find_case(mongo: MongoClient, case_id: str) -> Optional[tuple]:
+    """Look up a case by ID via the case index, returning (case, log) or None"""
+    await ensure_staff_indexes(mongo)
+
+    log = await mongo.staff_logs.find_one(
+        {"staff_cases.case_id": case_id},
+        {"_id": 0, "user_id": 1, "username": 1, "staff_cases.$": 1}
+    )
+    if not log or not log.get("staff_cases"):
+        return None
+    return log["staff_cases"][0], log
+
+
 async def create_staff_log_thread(
     bot: hikari.GatewayBot,
     mongo: MongoClient,
@@ -138,6 +211,7 @@ async def create_staff_log_thread(
 
     # Save to database
     await mongo.staff_logs.insert_one(log_data)
+    index_staff_log(log_data)
 
     print(f"[Staff Dashboard] Created log for {user.username} (ID: {user.id})")
     print(f"[Staff Dashboard DEBUG] Thread ID: {thread.id}, Message ID: {starter_message.id}")
@@ -161,12 +235,16 @@ async def update_forum_log(
     log = await mongo.staff_logs.find_one({"user_id": user_id})
 
     if not log:
+        unindex_staff_log(user_id)
         print(f"[Staff Dashboard] No log found for user {user_id}")
         return
 
+    # Every update path ends here, so this keeps the roster index current
+    index_staff_log(log)
+
     # Fetch member (not just user) to get display_name
     try:
-        member = await bot.rest.fetch_member(guild_id, int(user_id))
+        member = await fetch_member(bot, guild_id, int(user_id))
         user = member.user  # Get user object from member
         current_display_name = member.display_name
     except hikari.NotFoundError:
@@ -189,6 +267,8 @@ async def update_forum_log(
                 {"user_id": user_id},
                 {"$set": {"display_name": current_display_name}}
             )
+            if user_id in _staff_index:
+                _staff_index[user_id]["display_name"] = current_display_name
         except hikari.RateLimitTooLongError:
             print(f"[Staff Dashboard] Rate limited - couldn't update thread title for {current_display_name}")
         except Exception as e:
@@ -223,12 +303,142 @@ async def update_forum_log(
         traceback.print_exc()
 
 
-async def get_all_staff_logs(mongo: MongoClient) -> list:
-    """Get all staff logs from database"""
-    logs = await mongo.staff_logs.find({}).to_list(None)
+async def get_all_staff_logs(
+    mongo: MongoClient,
+    query: Optional[dict] = None,
+    projection: Optional[dict] = None
+) -> list:
+    """
+    Get full staff logs from database
+    Prefer the roster index below; use query/projection to fetch only what's needed
+    """
+    logs = await mongo.staff_logs.find(query or {}, projection).to_list(None)
     return logs or []
 
 
+# ========== ROSTER INDEX ==========
+
+def _project(log: dict) -> dict:
+    """
+    Reduce a full staff log to the fields held in the roster index.
+    Missing fields stay missing so callers' .get() defaults still apply.
+    """
+    entry = {
+        key: log[key] for key in STAFF_INDEX_PROJECTION
+        if key not in ("_id", "metadata.last_updated") and key in log
+    }
+    if "additional_positions" in log:
+        entry["additional_positions"] = [
+            {key: pos[key] for key in ("team", "position") if key in pos}
+            for pos in (log.get("additional_positions") or [])
+        ]
+    metadata = log.get("metadata") or {}
+    if "last_updated" in metadata:
+        entry["metadata"] = {"last_updated": metadata["last_updated"]}
+    return entry
+
+
+def unindex_staff_log(user_id: str) -> None:
+    """Drop a staff member from the roster index"""
+    entry = _staff_index.pop(user_id, None)
+    if not entry:
+        return
+
+    for lookup in (_by_team, _by_status):
+        for key in list(lookup):
+            lookup[key].discard(user_id)
+            if not lookup[key]:
+                del lookup[key]
+
+
+def index_staff_log(log: dict) -> None:
+    """Insert or replace a staff member in the roster index from a (full or projected) log"""
+    user_id = log.get("user_id")
+    if not user_id:
+        return
+
+    unindex_staff_log(user_id)
+    entry = _project(log)
+    _staff_index[user_id] = entry
+
+    teams = {entry.get("current_team")} | {pos.get("team") for pos in entry.get("additional_positions", [])}
+    for team in teams:
+        if team:
+            _by_team.setdefault(team, set()).add(user_id)
+    _by_status.setdefault(entry.get("employment_status"), set()).add(user_id)
+
+
+async def load_staff_index(mongo: MongoClient, force: bool = False) -> None:
+    """Build the roster index from a projected query (once, unless forced)"""
+    global _index_loaded
+
+    async with _index_lock:
+        if _index_loaded and not force:
+            return
+
+        logs = await mongo.staff_logs.find({}, STAFF_INDEX_PROJECTION).to_list(None)
+        _staff_index.clear()
+        _by_team.clear()
+        _by_status.clear()
+        for log in logs:
+            index_staff_log(log)
+
+        _index_loaded = True
+        print(f"[Staff Dashboard] Roster index loaded ({len(_staff_index)} staff)")
+
+
+async def get_staff_roster(mongo: MongoClient) -> List[dict]:
+    """Every staff member's roster entry (team, position, status, last update)"""
+    await load_staff_index(mongo)
+    return list(_staff_index.values())
+
+
+async def get_staff_teams(mongo: MongoClient) -> List[str]:
+    """Sorted names of teams that are someone's primary team"""
+    await load_staff_index(mongo)
+    return sorted({entry["current_team"] for entry in _staff_index.values() if entry.get("current_team")})
+
+
+async def get_staff_in_team(mongo: MongoClient, team: str) -> List[dict]:
+    """Roster entries holding a primary or additional position in a team"""
+    await load_staff_index(mongo)
+    return [_staff_index[user_id] for user_id in _by_team.get(team, ())]
+
+
+async def get_staff_by_status(mongo: MongoClient, status: str) -> List[dict]:
+    """Roster entries with an employment status"""
+    await load_staff_index(mongo)
+    return [_staff_index[user_id] for user_id in _by_status.get(status, ())]
+
+
+async def get_staff_updated_since(mongo: MongoClient, since: datetime) -> List[dict]:
+    """Roster entries updated at or after a time, most recent first"""
+    await load_staff_index(mongo)
+
+    recent = []
+    for entry in _staff_index.values():
+        last_updated = entry.get("metadata", {}).get("last_updated")
+        if not last_updated:
+            continue
+        if last_updated.tzinfo is None:
+            last_updated = last_updated.replace(tzinfo=timezone.utc)
+        if last_updated >= since:
+            recent.append((last_updated, entry))
+
+    recent.sort(key=lambda item: item[0], reverse=True)
+    return [entry for _, entry in recent]
+
+
+async def get_staff_stats(mongo: MongoClient) -> dict:
+    """Dashboard overview counts by employment status"""
+    await load_staff_index(mongo)
+    return {
+        'active': len(_by_status.get('Active', ())),
+        'on_leave': len(_by_status.get('On Leave', ())),
+        'inactive': sum(len(_by_status.get(status, ())) for status in INACTIVE_STATUSES)
+    }
+
+
 async def get_staff_log(mongo: MongoClient, user_id: str) -> Optional[dict]:
     """Get specific staff log by user ID"""
     return await mongo.staff_logs.find_one({"user_id": user_id})
@@ -1,8 +1,12 @@
 import hikari
 import lightbulb
-from PIL import Image
 from io import BytesIO
 
+from utils.lazy_import import lazy_import
+
+# PIL is only needed when an image is actually processed
+Image = lazy_import("PIL.Image")
+
 loader = lightbulb.Loader()
 
 
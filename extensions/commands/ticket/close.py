@@ -8,6 +8,7 @@ from typing import Optional
 from extensions.commands.ticket import loader, ticket
 from utils.mongo import MongoClient
 from utils.constants import RED_ACCENT, GREEN_ACCENT, GOLD_ACCENT
+from utils.points_events import publish_points_change
 
 # Import Components V2
 from hikari.impl import (
@@ -128,6 +129,7 @@ class CloseTicketCommand(
                                 {"tag": clan_tag},
                                 {"$inc": {"points": bid_amount}}
                             )
+                            publish_points_change(clan_tag)
                             print(f"[DEBUG] Refunded {bid_amount} points to {clan_tag}")
 
                             # Get clan details for leadership ping
@@ -7,12 +7,17 @@ import coc
 import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+from pymongo import ReturnDocument
 
 from extensions.commands.ticket import loader, ticket
 from extensions.components import register_action
 from utils.mongo import MongoClient
 from utils.constants import RED_ACCENT, GOLD_ACCENT
 from utils.emoji import emojis
+from extensions.events.channel.ticket_channel_monitor import (
+    register_manual_ticket,
+    manual_ticket_stored,
+)
 
 # Import Components V2
 from hikari.impl import (
@@ -39,34 +44,72 @@ PLAYER_TAG_PATTERN = re.compile(r'^#?[0289PYLQGRJCUV]{3,}$', re.IGNORECASE)
 # Recruitment category ID - hardcoded for reliability
 RECRUITMENT_CATEGORY_ID = 1020517908230709308
 
+# Atomic ticket number counter (settings.counters)
+TICKET_COUNTER_ID = "ticket_number"
+TICKET_NUMBER_START = 1000
+
+
+async def seed_ticket_counter(mongo: MongoClient) -> None:
+    """Seed the ticket counter from the highest existing ticket number (runs once)"""
+    pipeline = [
+        {"$match": {"ticket_info.ticket_number": {"$exists": True, "$ne": None}}},
+        {"$addFields": {
+            "numeric_ticket": {
+                "$convert": {
+                    "input": "$ticket_info.ticket_number",
+                    "to": "int",
+                    "onError": 0
+                }
+            }
+        }},
+        {"$sort": {"numeric_ticket": -1}},
+        {"$limit": 1}
+    ]
+
+    result = await mongo.ticket_automation_state.aggregate(pipeline).to_list(length=1)
+
+    # Start from 1000 if no tickets exist
+    highest_number = result[0].get("numeric_ticket", 0) if result else 0
+    highest_number = max(highest_number, TICKET_NUMBER_START - 1)
+
+    # $setOnInsert so concurrent seeders can't move an existing counter
+    await mongo.counters.update_one(
+        {"_id": TICKET_COUNTER_ID},
+        {"$setOnInsert": {"value": highest_number}},
+        upsert=True
+    )
+    print(f"[INFO] Seeded ticket counter at {highest_number}")
+
+
+async def record_ticket_number(mongo: MongoClient, ticket_number) -> None:
+    """Keep the counter ahead of ticket numbers assigned elsewhere (e.g. ClashKing)"""
+    try:
+        await mongo.counters.update_one(
+            {"_id": TICKET_COUNTER_ID},
+            {"$max": {"value": int(ticket_number)}}
+        )
+    except (TypeError, ValueError):
+        pass
+
 
 async def generate_ticket_number(mongo: MongoClient) -> str:
     """Generate a unique ticket number"""
-    # Get the highest existing ticket number from automation state
     try:
-        pipeline = [
-            {"$match": {"ticket_info.ticket_number": {"$exists": True, "$ne": None}}},
-            {"$addFields": {
-                "numeric_ticket": {
-                    "$convert": {
-                        "input": "$ticket_info.ticket_number",
-                        "to": "int",
-                        "onError": 0
-                    }
-                }
-            }},
-            {"$sort": {"numeric_ticket": -1}},
-            {"$limit": 1}
-        ]
+        counter = await mongo.counters.find_one_and_update(
+            {"_id": TICKET_COUNTER_ID},
+            {"$inc": {"value": 1}},
+            return_document=ReturnDocument.AFTER
+        )
 
-        result = await mongo.ticket_automation_state.aggregate(pipeline).to_list(length=1)
+        if counter is None:
+            await seed_ticket_counter(mongo)
+            counter = await mongo.counters.find_one_and_update(
+                {"_id": TICKET_COUNTER_ID},
+                {"$inc": {"value": 1}},
+                return_document=ReturnDocument.AFTER
+            )
 
-        if result:
-            highest_number = result[0].get("numeric_ticket", 0)
-            return str(highest_number + 1)
-        else:
-            # Start from 1000 if no tickets exist
-            return "1000"
+        return str(counter["value"])
 
     except Exception as e:
         print(f"[ERROR] Failed to generate ticket number: {e}")
@@ -322,6 +365,9 @@ async def handle_manual_ticket_modal(
 
         print(f"[DEBUG] Created ticket channel: {ticket_channel.id}")
 
+        # Let the channel monitor wait for our stored state instead of calling the ClashKing API
+        register_manual_ticket(ticket_channel.id, ticket_channel.name)
+
         # Create private thread for staff discussions
         try:
             private_thread = await bot.rest.create_thread(
@@ -479,6 +525,7 @@ async def handle_manual_ticket_modal(
 
         await mongo.ticket_automation_state.insert_one(automation_doc)
         print(f"[DEBUG] Created ticket_automation_state document")
+        manual_ticket_stored(ticket_channel.id)
 
         print(f"[DEBUG] Ticket channel created - automation will handle initial message")
 
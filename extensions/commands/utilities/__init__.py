@@ -10,6 +10,9 @@ from . import purge_category
 from . import process_reddit_post
 from . import reboot
 from . import add_perms
+from . import scheduled_jobs
+from . import lookup_cache
+from . import metrics
 
 # Add the group to the loader
 loader.command(utilities)
@@ -27,6 +27,7 @@ from extensions.commands.utilities import loader, utilities
 from extensions.components import register_action
 from utils.mongo import MongoClient
 from utils.classes import Clan
+from utils.clan_registry import get_clans
 from utils.constants import GREEN_ACCENT, RED_ACCENT
 from utils.emoji import emojis
 
@@ -191,18 +192,14 @@ async def get_all_clan_role_ids(mongo: MongoClient) -> Tuple[List[hikari.Snowfla
     Get all clan role IDs and leader role IDs from the database
     Returns: (clan_role_ids, leader_role_ids)
     """
-    clan_data = await mongo.clans.find(
-        {"$or": [{"role_id": {"$exists": True, "$ne": None}}, {"leader_role_id": {"$exists": True, "$ne": None}}]}
-    ).to_list(length=None)
-
     clan_role_ids = []
     leader_role_ids = []
 
-    for clan in clan_data:
-        if clan.get("role_id"):
-            clan_role_ids.append(hikari.Snowflake(clan["role_id"]))
-        if clan.get("leader_role_id"):
-            leader_role_ids.append(hikari.Snowflake(clan["leader_role_id"]))
+    for clan in await get_clans(mongo):
+        if clan.role_id:
+            clan_role_ids.append(hikari.Snowflake(clan.role_id))
+        if clan.leader_role_id:
+            leader_role_ids.append(hikari.Snowflake(clan.leader_role_id))
 
     return clan_role_ids, leader_role_ids
 
@@ -526,18 +523,15 @@ class CloneCategory(
             return
         
         # Get all clans from MongoDB
-        clans_data = await mongo.clans.find({"role_id": {"$exists": True}}).to_list(length=None)
+        clans = [clan for clan in await get_clans(mongo) if clan.role_id]
         
-        if not clans_data:
+        if not clans:
             await ctx.respond(
                 "❌ No clans found in the database!",
                 flags=hikari.MessageFlag.EPHEMERAL
             )
             return
         
-        # Create clan objects
-        clans = [Clan(data=data) for data in clans_data]
-        
         # Sort clans by name
         clans.sort(key=lambda c: c.name)
         
@@ -0,0 +1,52 @@
+# extensions/commands/utilities/lookup_cache.py
+"""
+Lookup cache command - hit rates for the shared user/member resolver
+"""
+
+import hikari
+import lightbulb
+
+from hikari.impl import (
+    ContainerComponentBuilder as Container,
+    TextDisplayComponentBuilder as Text,
+    SeparatorComponentBuilder as Separator,
+)
+
+from extensions.commands.utilities import loader
+from utils.constants import BLUE_ACCENT
+from utils.user_cache import get_cache_stats
+
+
+@loader.command
+class LookupCache(
+    lightbulb.SlashCommand,
+    name="lookup-cache",
+    description="Show how user and member lookups are being served",
+    default_member_permissions=hikari.Permissions.ADMINISTRATOR
+):
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None:
+        stats = get_cache_stats()
+
+        components = [
+            Text(content="## 👤 User/Member Lookup Cache"),
+            Text(content="-# Counts since last restart"),
+            Separator(divider=True),
+            Text(content=(
+                f"**Lookups:** {stats['lookups']} • **Hit rate:** {stats['hit_rate']:.0%}\n"
+                f"• Gateway cache: {stats['gateway_hits']}\n"
+                f"• Recent lookups: {stats['cache_hits']}\n"
+                f"• Joined an in-flight fetch: {stats['coalesced']}\n"
+                f"• REST fetches: {stats['rest_fetches']} ({stats['rest_errors']} failed)"
+            )),
+            Separator(divider=True),
+            Text(content=(
+                f"Cached users: {stats['cached_users']} • Cached members: {stats['cached_members']} • "
+                f"In flight: {stats['in_flight']}"
+            )),
+        ]
+
+        await ctx.respond(
+            components=[Container(accent_color=BLUE_ACCENT, components=components)],
+            flags=hikari.MessageFlag.EPHEMERAL
+        )
@@ -0,0 +1,104 @@
+# extensions/commands/utilities/metrics.py
+"""
+Metrics command - latency and error counts for the bot's hot paths
+"""
+
+import hikari
+import lightbulb
+
+from hikari.impl import (
+    ContainerComponentBuilder as Container,
+    TextDisplayComponentBuilder as Text,
+    SeparatorComponentBuilder as Separator,
+)
+
+from extensions.commands.utilities import loader
+from utils.constants import BLUE_ACCENT
+from utils.metrics import (
+    COMPONENT_ERRORS,
+    COMPONENT_HANDLERS,
+    EXTERNAL_ERRORS,
+    EXTERNAL_REQUESTS,
+    METRICS_HOST,
+    METRICS_PORT,
+    MONGO_COMMANDS,
+    MONGO_ERRORS,
+    SCHEDULER_JOB_ERRORS,
+    SCHEDULER_JOBS,
+    error_count,
+    summarize,
+)
+
+# Rows per section, to stay within Discord's component text limits
+MAX_ROWS = 10
+
+SECTIONS = {
+    "external": ("🌐 External APIs", EXTERNAL_REQUESTS, EXTERNAL_ERRORS, ("service", "operation")),
+    "mongo": ("🍃 MongoDB", MONGO_COMMANDS, MONGO_ERRORS, ("collection", "command")),
+    "components": ("🖱️ Component Handlers", COMPONENT_HANDLERS, COMPONENT_ERRORS, ("action",)),
+    "scheduler": ("⏱️ Scheduler Jobs", SCHEDULER_JOBS, SCHEDULER_JOB_ERRORS, ("job",)),
+}
+
+
+def format_duration(seconds: float) -> str:
+    if seconds == float("inf"):
+        return "> max"
+    return f"{seconds * 1000:.0f}ms" if seconds < 1 else f"{seconds:.1f}s"
+
+
+def format_section(key: str) -> str:
+    """Busiest series of one metric: count, average, p95 and errors"""
+    title, histogram, errors, label_names = SECTIONS[key]
+    rows = summarize(histogram, MAX_ROWS)
+    if not rows:
+        return f"### {title}\n*Nothing recorded yet*"
+
+    lines = [f"### {title}"]
+    for row in rows:
+        name = " • ".join(row["labels"].get(label, "-") for label in label_names)
+        failed = error_count(errors, row["labels"])
+        lines.append(
+            f"`{name}` — {row['count']}× • avg {format_duration(row['avg'])} • "
+            f"p95 ≤{format_duration(row['p95'])}" + (f" • ❌ {failed}" if failed else "")
+        )
+    if len(histogram.series) > MAX_ROWS:
+        lines.append(f"-# +{len(histogram.series) - MAX_ROWS} more on the metrics endpoint")
+    return "\n".join(lines)
+
+
+@loader.command
+class Metrics(
+    lightbulb.SlashCommand,
+    name="metrics",
+    description="Latency and error counts for Mongo, external APIs, components and jobs",
+    default_member_permissions=hikari.Permissions.ADMINISTRATOR
+):
+    section = lightbulb.string(
+        "section",
+        "Only show one area",
+        choices=[
+            lightbulb.Choice(name="External APIs", value="external"),
+            lightbulb.Choice(name="MongoDB", value="mongo"),
+            lightbulb.Choice(name="Component handlers", value="components"),
+            lightbulb.Choice(name="Scheduler jobs", value="scheduler"),
+        ],
+        default=None
+    )
+
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None:
+        keys = [self.section] if self.section else list(SECTIONS)
+        endpoint = f"http://{METRICS_HOST}:{METRICS_PORT}/metrics" if METRICS_PORT else "disabled"
+
+        components = [
+            Text(content="## 📈 Bot Metrics"),
+            Text(content=f"-# Busiest first • Counts since last restart • Prometheus: {endpoint}"),
+        ]
+        for key in keys:
+            components.append(Separator(divider=True))
+            components.append(Text(content=format_section(key)))
+
+        await ctx.respond(
+            components=[Container(accent_color=BLUE_ACCENT, components=components)],
+            flags=hikari.MessageFlag.EPHEMERAL
+        )
@@ -11,8 +11,6 @@ from typing import Optional, Dict, List
 
 import hikari
 import lightbulb
-import asyncpraw
-import asyncprawcore
 
 from dotenv import load_dotenv
 
@@ -32,8 +30,14 @@ from hikari.impl import (
 
 from utils.mongo import MongoClient
 from utils.constants import RED_ACCENT, GREEN_ACCENT
+from utils.points_events import publish_points_change
 from ..utilities import utilities
 
+from utils.lazy_import import lazy_import
+
+asyncpraw = lazy_import("asyncpraw")
+asyncprawcore = lazy_import("asyncprawcore")
+
 loader = lightbulb.Loader()
 
 # Configuration
@@ -284,6 +288,7 @@ class ProcessRedditPost(
                                 {"tag": tag},
                                 {"$set": {"points": new_points}}
                             )
+                            publish_points_change(tag)
                             
                             # Send points notification
                             points_components = await create_points_notification(clan_data)
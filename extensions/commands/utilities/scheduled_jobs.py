@@ -0,0 +1,95 @@
+# extensions/commands/utilities/scheduled_jobs.py
+"""
+Scheduled jobs command - inspect the shared job scheduler
+"""
+
+import hikari
+import lightbulb
+
+from hikari.impl import (
+    ContainerComponentBuilder as Container,
+    TextDisplayComponentBuilder as Text,
+    SeparatorComponentBuilder as Separator,
+)
+
+from extensions.commands.utilities import loader
+from utils.constants import BLUE_ACCENT
+from utils.scheduler import describe_jobs, scheduler
+
+# Keep the message within Discord's 4000 character limit across all text components;
+# failing jobs carry an error line, so fewer of them fit
+MAX_JOBS_SHOWN = 25
+JOB_TEXT_BUDGET = 3500
+
+
+def format_job(job: dict) -> str:
+    """One block of text describing a scheduled job"""
+    if job["running"]:
+        next_run = "🔄 running now"
+    elif job["next_run_time"]:
+        next_run = f"<t:{int(job['next_run_time'].timestamp())}:R>"
+    else:
+        next_run = "⏸️ paused"
+
+    duration = f"{job['last_duration']:.2f}s" if job["last_duration"] is not None else "—"
+
+    lines = [
+        f"**{job['id']}** `{job['store']}`",
+        f"Next: {next_run} • Last: {duration} • Runs: {job['runs']} • "
+        f"Missed: {job['missed']} • Errors: {job['errors']}"
+    ]
+    if job["last_error"]:
+        lines.append(f"-# Last error: {job['last_error'][:150]}")
+    return "\n".join(lines)
+
+
+def fit_jobs(jobs: list) -> list:
+    """Rendered blocks for as many jobs as fit within the count and text budget"""
+    blocks, used = [], 0
+    for job in jobs[:MAX_JOBS_SHOWN]:
+        block = format_job(job)
+        if used + len(block) + 2 > JOB_TEXT_BUDGET:
+            break
+        blocks.append(block)
+        used += len(block) + 2
+    return blocks
+
+
+@loader.command
+class ScheduledJobs(
+    lightbulb.SlashCommand,
+    name="scheduled-jobs",
+    description="Inspect scheduled jobs: next run, last duration and missed runs",
+    default_member_permissions=hikari.Permissions.ADMINISTRATOR
+):
+    job_filter = lightbulb.string(
+        "filter",
+        "Only show jobs whose ID contains this text",
+        default=None
+    )
+
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None:
+        jobs = describe_jobs()
+        if self.job_filter:
+            jobs = [job for job in jobs if self.job_filter.lower() in job["id"].lower()]
+
+        state = "running" if scheduler.running else "stopped"
+        components = [
+            Text(content=f"## ⏱️ Scheduled Jobs ({len(jobs)})"),
+            Text(content=f"-# Scheduler is {state} • Durations and missed runs count since last restart"),
+            Separator(divider=True),
+        ]
+
+        if not jobs:
+            components.append(Text(content="*No scheduled jobs*"))
+        else:
+            blocks = fit_jobs(jobs)
+            components.append(Text(content="\n\n".join(blocks)))
+            if len(jobs) > len(blocks):
+                components.append(Text(content=f"-# +{len(jobs) - len(blocks)} more — use the filter option"))
+
+        await ctx.respond(
+            components=[Container(accent_color=BLUE_ACCENT, components=components)],
+            flags=hikari.MessageFlag.EPHEMERAL
+        )
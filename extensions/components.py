@@ -8,6 +8,7 @@ from typing import Callable, Any, get_type_hints
 import datetime
 from typing import Callable
 from utils.mongo import MongoClient
+from utils.metrics import COMPONENT_HANDLERS, COMPONENT_ERRORS, request_timer
 
 from utils.constants import RED_ACCENT
 
@@ -92,24 +93,28 @@ async def component_handler(
     if group:
         if not ctx.interaction.values:
             return
-        function, owner_only, no_return, is_modal, ephemeral, opens_modal, defer_update, group = registered_functions.get(ctx.interaction.values[0])
+        command_name = ctx.interaction.values[0]
+        function, owner_only, no_return, is_modal, ephemeral, opens_modal, defer_update, group = registered_functions.get(command_name)
 
     # Only defer if not a modal AND not opening a modal
     if not is_modal and not opens_modal:
-        await ctx.defer(edit=True)
+        with request_timer("discord", "interaction_defer"):
+            await ctx.defer(edit=True)
 
     kw = await mongo.button_store.find_one({"_id": action_id}, {"_id" : 0})
     kw = kw or {} 
     kw = kw | {"color" : RED_ACCENT, "action_id" : action_id, "ctx": ctx}
     if not kw:
         return
-    components = await function(**kw)
+    with COMPONENT_HANDLERS.time(COMPONENT_ERRORS, action=command_name):
+        components = await function(**kw)
 
     if not no_return:
-        if is_modal:
-            await ctx.respond(components=components, ephemeral=ephemeral)
-        else:
-            await ctx.respond(components=components, edit=True, ephemeral=ephemeral)
+        with request_timer("discord", "interaction_respond"):
+            if is_modal:
+                await ctx.respond(components=components, ephemeral=ephemeral)
+            else:
+                await ctx.respond(components=components, edit=True, ephemeral=ephemeral)
 
 
 
@@ -7,9 +7,13 @@ import hikari
 import lightbulb
 import coc
 from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
 from utils.mongo import MongoClient
 from utils.constants import RED_ACCENT, GOLD_ACCENT
 from utils.emoji import emojis
+from utils.clan_registry import get_clan_docs
+from utils.metrics import request_timer
+from utils.log import get_logger
 
 # Import Components V2
 from hikari.impl import (
@@ -52,6 +56,28 @@ PATTERNS = {
 # Define which patterns are currently active
 ACTIVE_PATTERNS = ["TEST", "FWA_TEST", "CLAN", "FWA"]
 
+# Thread discovery - ticket threads are matched to their parent channel via GuildThreadCreateEvent
+THREAD_WAIT_TIMEOUT = 10  # Seconds to wait for the ticket thread before a one-off REST scan
+RECENT_THREAD_TTL = 120  # Seconds to remember threads that arrive before their channel is handled
+
+# ClashKing ticket API retries (exponential backoff: base, 2x base, 4x base, ...)
+TICKET_API_URL = "https://api.clashk.ing/ticketing/open/json/{channel_id}"
+api_log = get_logger("Ticket API")
+API_MAX_ATTEMPTS = 4
+API_BASE_DELAY = 1
+API_MAX_DELAY = 30
+BACKGROUND_API_ATTEMPTS = 5
+BACKGROUND_API_BASE_DELAY = 10
+
+# Parent channel ID -> future resolved with the thread ID
+pending_threads: Dict[int, asyncio.Future] = {}
+# Parent channel ID -> (thread ID, seen at) for threads created before anyone waited on them
+recent_threads: Dict[int, Tuple[int, float]] = {}
+
+# Manual tickets (/ticket create) whose MongoDB state is still being written
+MANUAL_STATE_TIMEOUT = 15
+manual_tickets: Dict[int, asyncio.Event] = {}
+
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
@@ -67,6 +93,157 @@ async def on_bot_started(
     print("[INFO] Ticket channel monitor ready with MongoDB and CoC connections")
 
 
+def _backoff_delay(attempt: int, base_delay: float) -> float:
+    """Delay before retry number `attempt` (1-based)"""
+    return min(base_delay * (2 ** (attempt - 1)), API_MAX_DELAY)
+
+
+async def fetch_ticket_api_data(
+    channel_id: int,
+    max_attempts: int = API_MAX_ATTEMPTS,
+    base_delay: float = API_BASE_DELAY,
+    timeout: int = 15,
+    initial_delay: float = 0
+) -> Optional[dict]:
+    """Fetch ticket data from the ClashKing API, retrying server/connection errors with exponential backoff"""
+    if initial_delay:
+        await asyncio.sleep(initial_delay)
+
+    api_url = TICKET_API_URL.format(channel_id=channel_id)
+
+    async with aiohttp.ClientSession() as session:
+        for attempt in range(1, max_attempts + 1):
+            try:
+                api_log.debug("Making API call", url=api_url, attempt=f"{attempt}/{max_attempts}")
+
+                with request_timer("clashking", "ticketing_open"):
+                    async with session.get(api_url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                        if response.status == 200:
+                            api_data = await response.json()
+                            api_log.debug("API response", data=api_data)
+                            return api_data
+                        elif 400 <= response.status < 500:
+                            # Client error (4xx) - don't retry
+                            print(f"[ERROR] API returned client error status {response.status}")
+                            return None
+                        else:
+                            # Server error (5xx) or other - retry
+                            print(f"[ERROR] API returned status {response.status}")
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"[ERROR] Failed to call API (attempt {attempt}/{max_attempts}): {e}")
+            except Exception as e:
+                print(f"[ERROR] Unexpected error calling API: {e}")
+                return None  # Don't retry on unexpected errors
+
+            if attempt < max_attempts:
+                wait_time = _backoff_delay(attempt, base_delay)
+                print(f"[INFO] Retrying API call in {wait_time} seconds...")
+                await asyncio.sleep(wait_time)
+
+    print(f"[ERROR] Max API retries reached")
+    return None
+
+
+def match_ticket_pattern(channel_name: str) -> Optional[str]:
+    """Key of the active pattern a channel name contains, if any"""
+    for pattern_key in ACTIVE_PATTERNS:
+        if pattern_key in PATTERNS and PATTERNS[pattern_key] in channel_name:
+            return pattern_key
+    return None
+
+
+def register_manual_ticket(channel_id: int, channel_name: str) -> None:
+    """Called by /ticket create right after it creates a channel, before its state is stored"""
+    # on_channel_create ignores other channels, so nothing would ever wait on (and remove) the entry
+    if match_ticket_pattern(channel_name):
+        manual_tickets.setdefault(int(channel_id), asyncio.Event())
+
+
+def manual_ticket_stored(channel_id: int) -> None:
+    """Called by /ticket create once the ticket_automation_state document exists"""
+    event = manual_tickets.get(int(channel_id))
+    if event:
+        event.set()
+
+
+async def wait_for_manual_ticket_state(channel_id: int) -> None:
+    """If this channel is a manual ticket, wait until its stored state is written"""
+    event = manual_tickets.get(int(channel_id))
+    if not event:
+        return
+
+    try:
+        await asyncio.wait_for(event.wait(), timeout=MANUAL_STATE_TIMEOUT)
+    except asyncio.TimeoutError:
+        print(f"[WARNING] Manual ticket state for {channel_id} not stored after {MANUAL_STATE_TIMEOUT}s")
+    finally:
+        manual_tickets.pop(int(channel_id), None)
+
+
+def _prune_recent_threads():
+    """Drop remembered threads older than RECENT_THREAD_TTL"""
+    cutoff = asyncio.get_running_loop().time() - RECENT_THREAD_TTL
+    for parent_id, (_, seen_at) in list(recent_threads.items()):
+        if seen_at < cutoff:
+            recent_threads.pop(parent_id, None)
+
+
+@loader.listener(hikari.GuildThreadCreateEvent)
+async def on_thread_create(event: hikari.GuildThreadCreateEvent) -> None:
+    """Correlate new threads with ticket channels waiting for them"""
+    thread = event.thread
+    parent_id = thread.parent_id
+
+    future = pending_threads.get(parent_id)
+    if future and not future.done():
+        future.set_result(thread.id)
+        return
+
+    # The channel may not have been handled yet - remember the thread briefly
+    _prune_recent_threads()
+    recent_threads[parent_id] = (thread.id, asyncio.get_running_loop().time())
+
+
+async def wait_for_ticket_thread(event: hikari.GuildChannelCreateEvent, channel_id: int) -> Optional[int]:
+    """Wait for the ticket thread in a channel, falling back to a single REST scan on timeout"""
+    recent = recent_threads.pop(channel_id, None)
+    if recent:
+        print(f"[DEBUG] Found thread {recent[0]} in channel {channel_id}")
+        return recent[0]
+
+    future = asyncio.get_running_loop().create_future()
+    pending_threads[channel_id] = future
+    try:
+        thread_id = await asyncio.wait_for(future, timeout=THREAD_WAIT_TIMEOUT)
+        print(f"[DEBUG] Found thread {thread_id} in channel {channel_id}")
+        return thread_id
+    except asyncio.TimeoutError:
+        print(f"[DEBUG] No thread event for channel {channel_id} after {THREAD_WAIT_TIMEOUT}s, scanning once")
+    finally:
+        pending_threads.pop(channel_id, None)
+
+    try:
+        active_threads = await event.app.rest.fetch_active_threads(event.guild_id)
+        for thread in active_threads:
+            if thread.parent_id == channel_id:
+                print(f"[DEBUG] Found thread {thread.id} in channel {channel_id}")
+                return thread.id
+
+        # Also check for archived threads (in case it was instantly archived)
+        if event.channel.type == hikari.ChannelType.GUILD_FORUM:
+            # For forum channels, threads are the posts
+            threads = await event.app.rest.fetch_public_archived_threads(channel_id)
+            if threads:
+                # Get the most recent thread
+                print(f"[DEBUG] Found forum post/thread: {threads[0].id}")
+                return threads[0].id
+    except Exception as e:
+        print(f"[DEBUG] Error fetching threads: {e}")
+
+    return None
+
+
 async def retry_api_for_full_data(
     channel_id: int,
     thread_id: str,
@@ -76,105 +253,103 @@ async def retry_api_for_full_data(
     coc: coc.Client
 ) -> None:
     """Background task to retry API and get full ticket data after fallback"""
-    print(f"[INFO] Background retry scheduled for channel {channel_id}, waiting 60 seconds...")
-    await asyncio.sleep(60)
-    
-    print(f"[INFO] Starting background API retry for channel {channel_id}")
-    
+    print(f"[INFO] Background retry started for channel {channel_id}")
+
     try:
-        async with aiohttp.ClientSession() as session:
-            api_url = f"https://api.clashk.ing/ticketing/open/json/{channel_id}"
-            print(f"[DEBUG] Background API call to: {api_url}")
-            
-            async with session.get(api_url, timeout=aiohttp.ClientTimeout(total=20)) as response:
-                if response.status == 200:
-                    api_data = await response.json()
-                    print(f"[SUCCESS] Background API call succeeded: {api_data}")
-                    
-                    # Only proceed if we got a player tag
-                    if api_data.get('apply_account'):
-                        player_tag = api_data.get('apply_account')
-                        player_data = None
-                        
-                        # Try to fetch player data
-                        if coc:
-                            try:
-                                player_data = await coc.get_player(player_tag)
-                                print(f"[SUCCESS] Retrieved player data: {player_data.name} (TH{player_data.town_hall})")
-                            except Exception as e:
-                                print(f"[ERROR] Failed to fetch player data in background: {e}")
-                        
-                        # Update MongoDB with full data
-                        if mongo:
-                            try:
-                                from datetime import datetime, timedelta, timezone
-                                now = datetime.now(timezone.utc)
-                                
-                                # Update the existing new_recruits document with full data
-                                update_result = await mongo.new_recruits.update_one(
-                                    {"ticket_channel_id": str(channel_id)},
-                                    {
-                                        "$set": {
-                                            "player_tag": player_tag,
-                                            "player_name": player_data.name if player_data else None,
-                                            "player_th_level": player_data.town_hall if player_data else None,
-                                            "api_data_retrieved": True,
-                                            "api_data_retrieved_at": now
-                                        }
-                                    }
-                                )
-                                
-                                if update_result.modified_count > 0:
-                                    print(f"[SUCCESS] Updated MongoDB with full ticket data for channel {channel_id}")
-                                else:
-                                    # Document doesn't exist yet, create it
-                                    recruit_doc = {
-                                        "player_tag": player_tag,
-                                        "player_name": player_data.name if player_data else None,
-                                        "player_th_level": player_data.town_hall if player_data else None,
-                                        "discord_user_id": str(user_id),
-                                        "ticket_channel_id": str(channel_id),
-                                        "ticket_thread_id": str(thread_id) if thread_id else None,
-                                        "created_at": now,
-                                        "expires_at": now + timedelta(days=12),
-                                        "recruitment_history": [],
-                                        "current_clan": None,
-                                        "total_clans_joined": 0,
-                                        "is_expired": False,
-                                        "activeBid": False,
-                                        "ticket_open": True,
-                                        "api_data_retrieved": True,
-                                        "api_data_retrieved_at": now
-                                    }
-                                    await mongo.new_recruits.insert_one(recruit_doc)
-                                    print(f"[SUCCESS] Created new MongoDB document with full ticket data")
-                                    
-                                # Also update ticket automation state if it exists
-                                await mongo.ticket_automation_state.update_one(
-                                    {"_id": str(channel_id)},
-                                    {
-                                        "$set": {
-                                            "ticket_info.user_tag": player_tag,
-                                            "player_info.player_tag": player_tag,
-                                            "player_info.player_name": player_data.name if player_data else None,
-                                            "player_info.town_hall": player_data.town_hall if player_data else None,
-                                            "player_info.clan_tag": player_data.clan.tag if player_data and player_data.clan else None,
-                                            "player_info.clan_name": player_data.clan.name if player_data and player_data.clan else None,
-                                            "ticket_info.ticket_number": api_data.get('number'),
-                                            "api_recovered": True,
-                                            "api_recovered_at": now
-                                        }
-                                    }
-                                )
-                                print(f"[SUCCESS] Updated ticket automation state with recovered data")
-                                
-                            except Exception as e:
-                                print(f"[ERROR] Failed to update MongoDB in background: {e}")
-                    else:
-                        print(f"[WARNING] Background API succeeded but no player tag found")
-                else:
-                    print(f"[ERROR] Background API returned status {response.status}")
-                    
+        api_data = await fetch_ticket_api_data(
+            channel_id,
+            max_attempts=BACKGROUND_API_ATTEMPTS,
+            base_delay=BACKGROUND_API_BASE_DELAY,
+            timeout=20,
+            initial_delay=BACKGROUND_API_BASE_DELAY
+        )
+        if api_data:
+            print(f"[SUCCESS] Background API call succeeded: {api_data}")
+
+            # Only proceed if we got a player tag
+            if api_data.get('apply_account'):
+                player_tag = api_data.get('apply_account')
+                player_data = None
+
+                # Try to fetch player data
+                if coc:
+                    try:
+                        player_data = await coc.get_player(player_tag)
+                        print(f"[SUCCESS] Retrieved player data: {player_data.name} (TH{player_data.town_hall})")
+                    except Exception as e:
+                        print(f"[ERROR] Failed to fetch player data in background: {e}")
+
+                # Update MongoDB with full data
+                if mongo:
+                    try:
+                        from datetime import datetime, timedelta, timezone
+                        now = datetime.now(timezone.utc)
+
+                        # Update the existing new_recruits document with full data
+                        update_result = await mongo.new_recruits.update_one(
+                            {"ticket_channel_id": str(channel_id)},
+                            {
+                                "$set": {
+                                    "player_tag": player_tag,
+                                    "player_name": player_data.name if player_data else None,
+                                    "player_th_level": player_data.town_hall if player_data else None,
+                                    "api_data_retrieved": True,
+                                    "api_data_retrieved_at": now
+                                }
+                            }
+                        )
+
+                        if update_result.modified_count > 0:
+                            print(f"[SUCCESS] Updated MongoDB with full ticket data for channel {channel_id}")
+                        else:
+                            # Document doesn't exist yet, create it
+                            recruit_doc = {
+                                "player_tag": player_tag,
+                                "player_name": player_data.name if player_data else None,
+                                "player_th_level": player_data.town_hall if player_data else None,
+                                "discord_user_id": str(user_id),
+                                "ticket_channel_id": str(channel_id),
+                                "ticket_thread_id": str(thread_id) if thread_id else None,
+                                "created_at": now,
+                                "expires_at": now + timedelta(days=12),
+                                "recruitment_history": [],
+                                "current_clan": None,
+                                "total_clans_joined": 0,
+                                "is_expired": False,
+                                "activeBid": False,
+                                "ticket_open": True,
+                                "api_data_retrieved": True,
+                                "api_data_retrieved_at": now
+                            }
+                            await mongo.new_recruits.insert_one(recruit_doc)
+                            print(f"[SUCCESS] Created new MongoDB document with full ticket data")
+
+                        # Also update ticket automation state if it exists
+                        await mongo.ticket_automation_state.update_one(
+                            {"_id": str(channel_id)},
+                            {
+                                "$set": {
+                                    "ticket_info.user_tag": player_tag,
+                                    "player_info.player_tag": player_tag,
+                                    "player_info.player_name": player_data.name if player_data else None,
+                                    "player_info.town_hall": player_data.town_hall if player_data else None,
+                                    "player_info.clan_tag": player_data.clan.tag if player_data and player_data.clan else None,
+                                    "player_info.clan_name": player_data.clan.name if player_data and player_data.clan else None,
+                                    "ticket_info.ticket_number": api_data.get('number'),
+                                    "api_recovered": True,
+                                    "api_recovered_at": now
+                                }
+                            }
+                        )
+                        print(f"[SUCCESS] Updated ticket automation state with recovered data")
+
+                    except Exception as e:
+                        print(f"[ERROR] Failed to update MongoDB in background: {e}")
+            else:
+                print(f"[WARNING] Background API succeeded but no player tag found")
+        else:
+            print(f"[ERROR] Background API retry gave up for channel {channel_id}")
+
     except Exception as e:
         print(f"[ERROR] Background API retry failed: {e}")
     
@@ -192,80 +367,21 @@ async def on_channel_create(event: hikari.GuildChannelCreateEvent) -> None:
     print(f"[DEBUG] New channel created: {channel_name} (ID: {event.channel.id})")
 
     # Check if the channel name contains any of the active patterns
-    matched = False
-    matched_pattern = None
-    for pattern_key in ACTIVE_PATTERNS:
-        if pattern_key in PATTERNS and PATTERNS[pattern_key] in channel_name:
-            matched = True
-            matched_pattern = pattern_key
-            print(f"[DEBUG] Channel matches pattern: {pattern_key}")
-            break
+    matched_pattern = match_ticket_pattern(channel_name)
 
     # If no match, return early
-    if not matched:
+    if not matched_pattern:
         return
-
-    # Wait 3 seconds before proceeding
-    await asyncio.sleep(5)
+    print(f"[DEBUG] Channel matches pattern: {matched_pattern}")
 
     # Get the channel ID
     channel_id = event.channel.id
 
-    # Try to find any threads in this channel
-    thread_id = None
-    try:
-        # Fetch active threads for the guild
-        active_threads = await event.app.rest.fetch_active_threads(event.guild_id)
+    # Wait for the ticket bot's thread instead of sleeping and scanning the guild
+    thread_id = await wait_for_ticket_thread(event, channel_id)
 
-        # Look for a thread in our channel
-        for thread in active_threads:
-            if thread.parent_id == channel_id:
-                thread_id = thread.id
-                print(f"[DEBUG] Found thread {thread_id} in channel {channel_id}")
-                break
-
-        # If no active thread found, try to fetch the channel to see if it's a thread
-        if not thread_id:
-            # Sometimes the "channel" itself might be a thread
-            channel_info = await event.app.rest.fetch_channel(channel_id)
-            if channel_info.type in [hikari.ChannelType.GUILD_PUBLIC_THREAD,
-                                     hikari.ChannelType.GUILD_PRIVATE_THREAD,
-                                     hikari.ChannelType.GUILD_NEWS_THREAD]:
-                # The channel itself is a thread
-                thread_id = channel_id
-                channel_id = channel_info.parent_id
-                print(f"[DEBUG] The created channel is actually a thread")
-
-        # If still no thread found, wait a bit more and check again
-        # (sometimes thread creation is delayed)
-        if not thread_id:
-            await asyncio.sleep(2)  # Wait 2 more seconds
-            try:
-                active_threads = await event.app.rest.fetch_active_threads(event.guild_id)
-                for thread in active_threads:
-                    if thread.parent_id == channel_id:
-                        thread_id = thread.id
-                        print(f"[DEBUG] Found thread {thread_id} after additional wait")
-                        break
-            except Exception as e:
-                print(f"[DEBUG] Error on second thread fetch attempt: {e}")
-
-        # Also check for archived threads (in case it was instantly archived)
-        if not thread_id:
-            try:
-                # Check if the channel is a forum channel
-                if event.channel.type == hikari.ChannelType.GUILD_FORUM:
-                    # For forum channels, threads are the posts
-                    threads = await event.app.rest.fetch_public_archived_threads(channel_id)
-                    if threads:
-                        # Get the most recent thread
-                        thread_id = threads[0].id
-                        print(f"[DEBUG] Found forum post/thread: {thread_id}")
-            except Exception as e:
-                print(f"[DEBUG] Error checking for forum threads: {e}")
-
-    except Exception as e:
-        print(f"[DEBUG] Error fetching threads: {e}")
+    # Manual tickets write their state after creating the thread
+    await wait_for_manual_ticket_state(channel_id)
 
     # Check MongoDB first for existing ticket data (e.g., from manual creation)
     api_data = None
@@ -331,48 +447,7 @@ async def on_channel_create(event: hikari.GuildChannelCreateEvent) -> None:
     # Only make API call if we don't have data from MongoDB
     if not api_data:
         print(f"[INFO] No existing MongoDB data found, proceeding with API call")
-        max_api_retries = 3
-        api_retry_count = 0
-        retry_delays = [3, 15, 30]  # Custom delays in seconds for each retry
-    
-    while not api_data and api_retry_count < max_api_retries:
-        try:
-            async with aiohttp.ClientSession() as session:
-                api_url = f"https://api.clashk.ing/ticketing/open/json/{channel_id}"
-                print(f"[DEBUG] Making API call to: {api_url} (attempt {api_retry_count + 1}/{max_api_retries})")
-
-                async with session.get(api_url, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                    if response.status == 200:
-                        api_data = await response.json()
-                        print(f"[DEBUG] API response: {api_data}")
-                        break  # Success, exit retry loop
-                    elif 400 <= response.status < 500:
-                        # Client error (4xx) - don't retry
-                        print(f"[ERROR] API returned client error status {response.status}")
-                        break
-                    else:
-                        # Server error (5xx) or other - retry
-                        print(f"[ERROR] API returned status {response.status}")
-                        api_retry_count += 1
-                        if api_retry_count < max_api_retries:
-                            wait_time = retry_delays[api_retry_count - 1]  # Use custom delays: 3s, 15s, 30s
-                            print(f"[INFO] Retrying API call in {wait_time} seconds...")
-                            await asyncio.sleep(wait_time)
-                        else:
-                            print(f"[ERROR] Max API retries reached")
-                            
-        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            api_retry_count += 1
-            print(f"[ERROR] Failed to call API (attempt {api_retry_count}/{max_api_retries}): {e}")
-            if api_retry_count < max_api_retries:
-                wait_time = retry_delays[api_retry_count - 1]  # Use custom delays: 3s, 15s, 30s
-                print(f"[INFO] Retrying API call in {wait_time} seconds...")
-                await asyncio.sleep(wait_time)
-            else:
-                print(f"[ERROR] Max API retries reached due to connection error")
-        except Exception as e:
-            print(f"[ERROR] Unexpected error calling API: {e}")
-            break  # Don't retry on unexpected errors
+        api_data = await fetch_ticket_api_data(channel_id)
     
     # If API failed, try to extract user from channel permissions as fallback
     if not api_data:
@@ -400,7 +475,7 @@ async def on_channel_create(event: hikari.GuildChannelCreateEvent) -> None:
                         }
                         print(f"[SUCCESS] Extracted user {override_id} from channel permissions")
                         
-                        # Schedule background retry to get full data after 60 seconds
+                        # Schedule background retry (with backoff) to get full data
                         print(f"[INFO] Scheduling background API retry for full data")
                         asyncio.create_task(
                             retry_api_for_full_data(
@@ -554,6 +629,11 @@ async def on_channel_create(event: hikari.GuildChannelCreateEvent) -> None:
                 await mongo_client.ticket_automation_state.insert_one(automation_doc)
                 print(f"[DEBUG] Created ticket automation state for channel {channel_id}")
 
+                # Keep the manual ticket counter ahead of ClashKing's numbering
+                if api_data.get('number'):
+                    from extensions.commands.ticket.create import record_ticket_number
+                    await record_ticket_number(mongo_client, api_data.get('number'))
+
             except Exception as e:
                 print(f"[ERROR] Failed to create ticket automation state: {e}")
                 # Don't fail the whole process if automation state fails
@@ -688,7 +768,7 @@ async def on_channel_create(event: hikari.GuildChannelCreateEvent) -> None:
                     return
 
                 # Get all family clans
-                family_clans = await mongo_client.clans.find().to_list(length=None)
+                family_clans = await get_clan_docs(mongo_client)
                 if not family_clans:
                     return
 
@@ -10,6 +10,8 @@ from typing import Optional, Dict, List
 from utils.mongo import MongoClient
 from utils.constants import RED_ACCENT, GOLD_ACCENT, GREEN_ACCENT
 from utils.emoji import emojis
+from utils.points_events import publish_points_change
+from extensions.tasks import roster_watch
 
 # Import Components V2
 from hikari.impl import (
@@ -43,6 +45,15 @@ PATTERNS = {
 # Define which patterns are currently active
 ACTIVE_PATTERNS = ["TEST", "CLAN"]  # Only TEST is active for now
 
+# Ticket closure processing
+CLOSURE_WORKERS = 3  # Tickets processed in parallel
+MAX_CONCURRENT_RECRUITS = 5  # Per-ticket recruit concurrency (CoC lookups and outcome processing)
+CLOSURE_SETTLE_DELAY = 1  # Seconds to let in-flight database writes land
+
+# Work queue so the gateway listener never blocks on closure processing
+closure_queue: Optional[asyncio.Queue] = None
+closure_workers: List[asyncio.Task] = []
+
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
@@ -56,11 +67,17 @@ async def on_bot_started(
     mongo_client = mongo
     coc_client = coc_api
     bot_instance = event.app
+    ensure_closure_workers()
     print("[INFO] Ticket close monitor ready with MongoDB and CoC connections")
 
 
 async def check_player_clan_membership(player_tag: str) -> Optional[Dict]:
     """Check if player joined any clan and get clan details"""
+    # A fresh roster from the roster watch answers without an API call
+    watched_clan = roster_watch.get_member_clan(player_tag)
+    if watched_clan:
+        return watched_clan
+
     try:
         player = await coc_client.get_player(player_tag)
         if player.clan:
@@ -176,6 +193,175 @@ async def update_recruit_history(recruit: Dict, clan_tag: str):
         print(f"[ERROR] Failed to update recruit history: {e}")
 
 
+async def process_closed_recruit(
+        recruit: Dict,
+        bid_data: Optional[Dict],
+        player_clan: Optional[Dict],
+        db_clan: Optional[Dict],
+        bot_app
+):
+    """Resolve the outcome for a single recruit of a closed ticket"""
+    player_tag = recruit["player_tag"]
+    print(f"[DEBUG] Processing recruit: {player_tag}")
+
+    # For this scenario, we only handle no bids + joined our clan
+    if bid_data and bid_data.get("bids", []):
+        print(f"[DEBUG] Recruit {player_tag} has bids - processing with-bids scenario")
+
+        # Process with-bids scenario
+        await process_with_bids_recruitment(recruit, bid_data, player_clan, db_clan, bot_app)
+
+        # Clean up clan_bidding document
+        await mongo_client.clan_bidding.delete_one({"player_tag": player_tag})
+        print(f"[DEBUG] Deleted clan_bidding document for {player_tag}")
+        return
+
+    if not player_clan:
+        print(f"[DEBUG] Player {player_tag} has not joined any clan")
+        # Process the "didn't join any clan" scenario
+        await process_no_clan_joined(recruit, bid_data, bot_app)
+        return
+
+    print(f"[DEBUG] Player {player_tag} joined clan: {player_clan['name']} ({player_clan['tag']})")
+
+    if not db_clan:
+        print(f"[DEBUG] Clan {player_clan['tag']} not in our database")
+        # Process external clan join
+        await process_external_clan_join(recruit, player_clan, bid_data, bot_app)
+
+        # Update recruit record
+        await mongo_client.new_recruits.update_one(
+            {"_id": recruit["_id"]},
+            {
+                "$set": {
+                    "ticket_closed_at": datetime.now(timezone.utc),
+                    "recruitment_outcome": "external_clan",
+                    "external_clan_tag": player_clan["tag"],
+                    "external_clan_name": player_clan["name"]
+                }
+            }
+        )
+
+        # Delete any bids if they exist
+        if bid_data:
+            await mongo_client.clan_bidding.delete_one({"player_tag": player_tag})
+            print(f"[DEBUG] Deleted clan_bidding document for {player_tag} (external clan)")
+        return
+
+    print(f"[INFO] Processing no-bid recruitment: {player_tag} -> {db_clan['name']}")
+
+    # Process the recruitment outcome
+    await process_no_bids_recruitment(recruit, player_clan, db_clan, bot_app)
+
+    # Update recruit history
+    await update_recruit_history(recruit, player_clan["tag"])
+
+    # Delete any bid documents (cleanup)
+    if bid_data:
+        await mongo_client.clan_bidding.delete_one({"player_tag": player_tag})
+        print(f"[DEBUG] Deleted clan_bidding document for {player_tag} (no-bid recruitment)")
+
+
+async def process_ticket_closure(channel_id: str, bot_app):
+    """Process every recruit of a closed ticket with prefetched data and bounded concurrency"""
+
+    # Wait a moment to ensure database operations complete
+    await asyncio.sleep(CLOSURE_SETTLE_DELAY)
+
+    # Look up all recruits associated with this ticket channel
+    recruits = await mongo_client.new_recruits.find({
+        "ticket_channel_id": channel_id,
+        "is_expired": False
+    }).to_list(length=None)
+
+    if not recruits:
+        print(f"[DEBUG] No active recruits found for channel {channel_id}")
+        return
+
+    print(f"[INFO] Found {len(recruits)} recruit(s) for closed ticket {channel_id}")
+
+    # Mark all recruits for this ticket as closed
+    await mongo_client.new_recruits.update_many(
+        {"ticket_channel_id": channel_id},
+        {"$set": {"ticket_open": False}}
+    )
+    print(f"[DEBUG] Marked {len(recruits)} recruit(s) as ticket_open=False")
+
+    recruits = [r for r in recruits if r.get("player_tag")]
+    player_tags = [r["player_tag"] for r in recruits]
+
+    # Prefetch all bids for this ticket in one query
+    bid_docs = await mongo_client.clan_bidding.find({
+        "player_tag": {"$in": player_tags}
+    }).to_list(length=None)
+    bids_by_player = {doc["player_tag"]: doc for doc in bid_docs}
+
+    # Look up clan membership for every account concurrently
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_RECRUITS)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+
+    player_clans = await asyncio.gather(
+        *(bounded(check_player_clan_membership(tag)) for tag in player_tags)
+    )
+
+    # Prefetch every joined clan from our database in one query
+    joined_tags = list({pc["tag"] for pc in player_clans if pc})
+    clans_by_tag = {}
+    if joined_tags:
+        clan_docs = await mongo_client.clans.find({
+            "tag": {"$in": joined_tags}
+        }).to_list(length=None)
+        clans_by_tag = {doc["tag"]: doc for doc in clan_docs}
+
+    results = await asyncio.gather(
+        *(
+            bounded(process_closed_recruit(
+                recruit,
+                bids_by_player.get(recruit["player_tag"]),
+                player_clan,
+                clans_by_tag.get(player_clan["tag"]) if player_clan else None,
+                bot_app
+            ))
+            for recruit, player_clan in zip(recruits, player_clans)
+        ),
+        return_exceptions=True
+    )
+
+    for recruit, result in zip(recruits, results):
+        if isinstance(result, Exception):
+            print(f"[ERROR] Failed to process closed-ticket recruit {recruit['player_tag']}: {result}")
+
+
+async def closure_worker():
+    """Drain the ticket closure queue"""
+    while True:
+        channel_id, bot_app = await closure_queue.get()
+        try:
+            await process_ticket_closure(channel_id, bot_app)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[ERROR] Failed to process ticket closure: {e}")
+        finally:
+            closure_queue.task_done()
+
+
+def ensure_closure_workers():
+    """Start the closure workers on first use"""
+    global closure_queue
+
+    if closure_queue is None:
+        closure_queue = asyncio.Queue()
+
+    alive = [t for t in closure_workers if not t.done()]
+    closure_workers[:] = alive
+    for _ in range(CLOSURE_WORKERS - len(alive)):
+        closure_workers.append(asyncio.create_task(closure_worker()))
+
+
 @loader.listener(hikari.GuildChannelDeleteEvent)
 async def on_channel_delete(event: hikari.GuildChannelDeleteEvent) -> None:
     """Handle channel deletion events for ticket closures"""
@@ -200,113 +386,18 @@ async def on_channel_delete(event: hikari.GuildChannelDeleteEvent) -> None:
     if not matched:
         return
 
-    # Wait a moment to ensure database operations complete
-    await asyncio.sleep(1)
-
-    # Look up all recruits associated with this ticket channel
-    try:
-        recruits = await mongo_client.new_recruits.find({
-            "ticket_channel_id": channel_id,
-            "is_expired": False
-        }).to_list(length=None)
+    # Hand off to the workers so the gateway listener returns immediately
+    ensure_closure_workers()
+    closure_queue.put_nowait((channel_id, event.app))
 
-        if not recruits:
-            print(f"[DEBUG] No active recruits found for channel {channel_id}")
-            return
 
-        print(f"[INFO] Found {len(recruits)} recruit(s) for closed ticket {channel_id}")
-        
-        # Mark all recruits for this ticket as closed
-        await mongo_client.new_recruits.update_many(
-            {"ticket_channel_id": channel_id},
-            {"$set": {"ticket_open": False}}
-        )
-        print(f"[DEBUG] Marked {len(recruits)} recruit(s) as ticket_open=False")
-
-        # Process each recruit
-        for recruit in recruits:
-            player_tag = recruit.get("player_tag")
-            if not player_tag:
-                continue
-
-            print(f"[DEBUG] Processing recruit: {player_tag}")
-
-            # Check if any bids were placed (finalized or not)
-            bid_data = await mongo_client.clan_bidding.find_one({
-                "player_tag": player_tag
-            })
-
-            # Check what clan the player joined
-            player_clan = await check_player_clan_membership(player_tag)
-
-            # For this scenario, we only handle no bids + joined our clan
-            if bid_data and bid_data.get("bids", []):
-                print(f"[DEBUG] Recruit {player_tag} has bids - processing with-bids scenario")
-                
-                # Check if the clan is in our database (if they joined one)
-                db_clan = None
-                if player_clan:
-                    db_clan = await get_clan_from_db(player_clan["tag"])
-                
-                # Process with-bids scenario
-                await process_with_bids_recruitment(recruit, bid_data, player_clan, db_clan, event.app)
-                
-                # Clean up clan_bidding document
-                await mongo_client.clan_bidding.delete_one({"player_tag": player_tag})
-                print(f"[DEBUG] Deleted clan_bidding document for {player_tag}")
-                continue
-
-            if not player_clan:
-                print(f"[DEBUG] Player {player_tag} has not joined any clan")
-                # Process the "didn't join any clan" scenario
-                # FIX: Pass bid_data as second argument
-                await process_no_clan_joined(recruit, bid_data, event.app)
-                continue
-
-            print(f"[DEBUG] Player {player_tag} joined clan: {player_clan['name']} ({player_clan['tag']})")
-
-            # Check if the clan is in our database
-            db_clan = await get_clan_from_db(player_clan["tag"])
-
-            if not db_clan:
-                print(f"[DEBUG] Clan {player_clan['tag']} not in our database")
-                # Process external clan join
-                await process_external_clan_join(recruit, player_clan, bid_data, event.app)
-
-                # Update recruit record
-                await mongo_client.new_recruits.update_one(
-                    {"_id": recruit["_id"]},
-                    {
-                        "$set": {
-                            "ticket_closed_at": datetime.now(timezone.utc),
-                            "recruitment_outcome": "external_clan",
-                            "external_clan_tag": player_clan["tag"],
-                            "external_clan_name": player_clan["name"]
-                        }
-                    }
-                )
-
-                # Delete any bids if they exist
-                if bid_data:
-                    await mongo_client.clan_bidding.delete_one({"player_tag": player_tag})
-                    print(f"[DEBUG] Deleted clan_bidding document for {player_tag} (external clan)")
-                continue
-
-            print(f"[INFO] Processing no-bid recruitment: {player_tag} -> {db_clan['name']}")
-
-            # Process the recruitment outcome
-            await process_no_bids_recruitment(recruit, player_clan, db_clan, event.app)
-
-            # Update recruit history
-            await update_recruit_history(recruit, player_clan["tag"])
-
-            # Delete any bid documents (cleanup)
-            if bid_data:
-                await mongo_client.clan_bidding.delete_one({"player_tag": player_tag})
-                print(f"[DEBUG] Deleted clan_bidding document for {player_tag} (no-bid recruitment)")
-
-    except Exception as e:
-        print(f"[ERROR] Failed to process ticket closure: {e}")
+@loader.listener(hikari.StoppingEvent)
+async def on_bot_stopping(event: hikari.StoppingEvent) -> None:
+    """Cancel closure workers when bot stops"""
+    for task in closure_workers:
+        if not task.done():
+            task.cancel()
+    closure_workers.clear()
 
 
 # Additional handler for other recruitment outcome scenarios
@@ -441,6 +532,7 @@ async def process_with_bids_recruitment(recruit: Dict, bid_data: Dict, player_cl
                 {"tag": winner_tag},
                 {"$inc": {"points": -winning_amount}}
             )
+            publish_points_change(winner_tag)
 
             # Import and use safe_adjust_placeholder_points
             from extensions.commands.recruit.bidding import safe_adjust_placeholder_points
@@ -556,6 +648,7 @@ async def process_with_bids_recruitment(recruit: Dict, bid_data: Dict, player_cl
                         {"tag": winner_tag},
                         {"$inc": {"points": winning_amount}}
                     )
+                    publish_points_change(winner_tag)
                     print(f"[INFO] Refunded {winning_amount} points to {winning_clan['name']} (bidding was finalized)")
                 else:
                     # Bidding never completed - points were never deducted
@@ -7,7 +7,7 @@ import hikari
 import lightbulb
 import asyncio
 import random
-from typing import Optional
+from typing import Dict, Optional
 from utils.mongo import MongoClient
 from utils import bot_data
 
@@ -16,6 +16,84 @@ mongo_client: Optional[MongoClient] = None
 bot_instance: Optional[hikari.GatewayBot] = None
 loader = lightbulb.Loader()
 
+COUNTING_CHANNEL_ID = "1024845669820796928"
+
+
+class CountingState:
+    """In-memory counting state for one channel; Mongo is written behind it"""
+
+    def __init__(self, data: dict):
+        self.channel_id: str = data["channel_id"]
+        self.current_number: int = data.get("current_number", 0)
+        self.last_counter_id: Optional[str] = data.get("last_counter_id")
+        self.enabled: bool = data.get("enabled", True)
+        # Last number known to be stored in Mongo
+        self.persisted_number: int = self.current_number
+        # Serializes validation so two simultaneous "next numbers" can't both be accepted
+        self.lock = asyncio.Lock()
+        self.flush_task: Optional[asyncio.Task] = None
+
+
+_states: Dict[str, CountingState] = {}
+
+
+async def get_counting_state(channel_id: str) -> Optional[CountingState]:
+    """Return the cached state for a channel, loading it from Mongo once"""
+    state = _states.get(channel_id)
+    if state:
+        return state
+
+    channel_data = await mongo_client.counting_channels.find_one({"channel_id": channel_id})
+    if not channel_data:
+        return None
+
+    # Another message may have loaded it while we were waiting
+    return _states.setdefault(channel_id, CountingState(channel_data))
+
+
+async def invalidate_counting_state(channel_id: str = COUNTING_CHANNEL_ID) -> None:
+    """Drop cached state after an external write (set-number, toggle) so it is reloaded"""
+    state = _states.get(channel_id)
+
+    # Let accepted counts reach Mongo first, so the reload sees them and the old
+    # state's flush can't land on top of the reloaded one
+    while state and state.flush_task and not state.flush_task.done():
+        await asyncio.shield(state.flush_task)
+
+    if _states.get(channel_id) is state:
+        _states.pop(channel_id, None)
+
+
+async def _flush_counting_state(state: CountingState) -> None:
+    """Write accepted counts to Mongo, conditional on the number we last stored"""
+    while state.persisted_number != state.current_number:
+        number = state.current_number
+        counter_id = state.last_counter_id
+        try:
+            result = await mongo_client.counting_channels.update_one(
+                {"channel_id": state.channel_id, "current_number": state.persisted_number},
+                {"$set": {"current_number": number, "last_counter_id": counter_id}}
+            )
+        except Exception as e:
+            print(f"[Counting Monitor] Failed to persist count {number}: {e}")
+            await asyncio.sleep(5)
+            continue
+
+        if result.matched_count == 0:
+            # The stored number was changed elsewhere - trust Mongo and reload
+            print("[Counting Monitor] Count changed outside the monitor, reloading state")
+            if _states.get(state.channel_id) is state:
+                _states.pop(state.channel_id, None)
+            return
+
+        state.persisted_number = number
+
+
+def _schedule_flush(state: CountingState) -> None:
+    if state.flush_task and not state.flush_task.done():
+        return
+    state.flush_task = asyncio.create_task(_flush_counting_state(state))
+
 # Fun facts for milestone numbers
 FUN_FACTS = {
     69: "Nice! 😎",
@@ -92,23 +170,19 @@ async def on_counting_message(event: hikari.GuildMessageCreateEvent):
         return
     
     # Check if it's the counting channel
-    if str(event.channel_id) != "1024845669820796928":
+    if str(event.channel_id) != COUNTING_CHANNEL_ID:
         return
     
     # Ignore bot messages
     if event.is_bot:
         return
     
-    # Get counting channel data
-    channel_data = await mongo_client.counting_channels.find_one({"channel_id": str(event.channel_id)})
+    # Get counting channel state (cached after the first message)
+    state = await get_counting_state(str(event.channel_id))
     
-    if not channel_data or not channel_data.get("enabled", True):
+    if not state or not state.enabled:
         return
     
-    current_number = channel_data.get("current_number", 0)
-    expected_number = current_number + 1
-    last_counter_id = channel_data.get("last_counter_id")
-    
     # Check if the message is a valid number
     # First check if message has any content or is just attachments/embeds
     if not event.content or event.content.strip() == "":
@@ -143,8 +217,18 @@ async def on_counting_message(event: hikari.GuildMessageCreateEvent):
             pass
         return
     
+    # Validate and advance the count atomically for this channel
+    async with state.lock:
+        expected_number = state.current_number + 1
+        same_counter = state.last_counter_id == str(event.author_id)
+        accepted = not same_counter and user_number == expected_number
+        if accepted:
+            state.current_number = user_number
+            state.last_counter_id = str(event.author_id)
+            _schedule_flush(state)
+    
     # Check if the same user is trying to count again
-    if last_counter_id and last_counter_id == str(event.author_id):
+    if same_counter:
         # Delete their message
         try:
             await event.message.delete()
@@ -161,17 +245,8 @@ async def on_counting_message(event: hikari.GuildMessageCreateEvent):
         return
     
     # Check if it's the correct number
-    if user_number == expected_number:
-        # Correct number!
-        # Update the database
-        await mongo_client.counting_channels.update_one(
-            {"channel_id": str(event.channel_id)},
-            {"$set": {
-                "current_number": user_number,
-                "last_counter_id": str(event.author_id)
-            }}
-        )
-        
+    if accepted:
+        # Correct number! (persisted in the background)
         # Add reactions for milestones or randomly
         try:
             # Check for milestone
@@ -219,7 +294,7 @@ async def on_counting_message_delete(event: hikari.GuildMessageDeleteEvent):
     """Handle when a counting message is deleted."""
     
     # Check if it's the counting channel
-    if str(event.channel_id) != "1024845669820796928":
+    if str(event.channel_id) != COUNTING_CHANNEL_ID:
         return
     
     # We could implement logic here to handle deleted count messages
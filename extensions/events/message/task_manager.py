@@ -1,12 +1,13 @@
 import asyncio
+import json
 import re
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List, Any, Set, Tuple
 
 import hikari
 import lightbulb
 import pendulum
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from pymongo import ReturnDocument, UpdateOne
 from apscheduler.triggers.date import DateTrigger
 
 from hikari.impl import (
@@ -20,184 +21,27 @@ from hikari.impl import (
 )
 
 from utils.mongo import MongoClient
+from utils import bot_data
+from utils.recovery import recovery_step
+from utils.scheduler import scheduler, schedule_periodic, needs_backfill, mark_backfilled
 from utils.constants import RED_ACCENT, GREEN_ACCENT, BLUE_ACCENT, MAGENTA_ACCENT
 from extensions.components import register_action
 
 loader = lightbulb.Loader()
 
-@loader.listener(hikari.StartedEvent)
-@lightbulb.di.with_di
-async def restore_reminders_on_startup(
-    event: hikari.StartedEvent,
-    bot: hikari.GatewayBot = lightbulb.di.INJECTED,
-    mongo: MongoClient = lightbulb.di.INJECTED,
-) -> None:
-    """Restore all pending reminders from MongoDB on bot startup"""
+@recovery_step("task_reminders")
+async def restore_reminders_on_startup() -> None:
+    """Prepare indexes and start paging reminders into the scheduler"""
+    mongo = bot_data.data["mongo"]
     try:
-        print("[Task Manager] Restoring reminders from MongoDB...")
-
-        # Get current time for comparison
-        now = pendulum.now(DEFAULT_TIMEZONE)
-        restored_count = 0
-        expired_count = 0
-
-        # Find all users with reminders
-        users_with_reminders = mongo.user_tasks.find(
-            {"reminders": {"$exists": True, "$ne": []}}
-        )
-
-        async for user_data in users_with_reminders:
-            user_id = int(user_data["user_id"])
-            reminders = user_data.get("reminders", [])
-
-            # Track which reminders to keep (not expired)
-            valid_reminders = []
-
-            for reminder in reminders:
-                try:
-                    reminder_time = pendulum.parse(reminder["reminder_time"])
-                    reminder_id = reminder["reminder_id"]
-                    task_id = reminder["task_id"]
-
-                    if reminder_time > now:
-                        # Reminder is still in the future - restore it
-
-                        # Find the task details
-                        task = next(
-                            (t for t in user_data.get("tasks", []) if t["task_id"] == task_id),
-                            None
-                        )
-
-                        if task and not task.get("completed", False):
-                            # Create the reminder function
-                            async def send_reminder_closure(user_id=user_id, task_id=task_id, reminder_id=reminder_id):
-                                try:
-                                    user = await bot.rest.fetch_user(user_id)
-                                    dm_channel = await bot.rest.create_dm_channel(user_id)
-
-                                    current_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-                                    if current_data:
-                                        current_task = next((t for t in current_data.get("tasks", []) if t["task_id"] == task_id), None)
-                                        if current_task and not current_task.get("completed", False):
-                                            components = [
-                                                Container(
-                                                    accent_color=BLUE_ACCENT,
-                                                    components=[
-                                                        Text(content="## 🔔 Task Reminder"),
-                                                        Separator(divider=True),
-                                                        Text(content=f"**Task #{task_id}:** {current_task['description']}"),
-                                                        Text(content=f"\nThis task is still pending completion!"),
-                                                        Separator(divider=True),
-                                                        ActionRow(
-                                                            components=[
-                                                                Button(
-                                                                    style=hikari.ButtonStyle.SUCCESS,
-                                                                    label="Mark Complete",
-                                                                    custom_id=f"complete_from_reminder:{user_id}_{task_id}",
-                                                                    emoji="✅"
-                                                                ),
-                                                                Button(
-                                                                    style=hikari.ButtonStyle.SECONDARY,
-                                                                    label="Snooze 1h",
-                                                                    custom_id=f"snooze_reminder:{user_id}_{task_id}_1h",
-                                                                    emoji="⏰"
-                                                                )
-                                                            ]
-                                                        ),
-                                                        Text(content=f"-# You set this reminder • Task created {current_task['created_at'][:10]}"),
-                                                        Media(items=[MediaItem(media="assets/Blue_Footer.png")])
-                                                    ]
-                                                )
-                                            ]
-
-                                            await bot.rest.create_message(
-                                                channel=dm_channel.id,
-                                                components=components,
-                                                user_mentions=True
-                                            )
-
-                                            # Also ping user in task channel (create separate components with mention)
-                                            channel_components = [
-                                                Container(
-                                                    accent_color=BLUE_ACCENT,
-                                                    components=[
-                                                        Text(content=f"{user.mention}"),
-                                                        Text(content="## 🔔 Task Reminder"),
-                                                        Separator(divider=True),
-                                                        Text(content=f"**Task #{task_id}:** {current_task['description']}"),
-                                                        Text(content=f"\nThis task is still pending completion!"),
-                                                        Separator(divider=True),
-                                                        ActionRow(
-                                                            components=[
-                                                                Button(
-                                                                    style=hikari.ButtonStyle.SECONDARY,
-                                                                    label="Dismiss",
-                                                                    custom_id="dismiss_channel_reminder",
-                                                                    emoji="✖️"
-                                                                )
-                                                            ]
-                                                        ),
-                                                        Text(content=f"-# You set this reminder • Task created {current_task['created_at'][:10]}"),
-                                                        Media(items=[MediaItem(media="assets/Blue_Footer.png")])
-                                                    ]
-                                                )
-                                            ]
-
-                                            await bot.rest.create_message(
-                                                channel=TASK_CHANNEL_ID,
-                                                components=channel_components,
-                                                user_mentions=True
-                                            )
-
-                                    # Remove reminder from active list
-                                    if reminder_id in active_reminders:
-                                        del active_reminders[reminder_id]
-
-                                except Exception as e:
-                                    print(f"[Task Manager] Failed to send restored reminder: {e}")
-
-                            # Schedule the reminder
-                            reminder_datetime = reminder_time.in_tz(DEFAULT_TIMEZONE).naive()
-                            scheduler.add_job(
-                                send_reminder_closure,
-                                trigger=DateTrigger(run_date=reminder_datetime, timezone=DEFAULT_TIMEZONE),
-                                id=reminder_id,
-                                replace_existing=True
-                            )
-
-                            # Add to active reminders
-                            active_reminders[reminder_id] = {
-                                "user_id": user_id,
-                                "task_id": task_id,
-                                "reminder_time": reminder["reminder_time"],
-                                "description": task["description"]
-                            }
-
-                            valid_reminders.append(reminder)
-                            restored_count += 1
-                            print(f"[Task Manager] Restored reminder for user {user_id}, task {task_id}")
-                        else:
-                            # Task completed or not found - remove reminder
-                            expired_count += 1
-                    else:
-                        # Reminder is in the past - remove it
-                        expired_count += 1
-
-                except Exception as e:
-                    print(f"[Task Manager] Error processing reminder: {e}")
-                    expired_count += 1
-
-            # Update user's reminders to remove expired ones
-            if len(valid_reminders) != len(reminders):
-                await mongo.user_tasks.update_one(
-                    {"user_id": str(user_id)},
-                    {"$set": {"reminders": valid_reminders}}
-                )
+        await ensure_task_indexes(mongo)
+        await migrate_embedded_reminders(mongo)
+    except Exception as e:
+        print(f"[Task Manager] Error preparing reminders: {e}")
 
-        print(f"[Task Manager] Reminder restoration complete: {restored_count} restored, {expired_count} expired/cleaned")
+    # Only reminders due within the window are held in memory at any time
+    schedule_periodic(load_reminder_window, REMINDER_PAGE_INTERVAL, "task_reminder_window")
 
-    except Exception as e:
-        print(f"[Task Manager] Error during reminder restoration: {e}")
 
 # Configuration
 REQUIRED_ROLE_ID = 1060318031575793694
@@ -213,12 +57,17 @@ edit_sessions: Dict[int, Dict[str, Any]] = {}
 # Track auto-delete tasks
 delete_tasks: Dict[int, asyncio.Task] = {}
 
-# Initialize scheduler
-scheduler = AsyncIOScheduler(timezone=DEFAULT_TIMEZONE)
-scheduler.start()
+# Debounced task list rendering
+TASK_LIST_RENDER_DELAY = 2  # seconds of mutations coalesced into one edit
+_render_tasks: Dict[int, asyncio.Task] = {}
+_dirty_task_lists: Set[int] = set()
+_render_guilds: Dict[int, Optional[int]] = {}
+_last_rendered: Dict[int, Tuple[int, str]] = {}  # user_id -> (message_id, fingerprint)
 
-# Store active reminders
-active_reminders: Dict[str, Any] = {}
+# Reminders are documents in task_reminders; only the next window is scheduled
+REMINDER_WINDOW = 3600  # seconds ahead loaded into the scheduler
+REMINDER_PAGE_INTERVAL = 900  # how often the window advances (must be < REMINDER_WINDOW)
+REMINDER_BACKFILL = "task_reminder_documents"
 
 
 def create_task_embed(
@@ -521,17 +370,56 @@ async def send_auto_delete_response(
     return message
 
 
-async def update_task_list_message(
+def update_task_list_message(
+        bot: hikari.GatewayBot,
+        mongo: MongoClient,
+        user_id: int,
+        guild_id: Optional[int] = None
+) -> None:
+    """Queue a re-render of the user's task list; mutations within the window share one edit."""
+    if guild_id is not None or user_id not in _render_guilds:
+        _render_guilds[user_id] = guild_id
+    _dirty_task_lists.add(user_id)
+
+    task = _render_tasks.get(user_id)
+    if task and not task.done():
+        return
+
+    _render_tasks[user_id] = asyncio.create_task(_render_task_list_loop(bot, mongo, user_id))
+
+
+async def _render_task_list_loop(bot: hikari.GatewayBot, mongo: MongoClient, user_id: int) -> None:
+    """Wait out the coalescing window, then render until no new mutations arrived meanwhile."""
+    try:
+        while user_id in _dirty_task_lists:
+            await asyncio.sleep(TASK_LIST_RENDER_DELAY)
+            _dirty_task_lists.discard(user_id)
+            try:
+                await render_task_list_message(bot, mongo, user_id, _render_guilds.get(user_id))
+            except Exception as e:
+                print(f"[Task Manager] Failed to render task list for {user_id}: {e}")
+    finally:
+        if _render_tasks.get(user_id) is asyncio.current_task():
+            _render_tasks.pop(user_id, None)
+
+
+def _render_fingerprint(components: List[Container]) -> str:
+    """Stable serialisation of built components, used to skip no-op edits."""
+    return json.dumps([component.build()[0] for component in components], sort_keys=True, default=str)
+
+
+async def render_task_list_message(
         bot: hikari.GatewayBot,
         mongo: MongoClient,
         user_id: int,
-        tasks: List[Dict[str, Any]],
         guild_id: Optional[int] = None
 ) -> Optional[int]:
     """Update or create the task list message in the designated channel with 3-section layout."""
     user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
     message_id = user_data.get("task_list_message_id") if user_data else None
 
+    tasks = await get_user_tasks(mongo, user_id)
+
     # Get user's display name
     display_name = await get_user_display_name(mongo, bot, user_id, guild_id)
 
@@ -626,6 +514,11 @@ async def update_task_list_message(
             )
         ]
 
+    # Skip the edit when the message would come out byte-identical
+    fingerprint = _render_fingerprint(all_components)
+    if message_id and _last_rendered.get(user_id) == (message_id, fingerprint):
+        return message_id
+
     try:
         if message_id:
             await bot.rest.edit_message(
@@ -633,6 +526,7 @@ async def update_task_list_message(
                 message=message_id,
                 components=all_components
             )
+            _last_rendered[user_id] = (message_id, fingerprint)
             return message_id
     except (hikari.NotFoundError, hikari.ForbiddenError):
         pass
@@ -649,15 +543,35 @@ async def update_task_list_message(
             upsert=True
         )
 
+        _last_rendered[user_id] = (message.id, fingerprint)
         return message.id
     except Exception:
         return None
 
 
+TASK_PROJECTION = {"_id": 0}
+
+
+async def ensure_task_indexes(mongo: MongoClient) -> None:
+    """Create the indexes the per-task collection relies on (idempotent)."""
+    await mongo.tasks.create_index([("owner_id", 1), ("task_id", 1)])
+    await mongo.tasks.create_index([("assigned_to", 1), ("task_id", 1)])
+    await mongo.tasks.create_index([("owner_id", 1), ("completed", 1)])
+    await mongo.task_reminders.create_index([("fire_at", 1)])
+
+
 async def get_user_tasks(mongo: MongoClient, user_id: int) -> List[Dict[str, Any]]:
     """Get all tasks for a user."""
-    user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-    return user_data.get("tasks", []) if user_data else []
+    return await mongo.tasks.find(
+        {"owner_id": str(user_id)}, TASK_PROJECTION
+    ).sort("task_id", 1).to_list(length=None)
+
+
+async def get_task(mongo: MongoClient, owner_id: int, task_id: int) -> Optional[Dict[str, Any]]:
+    """Get a single task by owner and task number."""
+    return await mongo.tasks.find_one(
+        {"owner_id": str(owner_id), "task_id": task_id}, TASK_PROJECTION
+    )
 
 
 async def renumber_tasks(
@@ -668,20 +582,18 @@ async def renumber_tasks(
     """Renumber tasks to be sequential starting from 1."""
     sorted_tasks = sorted(tasks, key=lambda t: t['task_id'])
 
+    # Only touch tasks whose number actually changes
+    updates = []
     for index, task in enumerate(sorted_tasks, start=1):
-        task['task_id'] = index
-
-    next_id = len(sorted_tasks) + 1
+        if task['task_id'] != index:
+            updates.append(UpdateOne(
+                {"owner_id": str(user_id), "task_id": task['task_id']},
+                {"$set": {"task_id": index}}
+            ))
+            task['task_id'] = index
 
-    await mongo.user_tasks.update_one(
-        {"user_id": str(user_id)},
-        {
-            "$set": {
-                "tasks": sorted_tasks,
-                "next_task_id": next_id
-            }
-        }
-    )
+    if updates:
+        await mongo.tasks.bulk_write(updates, ordered=True)
 
     return sorted_tasks
 
@@ -692,38 +604,22 @@ async def add_task(
         description: str
 ) -> Optional[Dict[str, Any]]:
     """Add a new task for a user."""
-    user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-
-    if user_data:
-        tasks = user_data.get("tasks", [])
-    else:
-        tasks = []
+    task_count = await mongo.tasks.count_documents({"owner_id": str(user_id)})
 
-    if len(tasks) >= MAX_TASKS_PER_USER:
+    if task_count >= MAX_TASKS_PER_USER:
         return None
 
-    next_id = len(tasks) + 1
-
     new_task = {
-        "task_id": next_id,
+        "owner_id": str(user_id),
+        "task_id": task_count + 1,
         "description": description[:MAX_TASK_DESCRIPTION_LENGTH],
         "completed": False,
         "created_at": datetime.utcnow().isoformat(),
         "completed_at": None
     }
 
-    tasks.append(new_task)
-
-    await mongo.user_tasks.update_one(
-        {"user_id": str(user_id)},
-        {
-            "$set": {
-                "tasks": tasks,
-                "next_task_id": next_id + 1
-            }
-        },
-        upsert=True
-    )
+    await mongo.tasks.insert_one(new_task)
+    new_task.pop("_id", None)
 
     return new_task
 
@@ -737,26 +633,19 @@ async def delete_task(
     Delete a specific task and renumber remaining tasks.
     Returns (success, deleted_task) tuple where deleted_task contains assignment info if any.
     """
-    user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-    if not user_data:
-        return False, None
-
-    tasks = user_data.get("tasks", [])
-    deleted_task = None
-
-    # Find and store the task before deletion
-    for task in tasks:
-        if task["task_id"] == task_id:
-            deleted_task = task.copy()
-            break
-
-    # Remove the task
-    tasks = [t for t in tasks if t["task_id"] != task_id]
+    deleted_task = await mongo.tasks.find_one_and_delete(
+        {"owner_id": str(user_id), "task_id": task_id},
+        projection=TASK_PROJECTION
+    )
 
     if not deleted_task:
         return False, None
 
-    await renumber_tasks(mongo, user_id, tasks)
+    # Close the gap left by the deleted task
+    await mongo.tasks.update_many(
+        {"owner_id": str(user_id), "task_id": {"$gt": task_id}},
+        {"$inc": {"task_id": -1}}
+    )
 
     return True, deleted_task
 
@@ -770,28 +659,16 @@ async def complete_task(
     Mark a task as completed.
     Returns (success, task_data) tuple where task_data contains assignment info if any.
     """
-    user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-    if not user_data:
-        return False, None
-
-    tasks = user_data.get("tasks", [])
-    completed_task = None
-
-    for task in tasks:
-        if task["task_id"] == task_id:
-            task["completed"] = True
-            task["completed_at"] = datetime.utcnow().isoformat()
-            completed_task = task.copy()  # Store the task data
-            break
+    completed_task = await mongo.tasks.find_one_and_update(
+        {"owner_id": str(user_id), "task_id": task_id},
+        {"$set": {"completed": True, "completed_at": datetime.utcnow().isoformat()}},
+        projection=TASK_PROJECTION,
+        return_document=ReturnDocument.AFTER
+    )
 
     if not completed_task:
         return False, None
 
-    await mongo.user_tasks.update_one(
-        {"user_id": str(user_id)},
-        {"$set": {"tasks": tasks}}
-    )
-
     return True, completed_task
 
 
@@ -803,19 +680,13 @@ async def delete_all_tasks(
     Delete all tasks for a user.
     Returns (count_deleted, deleted_tasks) tuple.
     """
-    user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-    if not user_data:
+    tasks = await get_user_tasks(mongo, user_id)
+    if not tasks:
         return 0, []
 
-    tasks = user_data.get("tasks", [])
-    task_count = len(tasks)
-
-    await mongo.user_tasks.update_one(
-        {"user_id": str(user_id)},
-        {"$set": {"tasks": [], "next_task_id": 1}}
-    )
+    await mongo.tasks.delete_many({"owner_id": str(user_id)})
 
-    return task_count, tasks
+    return len(tasks), tasks
 
 
 async def delete_completed_tasks(
@@ -826,17 +697,10 @@ async def delete_completed_tasks(
     Delete all completed tasks for a user.
     Returns (count_deleted, remaining_tasks) tuple.
     """
-    user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-    if not user_data:
-        return 0, []
+    result = await mongo.tasks.delete_many({"owner_id": str(user_id), "completed": True})
+    count_deleted = result.deleted_count
 
-    tasks = user_data.get("tasks", [])
-
-    # Separate completed from non-completed tasks
-    completed_tasks = [t for t in tasks if t.get("completed", False)]
-    remaining_tasks = [t for t in tasks if not t.get("completed", False)]
-
-    count_deleted = len(completed_tasks)
+    remaining_tasks = await get_user_tasks(mongo, user_id)
 
     if count_deleted > 0:
         # Renumber remaining tasks
@@ -855,27 +719,16 @@ async def edit_task(
     Edit a task's description.
     Returns (success, edited_task) tuple where edited_task contains assignment info if any.
     """
-    user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-    if not user_data:
-        return False, None
-
-    tasks = user_data.get("tasks", [])
-    edited_task = None
-
-    for task in tasks:
-        if task["task_id"] == task_id:
-            task["description"] = new_description[:MAX_TASK_DESCRIPTION_LENGTH]
-            edited_task = task.copy()  # Store the edited task data
-            break
+    edited_task = await mongo.tasks.find_one_and_update(
+        {"owner_id": str(user_id), "task_id": task_id},
+        {"$set": {"description": new_description[:MAX_TASK_DESCRIPTION_LENGTH]}},
+        projection=TASK_PROJECTION,
+        return_document=ReturnDocument.AFTER
+    )
 
     if not edited_task:
         return False, None
 
-    await mongo.user_tasks.update_one(
-        {"user_id": str(user_id)},
-        {"$set": {"tasks": tasks}}
-    )
-
     return True, edited_task
 
 
@@ -892,21 +745,12 @@ async def assign_task(
     Assign a task to another user.
     Returns (success, message, task_data) tuple.
     """
-    # Get owner's tasks
-    owner_data = await mongo.user_tasks.find_one({"user_id": str(owner_id)})
-    if not owner_data:
-        return False, "You don't have any tasks.", None
-
-    tasks = owner_data.get("tasks", [])
-    task = None
-
     # Find the task
-    for t in tasks:
-        if t["task_id"] == task_id:
-            task = t
-            break
+    task = await get_task(mongo, owner_id, task_id)
 
     if not task:
+        if not await mongo.tasks.count_documents({"owner_id": str(owner_id)}, limit=1):
+            return False, "You don't have any tasks.", None
         return False, f"Could not find task #{task_id}.", None
 
     # Check if task is already completed
@@ -929,19 +773,21 @@ async def assign_task(
         return False, f"Task is already assigned to {assignee_name}.", None
 
     # Update task with assignment info
-    task["assigned_to"] = str(assignee_id)
-    task["assigned_by"] = str(owner_id)
-    task["assigned_at"] = datetime.utcnow().isoformat()
+    assignment = {
+        "assigned_to": str(assignee_id),
+        "assigned_by": str(owner_id),
+        "assigned_at": datetime.utcnow().isoformat()
+    }
     if assignment_note:
-        task["assignment_note"] = assignment_note[:500]  # Limit note length
+        assignment["assignment_note"] = assignment_note[:500]  # Limit note length
 
-    # Save updated tasks
-    await mongo.user_tasks.update_one(
-        {"user_id": str(owner_id)},
-        {"$set": {"tasks": tasks}}
+    await mongo.tasks.update_one(
+        {"owner_id": str(owner_id), "task_id": task_id},
+        {"$set": assignment}
     )
+    task.update(assignment)
 
-    return True, "Task assigned successfully.", task.copy()
+    return True, "Task assigned successfully.", task
 
 
 async def unassign_task(
@@ -953,21 +799,12 @@ async def unassign_task(
     Remove assignment from a task.
     Returns (success, message) tuple.
     """
-    # Get user's tasks
-    user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-    if not user_data:
-        return False, "You don't have any tasks."
-
-    tasks = user_data.get("tasks", [])
-    task = None
-
     # Find the task
-    for t in tasks:
-        if t["task_id"] == task_id:
-            task = t
-            break
+    task = await get_task(mongo, user_id, task_id)
 
     if not task:
+        if not await mongo.tasks.count_documents({"owner_id": str(user_id)}, limit=1):
+            return False, "You don't have any tasks."
         return False, f"Could not find task #{task_id}."
 
     # Check if task has an assignment
@@ -975,15 +812,9 @@ async def unassign_task(
         return False, "This task is not assigned to anyone."
 
     # Remove assignment fields
-    task.pop("assigned_to", None)
-    task.pop("assigned_by", None)
-    task.pop("assigned_at", None)
-    task.pop("assignment_note", None)
-
-    # Save updated tasks
-    await mongo.user_tasks.update_one(
-        {"user_id": str(user_id)},
-        {"$set": {"tasks": tasks}}
+    await mongo.tasks.update_one(
+        {"owner_id": str(user_id), "task_id": task_id},
+        {"$unset": {"assigned_to": "", "assigned_by": "", "assigned_at": "", "assignment_note": ""}}
     )
 
     return True, "Task assignment removed."
@@ -994,21 +825,9 @@ async def get_assigned_tasks(
         user_id: int
 ) -> List[Dict[str, Any]]:
     """Get all tasks assigned TO a user (from all task owners)."""
-    assigned_tasks = []
-
-    # Query all user_tasks collections where tasks have assigned_to field matching user_id
-    async for user_data in mongo.user_tasks.find({}):
-        tasks = user_data.get("tasks", [])
-        owner_id = user_data.get("user_id")
-
-        for task in tasks:
-            if task.get("assigned_to") == str(user_id):
-                # Add owner_id to task for reference
-                task_copy = task.copy()
-                task_copy["owner_id"] = owner_id
-                assigned_tasks.append(task_copy)
-
-    return assigned_tasks
+    return await mongo.tasks.find(
+        {"assigned_to": str(user_id)}, TASK_PROJECTION
+    ).sort("task_id", 1).to_list(length=None)
 
 
 async def get_tasks_assigned_by_user(
@@ -1016,17 +835,9 @@ async def get_tasks_assigned_by_user(
         user_id: int
 ) -> List[Dict[str, Any]]:
     """Get all tasks that a user has assigned to others."""
-    # Get user's tasks
-    user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-    if not user_data:
-        return []
-
-    tasks = user_data.get("tasks", [])
-
-    # Filter for tasks that have been assigned
-    assigned_tasks = [t for t in tasks if t.get("assigned_to")]
-
-    return assigned_tasks
+    return await mongo.tasks.find(
+        {"owner_id": str(user_id), "assigned_to": {"$exists": True, "$ne": None}}, TASK_PROJECTION
+    ).sort("task_id", 1).to_list(length=None)
 
 
 async def find_task_owner(
@@ -1041,22 +852,80 @@ async def find_task_owner(
     First checks user's own tasks, then checks tasks assigned to user.
     """
     # Check user's own tasks first
-    user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-    if user_data:
-        for task in user_data.get("tasks", []):
-            if task["task_id"] == task_id:
-                return (user_id, task)
+    task = await get_task(mongo, user_id, task_id)
+    if task:
+        return (user_id, task)
 
     # Check if it's a task assigned to this user (owned by someone else)
-    async for owner_data in mongo.user_tasks.find({}):
-        owner_id_str = owner_data.get("user_id")
-        for task in owner_data.get("tasks", []):
-            if task.get("assigned_to") == str(user_id) and task["task_id"] == task_id:
-                return (int(owner_id_str), task)
+    task = await mongo.tasks.find_one(
+        {"assigned_to": str(user_id), "task_id": task_id}, TASK_PROJECTION
+    )
+    if task:
+        return (int(task["owner_id"]), task)
 
     return None
 
 
+async def migrate_embedded_tasks(mongo: MongoClient) -> tuple[int, int]:
+    """
+    Move tasks embedded in user_tasks documents into the per-task collection.
+    Safe to re-run: existing (owner_id, task_id) entries are left untouched.
+    Returns (users_migrated, tasks_migrated).
+    """
+    users_migrated = 0
+    tasks_migrated = 0
+
+    async for user_data in mongo.user_tasks.find({"tasks": {"$exists": True}}):
+        owner_id = user_data["user_id"]
+        tasks = user_data.get("tasks", [])
+
+        operations = [
+            UpdateOne(
+                {"owner_id": owner_id, "task_id": task["task_id"]},
+                {"$setOnInsert": {**task, "owner_id": owner_id}},
+                upsert=True
+            )
+            for task in tasks
+        ]
+        if operations:
+            result = await mongo.tasks.bulk_write(operations, ordered=False)
+            tasks_migrated += result.upserted_count
+
+        await mongo.user_tasks.update_one(
+            {"_id": user_data["_id"]},
+            {"$unset": {"tasks": "", "next_task_id": ""}}
+        )
+        users_migrated += 1
+
+    return users_migrated, tasks_migrated
+
+
+@loader.command
+class MigrateTasks(
+    lightbulb.SlashCommand,
+    name="migrate-tasks",
+    description="Move embedded user task lists into the indexed task collection",
+    default_member_permissions=hikari.Permissions.ADMINISTRATOR
+):
+    @lightbulb.invoke
+    @lightbulb.di.with_di
+    async def invoke(
+        self,
+        ctx: lightbulb.Context,
+        mongo: MongoClient = lightbulb.di.INJECTED,
+    ) -> None:
+        await ctx.respond("🔄 Migrating tasks...", ephemeral=True)
+
+        try:
+            await ensure_task_indexes(mongo)
+            users_migrated, tasks_migrated = await migrate_embedded_tasks(mongo)
+            await ctx.edit_last_response(
+                f"✅ Migrated {tasks_migrated} task(s) from {users_migrated} user(s)."
+            )
+        except Exception as e:
+            await ctx.edit_last_response(f"❌ Migration failed: {str(e)}")
+
+
 async def send_assignment_dm(
         bot: hikari.GatewayBot,
         mongo: MongoClient,
@@ -1122,139 +991,184 @@ async def send_assignment_dm(
         return False
 
 
-async def create_reminder(
-        mongo: MongoClient,
-        bot: hikari.GatewayBot,
-        user_id: int,
-        task_id: int,
-        reminder_time: pendulum.DateTime,
-        user_timezone: str = DEFAULT_TIMEZONE
-) -> bool:
-    """Create a reminder for a specific task."""
-    user_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-    if not user_data:
-        return False
-
-    task = next((t for t in user_data.get("tasks", []) if t["task_id"] == task_id), None)
-    if not task:
-        return False
+async def send_task_reminder(user_id: int, task_id: int, reminder_id: str) -> None:
+    """Deliver a task reminder by DM and in the task channel"""
+    bot = bot_data.data.get("bot")
+    mongo = bot_data.data.get("mongo")
+    if not bot or not mongo:
+        print(f"[Task Manager] Cannot send reminder {reminder_id}: bot or MongoDB not available")
+        return
 
-    reminder_datetime = reminder_time.in_tz(user_timezone).naive()
-    reminder_id = f"{user_id}_{task_id}_{int(reminder_time.timestamp())}"
+    try:
+        # Claim the reminder so a window reload can't deliver it twice
+        if not await mongo.task_reminders.find_one_and_delete({"_id": reminder_id}):
+            return
 
-    async def send_reminder():
-        try:
+        current_task = await get_task(mongo, user_id, task_id)
+        if current_task and not current_task.get("completed", False):
             user = await bot.rest.fetch_user(user_id)
             dm_channel = await bot.rest.create_dm_channel(user_id)
 
-            current_data = await mongo.user_tasks.find_one({"user_id": str(user_id)})
-            if current_data:
-                current_task = next((t for t in current_data.get("tasks", []) if t["task_id"] == task_id), None)
-                if current_task and not current_task.get("completed", False):
-                    components = [
-                        Container(
-                            accent_color=BLUE_ACCENT,
+            components = [
+                Container(
+                    accent_color=BLUE_ACCENT,
+                    components=[
+                        Text(content="## 🔔 Task Reminder"),
+                        Separator(divider=True),
+                        Text(content=f"**Task #{task_id}:** {current_task['description']}"),
+                        Text(content=f"\nThis task is still pending completion!"),
+                        Separator(divider=True),
+                        ActionRow(
                             components=[
-                                Text(content="## 🔔 Task Reminder"),
-                                Separator(divider=True),
-                                Text(content=f"**Task #{task_id}:** {current_task['description']}"),
-                                Text(content=f"\nThis task is still pending completion!"),
-                                Separator(divider=True),
-                                ActionRow(
-                                    components=[
-                                        Button(
-                                            style=hikari.ButtonStyle.SUCCESS,
-                                            label="Mark Complete",
-                                            custom_id=f"complete_from_reminder:{user_id}_{task_id}",
-                                            emoji="✅"
-                                        ),
-                                        Button(
-                                            style=hikari.ButtonStyle.SECONDARY,
-                                            label="Snooze 1h",
-                                            custom_id=f"snooze_reminder:{user_id}_{task_id}_1h",
-                                            emoji="⏰"
-                                        )
-                                    ]
+                                Button(
+                                    style=hikari.ButtonStyle.SUCCESS,
+                                    label="Mark Complete",
+                                    custom_id=f"complete_from_reminder:{user_id}_{task_id}",
+                                    emoji="✅"
                                 ),
-                                Text(
-                                    content=f"-# You set this reminder • Task created {current_task['created_at'][:10]}"),
+                                Button(
+                                    style=hikari.ButtonStyle.SECONDARY,
+                                    label="Snooze 1h",
+                                    custom_id=f"snooze_reminder:{user_id}_{task_id}_1h",
+                                    emoji="⏰"
+                                )
                             ]
-                        )
+                        ),
+                        Text(
+                            content=f"-# You set this reminder • Task created {current_task['created_at'][:10]}"),
                     ]
+                )
+            ]
 
-                    await bot.rest.create_message(
-                        channel=dm_channel.id,
-                        components=components
-                    )
+            await bot.rest.create_message(
+                channel=dm_channel.id,
+                components=components
+            )
 
-                    # Also ping user in task channel (create separate components with mention)
-                    channel_components = [
-                        Container(
-                            accent_color=BLUE_ACCENT,
+            # Also ping user in task channel (create separate components with mention)
+            channel_components = [
+                Container(
+                    accent_color=BLUE_ACCENT,
+                    components=[
+                        Text(content=f"{user.mention}"),
+                        Text(content="## 🔔 Task Reminder"),
+                        Separator(divider=True),
+                        Text(content=f"**Task #{task_id}:** {current_task['description']}"),
+                        Text(content=f"\nThis task is still pending completion!"),
+                        Separator(divider=True),
+                        ActionRow(
                             components=[
-                                Text(content=f"{user.mention}"),
-                                Text(content="## 🔔 Task Reminder"),
-                                Separator(divider=True),
-                                Text(content=f"**Task #{task_id}:** {current_task['description']}"),
-                                Text(content=f"\nThis task is still pending completion!"),
-                                Separator(divider=True),
-                                ActionRow(
-                                    components=[
-                                        Button(
-                                            style=hikari.ButtonStyle.SECONDARY,
-                                            label="Dismiss",
-                                            custom_id="dismiss_channel_reminder",
-                                            emoji="✖️"
-                                        )
-                                    ]
-                                ),
-                                Text(
-                                    content=f"-# You set this reminder • Task created {current_task['created_at'][:10]}"),
+                                Button(
+                                    style=hikari.ButtonStyle.SECONDARY,
+                                    label="Dismiss",
+                                    custom_id="dismiss_channel_reminder",
+                                    emoji="✖️"
+                                )
                             ]
-                        )
+                        ),
+                        Text(
+                            content=f"-# You set this reminder • Task created {current_task['created_at'][:10]}"),
                     ]
+                )
+            ]
 
-                    await bot.rest.create_message(
-                        channel=TASK_CHANNEL_ID,
-                        components=channel_components,
-                        user_mentions=True
-                    )
+            await bot.rest.create_message(
+                channel=TASK_CHANNEL_ID,
+                components=channel_components,
+                user_mentions=True
+            )
 
-            if reminder_id in active_reminders:
-                del active_reminders[reminder_id]
+    except Exception as e:
+        print(f"[Task Manager] Reminder failed: {e}")
+        import traceback
+        traceback.print_exc()
 
-        except Exception as e:
-            print(f"[Task Manager] Reminder failed: {e}")
-            import traceback
-            traceback.print_exc()
+
+def schedule_reminder_job(reminder: Dict[str, Any]) -> None:
+    """Hand a reminder document that is due soon to the scheduler"""
+    fire_at = reminder["fire_at"]
+    if fire_at.tzinfo is None:
+        fire_at = fire_at.replace(tzinfo=timezone.utc)
 
     scheduler.add_job(
-        send_reminder,
-        trigger=DateTrigger(run_date=reminder_datetime, timezone=user_timezone),
-        id=reminder_id,
+        send_task_reminder,
+        trigger=DateTrigger(run_date=fire_at),
+        args=[int(reminder["user_id"]), reminder["task_id"], reminder["_id"]],
+        id=f"reminder_{reminder['_id']}",
         replace_existing=True
     )
 
-    active_reminders[reminder_id] = {
-        "user_id": user_id,
+
+async def load_reminder_window() -> None:
+    """Schedule every reminder due before the end of the next window"""
+    mongo = bot_data.data.get("mongo")
+    if not mongo:
+        return
+
+    horizon = datetime.now(timezone.utc) + timedelta(seconds=REMINDER_WINDOW)
+    # Overdue reminders (e.g. missed while offline) are included and fire immediately
+    async for reminder in mongo.task_reminders.find({"fire_at": {"$lte": horizon}}):
+        schedule_reminder_job(reminder)
+
+
+async def migrate_embedded_reminders(mongo: MongoClient) -> None:
+    """Move reminders embedded in user_tasks into task_reminders (runs once)"""
+    if not await needs_backfill(mongo, REMINDER_BACKFILL):
+        return
+
+    moved = 0
+    async for user_data in mongo.user_tasks.find({"reminders": {"$exists": True, "$ne": []}}):
+        for reminder in user_data.get("reminders", []):
+            try:
+                fire_at = pendulum.parse(reminder["reminder_time"]).in_tz("UTC")
+                await mongo.task_reminders.update_one(
+                    {"_id": reminder["reminder_id"]},
+                    {"$setOnInsert": {
+                        "user_id": str(user_data["user_id"]),
+                        "task_id": reminder["task_id"],
+                        "fire_at": datetime.fromtimestamp(fire_at.timestamp(), timezone.utc),
+                        "created_at": reminder.get("created_at")
+                    }},
+                    upsert=True
+                )
+                moved += 1
+            except Exception as e:
+                print(f"[Task Manager] Error migrating reminder: {e}")
+
+        await mongo.user_tasks.update_one(
+            {"_id": user_data["_id"]},
+            {"$unset": {"reminders": ""}}
+        )
+
+    await mark_backfilled(mongo, REMINDER_BACKFILL)
+    print(f"[Task Manager] Migrated {moved} reminder(s) into task_reminders")
+
+
+async def create_reminder(
+        mongo: MongoClient,
+        bot: hikari.GatewayBot,
+        user_id: int,
+        task_id: int,
+        reminder_time: pendulum.DateTime,
+        user_timezone: str = DEFAULT_TIMEZONE
+) -> bool:
+    """Create a reminder for a specific task."""
+    task = await get_task(mongo, user_id, task_id)
+    if not task:
+        return False
+
+    reminder = {
+        "_id": f"{user_id}_{task_id}_{int(reminder_time.timestamp())}",
+        "user_id": str(user_id),
         "task_id": task_id,
-        "reminder_time": reminder_time.isoformat(),
-        "description": task["description"]
+        "fire_at": datetime.fromtimestamp(reminder_time.timestamp(), timezone.utc),
+        "created_at": datetime.utcnow().isoformat()
     }
+    await mongo.task_reminders.replace_one({"_id": reminder["_id"]}, reminder, upsert=True)
 
-    await mongo.user_tasks.update_one(
-        {"user_id": str(user_id)},
-        {
-            "$push": {
-                "reminders": {
-                    "reminder_id": reminder_id,
-                    "task_id": task_id,
-                    "reminder_time": reminder_time.isoformat(),
-                    "created_at": datetime.utcnow().isoformat()
-                }
-            }
-        }
-    )
+    # Reminders beyond the current window are picked up by load_reminder_window
+    if reminder["fire_at"] <= datetime.now(timezone.utc) + timedelta(seconds=REMINDER_WINDOW):
+        schedule_reminder_job(reminder)
 
     return True
 
@@ -1301,15 +1215,13 @@ async def on_task_command(
 
                 if success:
                     # Update owner's task list
-                    owner_tasks = await get_user_tasks(mongo, owner_id)
-                    await update_task_list_message(bot, mongo, owner_id, owner_tasks, event.guild_id)
+                    update_task_list_message(bot, mongo, owner_id, event.guild_id)
 
                     # If task was assigned and owner != current user, update current user's list too
                     if edited_task and edited_task.get("assigned_to"):
                         assignee_id = int(edited_task["assigned_to"])
                         if assignee_id != owner_id:
-                            assignee_tasks = await get_user_tasks(mongo, assignee_id)
-                            await update_task_list_message(bot, mongo, assignee_id, assignee_tasks, event.guild_id)
+                            update_task_list_message(bot, mongo, assignee_id, event.guild_id)
 
                     components = create_task_embed(
                         "✅ Task Updated",
@@ -1381,8 +1293,7 @@ async def on_task_command(
             task = await add_task(mongo, event.author_id, description)
 
             if task:
-                tasks = await get_user_tasks(mongo, event.author_id)
-                await update_task_list_message(bot, mongo, event.author_id, tasks, event.guild_id)
+                update_task_list_message(bot, mongo, event.author_id, event.guild_id)
 
                 components = create_task_embed(
                     "✅ Task Added",
@@ -1426,15 +1337,13 @@ async def on_task_command(
 
                 if success:
                     # Update owner's task list
-                    owner_tasks = await get_user_tasks(mongo, owner_id)
-                    await update_task_list_message(bot, mongo, owner_id, owner_tasks, event.guild_id)
+                    update_task_list_message(bot, mongo, owner_id, event.guild_id)
 
                     # If task was assigned and owner != current user, update current user's list too
                     if deleted_task and deleted_task.get("assigned_to"):
                         assignee_id = int(deleted_task["assigned_to"])
                         if assignee_id != owner_id:
-                            assignee_tasks = await get_user_tasks(mongo, assignee_id)
-                            await update_task_list_message(bot, mongo, assignee_id, assignee_tasks, event.guild_id)
+                            update_task_list_message(bot, mongo, assignee_id, event.guild_id)
 
                     components = create_task_embed(
                         "✅ Task Deleted",
@@ -1477,15 +1386,13 @@ async def on_task_command(
 
                 if success:
                     # Update owner's task list
-                    owner_tasks = await get_user_tasks(mongo, owner_id)
-                    await update_task_list_message(bot, mongo, owner_id, owner_tasks, event.guild_id)
+                    update_task_list_message(bot, mongo, owner_id, event.guild_id)
 
                     # If task was assigned and owner != current user, update current user's list too
                     if completed_task and completed_task.get("assigned_to"):
                         assignee_id = int(completed_task["assigned_to"])
                         if assignee_id != owner_id:
-                            assignee_tasks = await get_user_tasks(mongo, assignee_id)
-                            await update_task_list_message(bot, mongo, assignee_id, assignee_tasks, event.guild_id)
+                            update_task_list_message(bot, mongo, assignee_id, event.guild_id)
 
                     components = create_task_embed(
                         "✅ Task Completed",
@@ -1555,8 +1462,7 @@ async def on_task_command(
             count, deleted_tasks = await delete_all_tasks(mongo, event.author_id)
 
             if count > 0:
-                tasks = []
-                await update_task_list_message(bot, mongo, event.author_id, tasks, event.guild_id)
+                update_task_list_message(bot, mongo, event.author_id, event.guild_id)
 
                 # Update all assignees' task lists since their assigned tasks were deleted
                 # Get all tasks that were assigned
@@ -1569,8 +1475,7 @@ async def on_task_command(
 
                 # Update each assignee's task list message
                 for assignee_id in assignee_ids:
-                    assignee_tasks = await get_user_tasks(mongo, assignee_id)
-                    await update_task_list_message(bot, mongo, assignee_id, assignee_tasks, event.guild_id)
+                    update_task_list_message(bot, mongo, assignee_id, event.guild_id)
 
                 components = create_task_embed(
                     "✅ All Tasks Deleted",
@@ -1592,8 +1497,8 @@ async def on_task_command(
             count, remaining_tasks = await delete_completed_tasks(mongo, event.author_id)
 
             if count > 0:
-                # Update owner's task list with remaining tasks
-                await update_task_list_message(bot, mongo, event.author_id, remaining_tasks, event.guild_id)
+                # Update owner's task list
+                update_task_list_message(bot, mongo, event.author_id, event.guild_id)
 
                 # Update all assignees' task lists so they see the new renumbered task IDs
                 # Get all tasks assigned by this user
@@ -1606,8 +1511,7 @@ async def on_task_command(
 
                 # Update each assignee's task list message
                 for assignee_id in assignee_ids:
-                    assignee_tasks = await get_user_tasks(mongo, assignee_id)
-                    await update_task_list_message(bot, mongo, assignee_id, assignee_tasks, event.guild_id)
+                    update_task_list_message(bot, mongo, assignee_id, event.guild_id)
 
                 components = create_task_embed(
                     "✅ Completed Tasks Deleted",
@@ -1836,8 +1740,7 @@ async def on_task_command(
             )
 
             # Update task list message with new name
-            tasks = await get_user_tasks(mongo, event.author_id)
-            await update_task_list_message(bot, mongo, event.author_id, tasks, event.guild_id)
+            update_task_list_message(bot, mongo, event.author_id, event.guild_id)
 
             components = create_task_embed(
                 "✅ Display Name Updated",
@@ -1934,8 +1837,7 @@ async def on_task_command(
                     )
 
                     # Update task list message with new name
-                    tasks = await get_user_tasks(mongo, event.author_id)
-                    await update_task_list_message(bot, mongo, event.author_id, tasks, event.guild_id)
+                    update_task_list_message(bot, mongo, event.author_id, event.guild_id)
 
                     components = create_task_embed(
                         "✅ Display Name Synced",
@@ -1976,12 +1878,10 @@ async def on_task_command(
                 assignee_name = await get_user_display_name(mongo, bot, assignee_id, event.guild_id)
 
                 # Update owner's task list
-                owner_tasks = await get_user_tasks(mongo, event.author_id)
-                await update_task_list_message(bot, mongo, event.author_id, owner_tasks, event.guild_id)
+                update_task_list_message(bot, mongo, event.author_id, event.guild_id)
 
                 # Update assignee's task list
-                assignee_tasks = await get_user_tasks(mongo, assignee_id)
-                await update_task_list_message(bot, mongo, assignee_id, assignee_tasks, event.guild_id)
+                update_task_list_message(bot, mongo, assignee_id, event.guild_id)
 
                 # Send DM notification to assignee (fixed parameter order and pass task dict)
                 await send_assignment_dm(
@@ -2013,8 +1913,7 @@ async def on_task_command(
 
             if success:
                 # Update owner's task list
-                owner_tasks = await get_user_tasks(mongo, event.author_id)
-                await update_task_list_message(bot, mongo, event.author_id, owner_tasks, event.guild_id)
+                update_task_list_message(bot, mongo, event.author_id, event.guild_id)
 
                 # Note: We don't update assignee's list here because unassign_task already does it
 
@@ -2119,14 +2018,12 @@ async def handle_complete_from_reminder(
 
         if success:
             # Update owner's task list message
-            tasks = await get_user_tasks(mongo, user_id)
-            await update_task_list_message(bot, mongo, user_id, tasks)
+            update_task_list_message(bot, mongo, user_id)
 
             # If task was assigned to someone, update their task list too
             if completed_task and completed_task.get("assigned_to"):
                 assignee_id = int(completed_task["assigned_to"])
-                assignee_tasks = await get_user_tasks(mongo, assignee_id)
-                await update_task_list_message(bot, mongo, assignee_id, assignee_tasks)
+                update_task_list_message(bot, mongo, assignee_id)
 
             # Update the reminder message
             await ctx.respond(
@@ -2310,10 +2207,11 @@ async def handle_dismiss_channel_reminder(
 
 @loader.listener(hikari.StoppingEvent)
 async def cleanup_tasks(event: hikari.StoppingEvent) -> None:
-    """Cancel all pending delete tasks and shutdown scheduler on bot shutdown."""
+    """Cancel all pending delete tasks on bot shutdown."""
     for task in delete_tasks.values():
         task.cancel()
     delete_tasks.clear()
-    edit_sessions.clear()
-
-    scheduler.shutdown()
\ No newline at end of file
+    for task in _render_tasks.values():
+        task.cancel()
+    _render_tasks.clear()
+    edit_sessions.clear()
\ No newline at end of file
@@ -32,6 +32,7 @@ from hikari.impl import (
 from utils.constants import BLUE_ACCENT, GREEN_ACCENT, RED_ACCENT
 from utils.mongo import MongoClient
 from utils.emoji import emojis
+from utils.clan_registry import get_clan_docs
 from extensions.components import register_action
 
 # Import FWA chocolate components
@@ -336,7 +337,7 @@ async def handle_player_tag_modal_submit(
 
             # Check if this additional account is in a family clan
             try:
-                family_clans = await mongo.clans.find().to_list(length=None)
+                family_clans = await get_clan_docs(mongo)
                 if family_clans:
                     family_clan_lookup = {clan["tag"]: clan for clan in family_clans}
 
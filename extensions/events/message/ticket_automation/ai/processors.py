@@ -4,21 +4,102 @@ AI processing functions for analyzing user responses.
 Uses Claude API to intelligently summarize and format responses.
 """
 
-import os
-import aiohttp
-import json
-from typing import Optional
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
+from utils import ai_client
 from .prompts import ATTACK_STRATEGIES_PROMPT, CLAN_EXPECTATIONS_PROMPT
-
-# API Configuration
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
-ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
+from .summary_parser import parse_summary, section_progress
 
 # Model configuration
 AI_MODEL = "claude-3-haiku-20240307"
 MAX_TOKENS = 1000
 
+# Same summary + same answer (e.g. a re-submitted message) reuses the earlier result
+RESPONSE_CACHE_TTL = 3600  # seconds
+
+# Summary section title -> progress flag
+ATTACK_STRATEGIES_SECTIONS = {
+    "Main Village Strategies": "has_main_village",
+    "Clan Capital Strategies": "has_capital",
+    "Familiarity with Clan Capital Levels": "has_ch_level",
+}
+CLAN_EXPECTATIONS_SECTIONS = {
+    "Expectations": "has_expectations",
+    "Minimum Clan Level": "has_clan_level",
+    "Minimum Clan Capital Hall Level": "has_capital_hall",
+    "CWL League Preference": "has_cwl_league",
+    "Clan Style Preference": "has_clan_style",
+}
+
+# Messages from one ticket arriving within this window go out as one request
+INPUT_BATCH_WINDOW = 3  # seconds
+
+# Batched ticket input, keyed by (question, channel_id)
+_pending_inputs: Dict[Tuple[str, int], List[str]] = {}
+_batch_processors: Dict[Tuple[str, int], Callable[[str], Awaitable[None]]] = {}
+_batch_tasks: Dict[Tuple[str, int], asyncio.Task] = {}
+_flush_now: Dict[Tuple[str, int], asyncio.Event] = {}
+
+
+def ticket_usage_tag(channel_id: int) -> str:
+    """Tag AI usage is recorded under for one ticket"""
+    return f"ticket:{channel_id}"
+
+
+def queue_ticket_input(
+        question: str,
+        channel_id: int,
+        content: str,
+        process: Callable[[str], Awaitable[None]]
+) -> None:
+    """
+    Collect a user's message; process(combined_content) runs once per batch window.
+    Batches for one ticket run one after another, so each builds on the last summary.
+    """
+    key = (question, channel_id)
+    _pending_inputs.setdefault(key, []).append(content)
+    _batch_processors[key] = process
+
+    task = _batch_tasks.get(key)
+    if task and not task.done():
+        return
+    _flush_now[key] = asyncio.Event()
+    _batch_tasks[key] = asyncio.create_task(_batch_loop(key))
+
+
+async def _batch_loop(key: Tuple[str, int]) -> None:
+    """Process queued input for one ticket until no more arrives"""
+    try:
+        while key in _pending_inputs:
+            try:
+                await asyncio.wait_for(_flush_now[key].wait(), INPUT_BATCH_WINDOW)
+            except asyncio.TimeoutError:
+                pass
+            # A flush covers this batch only; later input waits out the window again
+            _flush_now[key].clear()
+
+            inputs = _pending_inputs.pop(key, [])
+            try:
+                await _batch_processors[key]("\n".join(inputs))
+            except Exception as e:
+                print(f"[AI] Error processing batched input for {key}: {e}")
+    finally:
+        _batch_tasks.pop(key, None)
+        _batch_processors.pop(key, None)
+        _flush_now.pop(key, None)
+
+
+async def flush_ticket_input(question: str, channel_id: int) -> None:
+    """Process anything still queued for a ticket right away (e.g. before Done is handled)"""
+    key = (question, channel_id)
+    task = _batch_tasks.get(key)
+    if task is None or task.done():
+        return
+
+    _flush_now[key].set()
+    await asyncio.shield(task)
+
 
 def analyze_attack_strategies_progress(summary: str) -> dict:
     """
@@ -30,48 +111,7 @@ def analyze_attack_strategies_progress(summary: str) -> dict:
     Returns:
         Dict with progress indicators
     """
-    progress = {
-        "has_main_village": False,
-        "has_capital": False,
-        "has_ch_level": False
-    }
-    
-    if not summary:
-        return progress
-    
-    # Check for main village strategies
-    if "**Main Village Strategies:**" in summary:
-        # Look for actual strategies, not just "No input provided"
-        main_section = summary.split("**Main Village Strategies:**")[1].split("**Clan Capital Strategies:**")[0]
-        if "No input provided" not in main_section and "{white_arrow}" in main_section:
-            # Check if there's actual content after the arrow
-            lines = main_section.strip().split('\n')
-            for line in lines:
-                if "{white_arrow}" in line and len(line.split("{white_arrow}")[1].strip()) > 0:
-                    progress["has_main_village"] = True
-                    break
-    
-    # Check for clan capital strategies
-    if "**Clan Capital Strategies:**" in summary:
-        capital_section = summary.split("**Clan Capital Strategies:**")[1].split("**Familiarity with Clan Capital Levels:**")[0]
-        if "No input provided" not in capital_section and "{white_arrow}" in capital_section:
-            lines = capital_section.strip().split('\n')
-            for line in lines:
-                if "{white_arrow}" in line and len(line.split("{white_arrow}")[1].strip()) > 0:
-                    progress["has_capital"] = True
-                    break
-    
-    # Check for CH level familiarity
-    if "**Familiarity with Clan Capital Levels:**" in summary:
-        ch_section = summary.split("**Familiarity with Clan Capital Levels:**")[1]
-        if "No input provided" not in ch_section and "{white_arrow}" in ch_section:
-            lines = ch_section.strip().split('\n')
-            for line in lines:
-                if "{white_arrow}" in line and len(line.split("{white_arrow}")[1].strip()) > 0:
-                    progress["has_ch_level"] = True
-                    break
-    
-    return progress
+    return section_progress(parse_summary(summary), ATTACK_STRATEGIES_SECTIONS)
 
 
 def analyze_clan_expectations_progress(summary: str) -> dict:
@@ -84,83 +124,27 @@ def analyze_clan_expectations_progress(summary: str) -> dict:
     Returns:
         Dict with progress indicators
     """
-    progress = {
-        "has_expectations": False,
-        "has_clan_level": False,
-        "has_capital_hall": False,
-        "has_cwl_league": False,
-        "has_clan_style": False
-    }
-    
-    if not summary:
-        return progress
-    
-    # Check for expectations
-    if "**Expectations:**" in summary:
-        expectations_section = summary.split("**Expectations:**")[1].split("**Minimum Clan Level:**")[0]
-        if "No input provided" not in expectations_section and "{white_arrow}" in expectations_section:
-            lines = expectations_section.strip().split('\n')
-            for line in lines:
-                if "{white_arrow}" in line and len(line.split("{white_arrow}")[1].strip()) > 0:
-                    progress["has_expectations"] = True
-                    break
-    
-    # Check for minimum clan level
-    if "**Minimum Clan Level:**" in summary:
-        clan_level_section = summary.split("**Minimum Clan Level:**")[1].split("**Minimum Clan Capital Hall Level:**")[0]
-        if "No input provided" not in clan_level_section and "{white_arrow}" in clan_level_section:
-            lines = clan_level_section.strip().split('\n')
-            for line in lines:
-                if "{white_arrow}" in line and len(line.split("{white_arrow}")[1].strip()) > 0:
-                    progress["has_clan_level"] = True
-                    break
-    
-    # Check for capital hall level
-    if "**Minimum Clan Capital Hall Level:**" in summary:
-        capital_hall_section = summary.split("**Minimum Clan Capital Hall Level:**")[1].split("**CWL League Preference:**")[0]
-        if "No input provided" not in capital_hall_section and "{white_arrow}" in capital_hall_section:
-            lines = capital_hall_section.strip().split('\n')
-            for line in lines:
-                if "{white_arrow}" in line and len(line.split("{white_arrow}")[1].strip()) > 0:
-                    progress["has_capital_hall"] = True
-                    break
-    
-    # Check for CWL league preference
-    if "**CWL League Preference:**" in summary:
-        cwl_section = summary.split("**CWL League Preference:**")[1].split("**Clan Style Preference:**")[0]
-        if "No input provided" not in cwl_section and "{white_arrow}" in cwl_section:
-            lines = cwl_section.strip().split('\n')
-            for line in lines:
-                if "{white_arrow}" in line and len(line.split("{white_arrow}")[1].strip()) > 0:
-                    progress["has_cwl_league"] = True
-                    break
-    
-    # Check for clan style preference
-    if "**Clan Style Preference:**" in summary:
-        style_section = summary.split("**Clan Style Preference:**")[1]
-        if "No input provided" not in style_section and "{white_arrow}" in style_section:
-            lines = style_section.strip().split('\n')
-            for line in lines:
-                if "{white_arrow}" in line and len(line.split("{white_arrow}")[1].strip()) > 0:
-                    progress["has_clan_style"] = True
-                    break
-    
-    return progress
+    return section_progress(parse_summary(summary), CLAN_EXPECTATIONS_SECTIONS)
 
 
-async def process_attack_strategies_with_ai(existing_summary: str, new_input: str) -> tuple[str, dict]:
+async def process_attack_strategies_with_ai(
+        existing_summary: str,
+        new_input: str,
+        channel_id: Optional[int] = None
+) -> tuple[str, dict]:
     """
     Process attack strategies using Claude AI.
 
     Args:
         existing_summary: Current summary of strategies
         new_input: New user input to incorporate
+        channel_id: Ticket channel, for per-ticket usage accounting
 
     Returns:
         Tuple of (updated summary, progress dict)
     """
 
-    if not ANTHROPIC_API_KEY:
+    if not ai_client.is_configured():
         print("[AI] Warning: ANTHROPIC_API_KEY not set, returning raw input")
         # Simple detection for progress
         progress = {
@@ -178,7 +162,11 @@ async def process_attack_strategies_with_ai(existing_summary: str, new_input: st
     ]
 
     try:
-        result = await _call_claude_api(messages, ATTACK_STRATEGIES_PROMPT)
+        result = await _call_claude_api(
+            messages,
+            ATTACK_STRATEGIES_PROMPT,
+            tag=ticket_usage_tag(channel_id) if channel_id else None
+        )
         if not result:
             return existing_summary, {"has_main_village": False, "has_capital": False, "has_ch_level": False}
         
@@ -191,19 +179,24 @@ async def process_attack_strategies_with_ai(existing_summary: str, new_input: st
         return existing_summary if existing_summary else new_input, {"has_main_village": False, "has_capital": False, "has_ch_level": False}
 
 
-async def process_clan_expectations_with_ai(existing_summary: str, new_input: str) -> tuple[str, dict]:
+async def process_clan_expectations_with_ai(
+        existing_summary: str,
+        new_input: str,
+        channel_id: Optional[int] = None
+) -> tuple[str, dict]:
     """
     Process clan expectations using Claude AI.
 
     Args:
         existing_summary: Current summary of expectations
         new_input: New user input to incorporate
+        channel_id: Ticket channel, for per-ticket usage accounting
 
     Returns:
         Tuple of (updated summary, progress dict)
     """
 
-    if not ANTHROPIC_API_KEY:
+    if not ai_client.is_configured():
         print("[AI] Warning: ANTHROPIC_API_KEY not set, returning raw input")
         # Simple detection for progress
         progress = {
@@ -223,7 +216,11 @@ async def process_clan_expectations_with_ai(existing_summary: str, new_input: st
     ]
 
     try:
-        result = await _call_claude_api(messages, CLAN_EXPECTATIONS_PROMPT)
+        result = await _call_claude_api(
+            messages,
+            CLAN_EXPECTATIONS_PROMPT,
+            tag=ticket_usage_tag(channel_id) if channel_id else None
+        )
         if not result:
             return existing_summary, {
                 "has_expectations": False,
@@ -248,44 +245,30 @@ async def process_clan_expectations_with_ai(existing_summary: str, new_input: st
         }
 
 
-async def _call_claude_api(messages: list, system_prompt: str) -> Optional[str]:
+async def _call_claude_api(messages: list, system_prompt: str, tag: Optional[str] = None) -> Optional[str]:
     """
     Internal function to call Claude API.
 
     Args:
         messages: List of message dictionaries
-        system_prompt: System prompt for the AI
+        system_prompt: System prompt for the AI (sent as a cacheable block)
+        tag: Usage accounting tag (e.g. the ticket)
 
     Returns:
         AI response text or None on error
     """
-
-    headers = {
-        "x-api-key": ANTHROPIC_API_KEY,
-        "anthropic-version": "2023-06-01",
-        "content-type": "application/json"
-    }
-
-    payload = {
-        "model": AI_MODEL,
-        "max_tokens": MAX_TOKENS,
-        "messages": messages,
-        "system": system_prompt
-    }
-
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(ANTHROPIC_API_URL, headers=headers, json=payload) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result["content"][0]["text"]
-                else:
-                    error_text = await response.text()
-                    print(f"[AI] API error {response.status}: {error_text}")
-                    return None
-    except aiohttp.ClientError as e:
-        print(f"[AI] Network error calling Claude API: {e}")
+        return await ai_client.create_message(
+            system_prompt,
+            messages,
+            model=AI_MODEL,
+            max_tokens=MAX_TOKENS,
+            ttl=RESPONSE_CACHE_TTL,
+            tag=tag
+        )
+    except ai_client.AIRequestError as e:
+        print(f"[AI] Error calling Claude API: {e}")
         return None
     except Exception as e:
         print(f"[AI] Unexpected error calling Claude API: {e}")
-        return None
\ No newline at end of file
+        return None
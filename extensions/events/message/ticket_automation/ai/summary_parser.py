@@ -0,0 +1,60 @@
+# extensions/events/message/ticket_automation/ai/summary_parser.py
+"""
+Single-pass parser for the AI questionnaire summaries.
+
+The prompts produce sections like
+
+    {red_arrow} **Main Village Strategies:**
+    {blank}{white_arrow} Queen Charge Hybrid
+    {blank}{white_arrow} No input provided.
+
+parse_summary() walks the lines once and returns {section title: [entries]},
+which progress detection reads. Display keeps the AI's full text (placeholder
+substitution only), since lines outside this shape would otherwise be lost.
+"""
+
+import re
+from typing import Dict, List, Mapping
+
+WHITE_ARROW = "{white_arrow}"
+NO_INPUT = "No input provided"
+
+# "{red_arrow} **Title:**" (the arrow is optional, the colon may sit inside or outside the bold)
+_HEADER = re.compile(r"^(?:\{red_arrow\})?\s*\*\*(.+?):?\*\*:?$")
+
+
+def parse_summary(summary: str) -> Dict[str, List[str]]:
+    """
+    Section title -> entries, in order of appearance.
+
+    Entries are the text after {white_arrow}; "No input provided" placeholders and
+    empty bullets are dropped, so an empty list means the section has no answer.
+    A title repeated later (e.g. once per account) adds to the same list.
+    """
+    sections: Dict[str, List[str]] = {}
+    if not summary:
+        return sections
+
+    current = None
+    for line in summary.splitlines():
+        arrow = line.find(WHITE_ARROW)
+        if arrow >= 0:
+            if current is not None:
+                entry = line[arrow + len(WHITE_ARROW):].strip()
+                if entry and not entry.startswith(NO_INPUT):
+                    current.append(entry)
+            continue
+
+        # Only lines with bold text can be headers; skips the regex for everything else
+        if "**" in line:
+            header = _HEADER.match(line.strip())
+            if header:
+                current = sections.setdefault(header.group(1).strip(), [])
+
+    return sections
+
+
+def section_progress(sections: Mapping[str, List[str]], fields: Mapping[str, str]) -> Dict[str, bool]:
+    """Progress flags from a parsed summary; fields maps section title -> flag name"""
+    return {flag: bool(sections.get(title)) for title, flag in fields.items()}
+
@@ -25,8 +25,14 @@ from extensions.components import register_action
 from utils.mongo import MongoClient
 from utils.emoji import emojis
 from utils.constants import BLUE_ACCENT, GREEN_ACCENT
+from utils import ai_client
 from ..core.state_manager import StateManager
-from ..ai.processors import process_attack_strategies_with_ai
+from ..ai.processors import (
+    process_attack_strategies_with_ai,
+    queue_ticket_input,
+    flush_ticket_input,
+    ticket_usage_tag,
+)
 
 # Global instances
 mongo_client: Optional[MongoClient] = None
@@ -234,11 +240,22 @@ async def send_attack_strategies(channel_id: int, user_id: int) -> None:
 
 
 async def process_user_input(channel_id: int, user_id: int, content: str) -> None:
-    """Process user input and update the strategies summary"""
+    """Queue user input; messages sent within a few seconds are summarized together"""
 
     if not mongo_client:
         return
 
+    queue_ticket_input(
+        "attack_strategies",
+        channel_id,
+        content,
+        lambda combined: _process_input(channel_id, user_id, combined)
+    )
+
+
+async def _process_input(channel_id: int, user_id: int, content: str) -> None:
+    """Update the strategies summary with a batch of user input"""
+
     try:
         # Get current state
         ticket_state = await StateManager.get_ticket_state(str(channel_id))
@@ -249,7 +266,7 @@ async def process_user_input(channel_id: int, user_id: int, content: str) -> Non
         current_summary = ticket_state.get("step_data", {}).get("questionnaire", {}).get("attack_summary", "")
 
         # Process with AI (using the imported processor)
-        updated_summary, progress = await process_attack_strategies_with_ai(current_summary, content)
+        updated_summary, progress = await process_attack_strategies_with_ai(current_summary, content, channel_id)
 
         # Update the summary and progress in state
         await mongo_client.ticket_automation_state.update_one(
@@ -260,7 +277,8 @@ async def process_user_input(channel_id: int, user_id: int, content: str) -> Non
                     "step_data.questionnaire.responses.attack_strategies": updated_summary,
                     "step_data.questionnaire.last_strategies_input": content,
                     "step_data.questionnaire.last_input_at": datetime.now(timezone.utc),
-                    "step_data.questionnaire.progress": progress
+                    "step_data.questionnaire.progress": progress,
+                    "step_data.questionnaire.ai_usage": ai_client.get_usage(ticket_usage_tag(channel_id))
                 }
             }
         )
@@ -313,6 +331,9 @@ async def handle_attack_strategies_done(
     channel_id = ctx.channel_id
     user_id = ctx.user.id
 
+    # Summarize anything still waiting in the batch window before reading the state
+    await flush_ticket_input("attack_strategies", channel_id)
+
     # Verify this is the correct user
     ticket_state = await mongo_client.ticket_automation_state.find_one({"_id": str(channel_id)})
     if not ticket_state:
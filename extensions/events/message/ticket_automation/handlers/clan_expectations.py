@@ -25,8 +25,14 @@ from extensions.components import register_action
 from utils.mongo import MongoClient
 from utils.emoji import emojis
 from utils.constants import BLUE_ACCENT, GREEN_ACCENT
+from utils import ai_client
 from ..core.state_manager import StateManager
-from ..ai.processors import process_clan_expectations_with_ai
+from ..ai.processors import (
+    process_clan_expectations_with_ai,
+    queue_ticket_input,
+    flush_ticket_input,
+    ticket_usage_tag,
+)
 
 # Global instances
 mongo_client: Optional[MongoClient] = None
@@ -251,11 +257,22 @@ async def send_clan_expectations(channel_id: int, user_id: int) -> None:
 
 
 async def process_user_input(channel_id: int, user_id: int, content: str) -> None:
-    """Process user input and update the expectations summary"""
+    """Queue user input; messages sent within a few seconds are summarized together"""
 
     if not mongo_client:
         return
 
+    queue_ticket_input(
+        "clan_expectations",
+        channel_id,
+        content,
+        lambda combined: _process_input(channel_id, user_id, combined)
+    )
+
+
+async def _process_input(channel_id: int, user_id: int, content: str) -> None:
+    """Update the expectations summary with a batch of user input"""
+
     try:
         # Get current state
         ticket_state = await StateManager.get_ticket_state(str(channel_id))
@@ -266,7 +283,7 @@ async def process_user_input(channel_id: int, user_id: int, content: str) -> Non
         current_summary = ticket_state.get("step_data", {}).get("questionnaire", {}).get("expectations_summary", "")
 
         # Process with AI (using the imported processor like attack_strategies does)
-        updated_summary, progress = await process_clan_expectations_with_ai(current_summary, content)
+        updated_summary, progress = await process_clan_expectations_with_ai(current_summary, content, channel_id)
 
         # Update the summary and progress in state
         await mongo_client.ticket_automation_state.update_one(
@@ -276,7 +293,8 @@ async def process_user_input(channel_id: int, user_id: int, content: str) -> Non
                     "step_data.questionnaire.expectations_summary": updated_summary,
                     "step_data.questionnaire.last_expectations_input": content,
                     "step_data.questionnaire.last_input_at": datetime.now(timezone.utc),
-                    "step_data.questionnaire.expectations_progress": progress
+                    "step_data.questionnaire.expectations_progress": progress,
+                    "step_data.questionnaire.ai_usage": ai_client.get_usage(ticket_usage_tag(channel_id))
                 }
             }
         )
@@ -329,6 +347,9 @@ async def handle_clan_expectations_done(
     channel_id = ctx.channel_id
     user_id = ctx.user.id
 
+    # Summarize anything still waiting in the batch window before reading the state
+    await flush_ticket_input("clan_expectations", channel_id)
+
     # Verify this is the correct user
     ticket_state = await mongo_client.ticket_automation_state.find_one({"_id": str(channel_id)})
     if not ticket_state:
@@ -20,6 +20,7 @@ from hikari.impl import (
 from utils.mongo import MongoClient
 from utils.constants import BLUE_ACCENT
 from utils.emoji import emojis
+from utils.clan_registry import get_clan_docs
 from ..core.state_manager import StateManager
 
 # Global instances
@@ -74,7 +75,7 @@ async def check_candidate_in_family_clans(channel_id: int) -> List[Dict[str, Any
             return []
 
         # Get all family clans
-        family_clans = await mongo_client.clans.find().to_list(length=None)
+        family_clans = await get_clan_docs(mongo_client)
         if not family_clans:
             print("[SummaryGenerator] No family clans found in database")
             return []
@@ -29,6 +29,7 @@ from hikari.impl import (
 
 from utils.constants import RED_ACCENT, GREEN_ACCENT, BLUE_ACCENT
 from utils.mongo import MongoClient
+from utils.recovery import recovery_step, paced, BACKGROUND
 from utils.emoji import emojis
 from extensions.events.message.ticket_account_collection import trigger_account_collection
 
@@ -44,6 +45,7 @@ REMINDER_COOLDOWN_SECONDS = 10
 SCREENSHOT_PROCESSING_DELAY = 1
 REMINDER_DELETE_TIMEOUT = 15  # Seconds before reminder messages auto-delete
 LOG_CHANNEL_ID = 1345589195695194113
+SCAN_REQUESTS_PER_SECOND = 5  # Startup scan of pending tickets
 
 # Global variables
 mongo_client: Optional[MongoClient] = None
@@ -407,12 +409,26 @@ async def check_pending_screenshot_tickets():
         active_count = 0
         closed_count = 0
 
+        # Channels in the gateway cache are checked straight away; REST fetches
+        # for the rest are paced so a long backlog doesn't burst the rate limit
+        cached, uncached = [], []
         for ticket in pending_tickets:
+            channel = bot_instance.cache.get_guild_channel(int(ticket["ticket_info"]["channel_id"]))
+            (cached if channel else uncached).append((ticket, channel))
+
+        async def tickets_to_check():
+            for entry in cached:
+                yield entry
+            async for ticket, _ in paced(uncached, SCAN_REQUESTS_PER_SECOND):
+                yield ticket, None
+
+        async for ticket, channel in tickets_to_check():
             channel_id = ticket["ticket_info"]["channel_id"]
 
             # Check if channel still exists and is not closed
             try:
-                channel = await bot_instance.rest.fetch_channel(int(channel_id))
+                if channel is None:
+                    channel = await bot_instance.rest.fetch_channel(int(channel_id))
 
                 # Check if channel is archived or otherwise closed
                 if hasattr(channel, 'is_archived') and channel.is_archived:
@@ -540,9 +556,7 @@ class TriggerReminder(
         await ctx.respond("✅ Screenshot reminder sent!", ephemeral=True)
 
 
-# Initialize when bot starts
-@loader.listener(hikari.StartedEvent)
-async def on_started(event: hikari.StartedEvent):
+def _load_clients() -> None:
     global mongo_client, bot_instance
 
     # Get instances from bot_data
@@ -550,11 +564,25 @@ async def on_started(event: hikari.StartedEvent):
     mongo_client = bot_data.data.get("mongo")
     bot_instance = bot_data.data.get("bot")
 
+
+# Initialize when bot starts, so screenshots are handled while recovery runs
+@loader.listener(hikari.StartedEvent)
+async def on_started(event: hikari.StartedEvent):
+    _load_clients()
+
     if mongo_client and bot_instance:
-        await check_pending_screenshot_tickets()
         print("Screenshot automation system initialized")
 
 
+@recovery_step("screenshot_scan", priority=BACKGROUND)
+async def scan_pending_screenshots() -> None:
+    """Catch up on tickets still waiting for a screenshot"""
+    if not mongo_client or not bot_instance:
+        _load_clients()
+    if mongo_client and bot_instance:
+        await check_pending_screenshot_tickets()
+
+
 # Cleanup on stop
 @loader.listener(hikari.StoppingEvent)
 async def on_stopping(event: hikari.StoppingEvent):
@@ -1,5 +1,4 @@
 import aiohttp
-import asyncio
 import lightbulb
 import hikari
 from datetime import datetime
@@ -22,17 +21,31 @@ from extensions.components import register_action
 from utils.mongo import MongoClient
 from utils.constants import RED_ACCENT, GREEN_ACCENT
 from utils.emoji import emojis
+from utils.scheduler import schedule_periodic
+from utils.log import get_logger, DEBUG
+from utils.metrics import request_timer
 
 loader = lightbulb.Loader()
 
-# DEBUG CONFIGURATION - Change this to False for production
-DEBUG_MODE = os.getenv("BAND_DEBUG", "True").lower() == "true"  # Default to True for debugging
+# Full responses and headers are only logged in debug mode (BAND_DEBUG=true or /toggle-debug)
+DEBUG_MODE = os.getenv("BAND_DEBUG", "False").lower() == "true"
 
+api_log = get_logger("BAND API")
+log = get_logger("BAND Monitor")
 
-def debug_print(*args, **kwargs):
-    """Only print if DEBUG_MODE is enabled"""
-    if DEBUG_MODE:
-        print(*args, **kwargs)
+
+def set_debug_mode(enabled: bool) -> None:
+    global DEBUG_MODE
+    DEBUG_MODE = enabled
+    for logger in (api_log, log):
+        if enabled:
+            logger.set_level(DEBUG)
+        else:
+            logger.reset_level()
+
+
+if DEBUG_MODE:
+    set_debug_mode(True)
 
 
 # BAND API Configuration
@@ -43,9 +56,9 @@ BAND_KEY = "AADMPvOeSi6era-iwqaVkEtP"
 # Discord channel to send notifications
 NOTIFICATION_CHANNEL_ID = 1078702146180104233
 ALLOWED_ROLE_ID = 1088914884999249940
+BAND_CHECK_INTERVAL = 300  # seconds
 
 # Global variables
-band_check_task = None
 bot_instance = None  # Store bot reference for sending messages
 mongo_client = None  # Store mongo reference
 
@@ -60,48 +73,38 @@ async def fetch_band_posts():
 
     async with aiohttp.ClientSession() as session:
         try:
-            debug_print(f"[BAND API] Making request to: {BAND_API_BASE}")
-            debug_print(f"[BAND API] With params: band_key={BAND_KEY[:10]}..., locale=en_US")
-
-            async with session.get(BAND_API_BASE, params=params) as response:
-                debug_print(f"[BAND API] Response Status: {response.status}")
-                debug_print(f"[BAND API] Response Headers: {dict(response.headers)}")
+            api_log.debug("Making request", url=BAND_API_BASE, band_key=f"{BAND_KEY[:10]}...", locale="en_US")
 
-                # Get response text first
-                text = await response.text()
-                debug_print(f"[BAND API] Raw Response (first 500 chars): {text[:500]}")
+            with request_timer("band", "posts"):
+                async with session.get(BAND_API_BASE, params=params) as response:
+                    text = await response.text()
 
-                if response.status == 200:
-                    try:
-                        data = json.loads(text)
+            if api_log.debug_enabled:
+                api_log.debug("Response", status=response.status, headers=dict(response.headers))
+                api_log.debug("Raw response (first 500 chars)", body=text[:500])
 
-                        # Log the entire response structure
-                        debug_print(f"[BAND API] Full Response Structure:")
-                        debug_print(json.dumps(data, indent=2)[:1000])  # First 1000 chars
+            if response.status == 200:
+                try:
+                    data = json.loads(text)
 
-                        # Check for result_code
+                    if api_log.debug_enabled:
+                        api_log.debug("Full response structure", body=json.dumps(data, indent=2)[:1000])
                         if "result_code" in data:
-                            debug_print(f"[BAND API] result_code: {data['result_code']}")
-                            if "result_msg" in data:
-                                debug_print(f"[BAND API] result_msg: {data['result_msg']}")
-
-                        return data
-                    except json.JSONDecodeError as e:
-                        debug_print(f"[BAND API] JSON Decode Error: {e}")
-                        debug_print(f"[BAND API] Response was not valid JSON: {text[:200]}")
-                        return None
-                else:
-                    debug_print(f"[BAND API] Non-200 Status: {response.status}")
-                    debug_print(f"[BAND API] Error Response: {text}")
+                            api_log.debug("Result", result_code=data["result_code"], result_msg=data.get("result_msg"))
+
+                    return data
+                except json.JSONDecodeError as e:
+                    api_log.warning("Response was not valid JSON", error=e, body=text[:200])
                     return None
+            else:
+                api_log.warning("Non-200 status", status=response.status, body=text[:500])
+                return None
 
         except aiohttp.ClientError as e:
-            debug_print(f"[BAND API] Client Error: {type(e).__name__}: {e}")
+            api_log.warning("Client error", error=f"{type(e).__name__}: {e}")
             return None
         except Exception as e:
-            debug_print(f"[BAND API] Unexpected Exception: {type(e).__name__}: {e}")
-            import traceback
-            debug_print(f"[BAND API] Traceback: {traceback.format_exc()}")
+            api_log.error("Unexpected exception", exc_info=True, error=f"{type(e).__name__}: {e}")
             return None
 
 
@@ -110,7 +113,7 @@ async def send_war_sync_to_discord(post):
     global bot_instance
 
     if not bot_instance:
-        debug_print("[BAND Monitor] Bot instance not available!")
+        log.warning("Bot instance not available")
         return
 
     # Extract post details
@@ -189,9 +192,9 @@ async def send_war_sync_to_discord(post):
             role_mentions=[ALLOWED_ROLE_ID]
         )
 
-        debug_print(f"[BAND Monitor] Sent War Sync reminder to Discord")
+        log.info("Sent War Sync reminder to Discord")
     except Exception as e:
-        debug_print(f"[BAND Monitor] Failed to send Discord message: {e}")
+        log.error("Failed to send Discord message", error=e)
 
 
 @register_action("war_response", no_return=True)
@@ -324,106 +327,85 @@ async def on_war_response(
     await ctx.interaction.edit_initial_response(components=components)
 
 
-async def band_checker_loop(mongo: MongoClient):
-    """Main loop that checks BAND API every 30 seconds"""
-    debug_print("[BAND Monitor] Starting BAND API monitoring task...")
+async def check_band_posts(mongo: MongoClient):
+    """Check the BAND API for a new War Sync post"""
+    try:
+        log.debug("Checking for new posts")
 
-    # Log initial configuration
-    debug_print(f"[BAND Monitor] Configuration:")
-    debug_print(f"  - API Base: {BAND_API_BASE}")
-    debug_print(f"  - Band Key: {BAND_KEY[:10]}... (truncated)")
-    debug_print(f"  - Access Token: {BAND_ACCESS_TOKEN[:20]}... (truncated)")
-    debug_print(f"  - Notification Channel: {NOTIFICATION_CHANNEL_ID}")
-    debug_print(f"  - Allowed Role: {ALLOWED_ROLE_ID}")
+        # Fetch posts from BAND API
+        data = await fetch_band_posts()
 
-    while True:
-        try:
-            debug_print(f"\n{'=' * 60}")
-            debug_print(f"[BAND Monitor] Checking at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-            # Fetch posts from BAND API
-            data = await fetch_band_posts()
-
-            if data is None:
-                debug_print("[BAND Monitor] fetch_band_posts returned None")
-            elif "result_code" in data:
-                result_code = data.get("result_code")
-                result_msg = data.get("result_msg", "No message provided")
-
-                debug_print(f"[BAND Monitor] API Response - Code: {result_code}, Message: {result_msg}")
-
-                if result_code == 1:
-                    posts = data.get("result_data", {}).get("items", [])
-
-                    debug_print(f"[BAND Monitor] Found {len(posts)} posts")
-
-                    if posts:
-                        # Get the most recent post (assuming first post is newest)
-                        latest_post = posts[0]
-                        latest_post_key = latest_post.get('post_key')
-                        latest_content = latest_post.get('content', '')
-
-                        debug_print(f"[BAND Monitor] Latest post key: {latest_post_key}")
-                        debug_print(f"[BAND Monitor] Latest post content preview: {latest_content[:100]}...")
-
-                        if latest_post_key:
-                            # Get the last processed post from MongoDB
-                            last_processed_doc = await mongo.fwa_band_data.find_one({"_id": "last_processed_post"})
-                            last_processed_key = last_processed_doc.get("post_key") if last_processed_doc else None
-
-                            debug_print(f"[BAND Monitor] Last processed post key: {last_processed_key}")
-
-                            # Only process if this is a NEW most recent post
-                            if latest_post_key != last_processed_key:
-                                debug_print(f"[BAND Monitor] New latest post detected!")
-
-                                # Check if this new post contains war sync text
-                                if "PLEASE stop searching when the window closes after 1.5 hours" in latest_content:
-                                    debug_print("[BAND Monitor] New post contains War Sync reminder!")
-                                    await send_war_sync_to_discord(latest_post)
-                                else:
-                                    debug_print("[BAND Monitor] New post doesn't contain War Sync text.")
-
-                                # Update the last processed post in MongoDB
-                                await mongo.fwa_band_data.update_one(
-                                    {"_id": "last_processed_post"},
-                                    {"$set": {
-                                        "post_key": latest_post_key,
-                                        "content": latest_content,
-                                        "processed_at": datetime.now().isoformat()
-                                    }},
-                                    upsert=True
-                                )
-                                debug_print(f"[BAND Monitor] Updated last processed post to: {latest_post_key}")
+        if data is None:
+            log.debug("No data from the BAND API")
+        elif "result_code" in data:
+            result_code = data.get("result_code")
+            result_msg = data.get("result_msg", "No message provided")
+
+            log.debug("API response", result_code=result_code, result_msg=result_msg)
+
+            if result_code == 1:
+                posts = data.get("result_data", {}).get("items", [])
+
+                log.debug("Fetched posts", count=len(posts))
+
+                if posts:
+                    # Get the most recent post (assuming first post is newest)
+                    latest_post = posts[0]
+                    latest_post_key = latest_post.get('post_key')
+                    latest_content = latest_post.get('content', '')
+
+                    log.debug("Latest post", post_key=latest_post_key, preview=latest_content[:100])
+
+                    if latest_post_key:
+                        # Get the last processed post from MongoDB
+                        last_processed_doc = await mongo.fwa_band_data.find_one({"_id": "last_processed_post"})
+                        last_processed_key = last_processed_doc.get("post_key") if last_processed_doc else None
+
+                        log.debug("Last processed post", post_key=last_processed_key)
+
+                        # Only process if this is a NEW most recent post
+                        if latest_post_key != last_processed_key:
+                            log.info("New latest post detected", post_key=latest_post_key)
+
+                            # Check if this new post contains war sync text
+                            if "PLEASE stop searching when the window closes after 1.5 hours" in latest_content:
+                                log.info("New post contains War Sync reminder")
+                                await send_war_sync_to_discord(latest_post)
                             else:
-                                debug_print("[BAND Monitor] No new posts since last check.")
+                                log.debug("New post doesn't contain War Sync text")
+
+                            # Update the last processed post in MongoDB
+                            await mongo.fwa_band_data.update_one(
+                                {"_id": "last_processed_post"},
+                                {"$set": {
+                                    "post_key": latest_post_key,
+                                    "content": latest_content,
+                                    "processed_at": datetime.now().isoformat()
+                                }},
+                                upsert=True
+                            )
+                            log.debug("Updated last processed post", post_key=latest_post_key)
                         else:
-                            debug_print("[BAND Monitor] Latest post has no post_key")
+                            log.debug("No new posts since last check")
                     else:
-                        debug_print("[BAND Monitor] No posts found in API response")
+                        log.warning("Latest post has no post_key")
                 else:
-                    debug_print(f"[BAND Monitor] API returned error code {result_code}: {result_msg}")
-
-                    # Common BAND API error codes
-                    if result_code == -101:
-                        debug_print("[BAND Monitor] ERROR: Invalid access token! Token may be expired.")
-                    elif result_code == -102:
-                        debug_print("[BAND Monitor] ERROR: Invalid band key!")
-                    elif result_code == -103:
-                        debug_print("[BAND Monitor] ERROR: No permission to access this band!")
+                    log.debug("No posts found in API response")
             else:
-                debug_print("[BAND Monitor] Unexpected API response format - no result_code field")
-                debug_print(f"[BAND Monitor] Response keys: {list(data.keys())}")
-
-        except Exception as e:
-            debug_print(f"[BAND Monitor] Error in loop: {type(e).__name__}: {e}")
-            import traceback
-            debug_print(f"[BAND Monitor] Traceback: {traceback.format_exc()}")
+                log.error("API returned an error", result_code=result_code, result_msg=result_msg)
+
+                # Common BAND API error codes
+                if result_code == -101:
+                    log.error("Invalid access token; it may be expired")
+                elif result_code == -102:
+                    log.error("Invalid band key")
+                elif result_code == -103:
+                    log.error("No permission to access this band")
+        else:
+            log.warning("Unexpected API response format, no result_code field", keys=list(data.keys()))
 
-        # Wait 300 seconds before next check
-        debug_print(f"\n[BAND Monitor] Waiting 300 seconds until next check...")
-        debug_print(f"{'=' * 60}")
-        await asyncio.sleep(300)
+    except Exception as e:
+        log.error("Error in check", exc_info=True, error=f"{type(e).__name__}: {e}")
 
 
 @loader.listener(hikari.StartedEvent)
@@ -432,30 +414,23 @@ async def on_bot_started(
         event: hikari.StartedEvent,
         mongo: MongoClient = lightbulb.di.INJECTED
 ) -> None:
-    """Start the BAND monitor task when bot starts"""
-    global band_check_task, bot_instance, mongo_client
+    """Schedule the BAND check when bot starts"""
+    global bot_instance, mongo_client
 
     # Store bot instance for sending messages
     bot_instance = event.app
     mongo_client = mongo
 
-    # Create the task with mongo passed in
-    band_check_task = asyncio.create_task(band_checker_loop(mongo))
-    debug_print("[BAND Monitor] Background task started!")
-
-
-@loader.listener(hikari.StoppingEvent)
-async def on_bot_stopping(event: hikari.StoppingEvent) -> None:
-    """Cancel the task when bot is stopping"""
-    global band_check_task
+    log.debug(
+        "Configuration",
+        api_base=BAND_API_BASE,
+        band_key=f"{BAND_KEY[:10]}...",
+        channel=NOTIFICATION_CHANNEL_ID,
+        role=ALLOWED_ROLE_ID,
+        interval=BAND_CHECK_INTERVAL
+    )
 
-    if band_check_task and not band_check_task.done():
-        band_check_task.cancel()
-        try:
-            await band_check_task
-        except asyncio.CancelledError:
-            pass
-        debug_print("[BAND Monitor] Background task cancelled!")
+    schedule_periodic(check_band_posts, BAND_CHECK_INTERVAL, "band_monitor", args=[mongo])
 
 
 @loader.command
@@ -467,11 +442,10 @@ class ToggleDebug(
 ):
     @lightbulb.invoke
     async def invoke(self, ctx: lightbulb.Context) -> None:
-        global DEBUG_MODE
-        DEBUG_MODE = not DEBUG_MODE
+        set_debug_mode(not DEBUG_MODE)
         status = "ON" if DEBUG_MODE else "OFF"
         await ctx.respond(f"🔧 BAND Monitor debug mode: **{status}**", ephemeral=True)
-        debug_print(f"[DEBUG] Debug mode toggled to: {status} by {ctx.user.username}")
+        log.info("Debug mode toggled", status=status, user=ctx.user.username)
 
 
 # Check if test commands are enabled
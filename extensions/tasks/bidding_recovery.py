@@ -1,163 +1,81 @@
 """
-Task to recover bidding sessions after bot restart
+One-time backfill of bidding sessions into the persistent job store
 """
 
-import asyncio
 import hikari
 import lightbulb
 from datetime import datetime, timezone
-from bson import ObjectId
 
+from utils import bot_data
 from utils.mongo import MongoClient
+from utils.recovery import recovery_step, CRITICAL
+from utils.scheduler import scheduler, needs_backfill, mark_backfilled
+from extensions.commands.recruit.bidding import BIDDING_JOB_PREFIX, schedule_bidding_end
 
 loader = lightbulb.Loader()
 
+# Bidding end jobs persist in the shared scheduler; sessions started before
+# that are scheduled once from button_store
+BIDDING_BACKFILL = "bidding_sessions"
+
 # Global variables
-bot_instance = None
-mongo_client = None
 recovery_complete = False
 
 
-@loader.listener(hikari.StartedEvent)
-@lightbulb.di.with_di
-async def on_bot_started(
-    event: hikari.StartedEvent,
-    mongo: MongoClient = lightbulb.di.INJECTED
-) -> None:
-    """Recover bidding sessions on bot startup"""
-    global bot_instance, mongo_client, recovery_complete
-    
-    bot_instance = event.app
-    mongo_client = mongo
-    
-    # Wait a bit for other systems to initialize
-    await asyncio.sleep(5)
-    
-    print("[Bidding Recovery] Starting bidding session recovery...")
-    
+@recovery_step("bidding_backfill", priority=CRITICAL)
+async def backfill_bidding_sessions() -> None:
+    """Schedule end jobs for bidding sessions that predate the persistent job store"""
+    global recovery_complete
+
+    mongo = bot_data.data["mongo"]
+
     try:
-        # Find all active bidding sessions
+        if not await needs_backfill(mongo, BIDDING_BACKFILL):
+            recovery_complete = True
+            return
+
+        print("[Bidding Recovery] Backfilling bidding session end jobs...")
+
         active_sessions = await mongo.button_store.find({
             "type": "bidding_session"
         }).to_list(length=None)
-        
-        if not active_sessions:
-            print("[Bidding Recovery] No active bidding sessions found")
-            recovery_complete = True
-            return
-        
-        print(f"[Bidding Recovery] Found {len(active_sessions)} active bidding session(s)")
-        
-        now = datetime.now(timezone.utc)
-        recovered_count = 0
-        expired_count = 0
-        
+
+        scheduled = 0
         for session in active_sessions:
             try:
+                recruit_id = session.get("recruitId")
                 bid_end_time = session.get("bidEndTime")
-                if not bid_end_time:
-                    print(f"[Bidding Recovery] Session {session['_id']} missing bidEndTime, skipping")
+                if not recruit_id or not bid_end_time or not session.get("threadId"):
+                    print(f"[Bidding Recovery] Session {session['_id']} missing required data, skipping")
                     continue
-                
+
+                if scheduler.get_job(f"{BIDDING_JOB_PREFIX}{recruit_id}"):
+                    continue
+
                 # If bid_end_time is naive (no timezone), make it aware by assuming UTC
                 if bid_end_time.tzinfo is None:
                     bid_end_time = bid_end_time.replace(tzinfo=timezone.utc)
-                
-                # Check if session has expired
-                if bid_end_time <= now:
-                    # Process immediately
-                    print(f"[Bidding Recovery] Session {session['_id']} has expired, processing immediately")
-                    await process_expired_bidding(session)
-                    expired_count += 1
-                else:
-                    # Calculate remaining time and create new timer
-                    remaining_seconds = (bid_end_time - now).total_seconds()
-                    print(f"[Bidding Recovery] Session {session['_id']} has {remaining_seconds:.0f} seconds remaining")
-                    
-                    # Create recovery task
-                    asyncio.create_task(
-                        resume_bidding_timer(session, remaining_seconds)
-                    )
-                    recovered_count += 1
-                    
+
+                # Expired sessions fire as soon as the scheduler resumes
+                schedule_bidding_end(
+                    recruit_id,
+                    session["_id"],
+                    int(session["threadId"]),
+                    int(session.get("messageId") or 0),
+                    bid_end_time
+                )
+                scheduled += 1
+
             except Exception as e:
                 print(f"[Bidding Recovery] Error processing session {session.get('_id')}: {e}")
-        
-        print(f"[Bidding Recovery] Recovery complete: {recovered_count} resumed, {expired_count} expired")
-        recovery_complete = True
-        
-    except Exception as e:
-        print(f"[Bidding Recovery] Fatal error during recovery: {e}")
-        recovery_complete = True
 
+        await mark_backfilled(mongo, BIDDING_BACKFILL)
+        print(f"[Bidding Recovery] Backfill complete: {scheduled} session(s) scheduled")
 
-async def resume_bidding_timer(session: dict, remaining_seconds: float):
-    """Resume a bidding timer with remaining time"""
-    try:
-        # Wait for remaining time
-        await asyncio.sleep(remaining_seconds)
-        
-        # Process the bidding end
-        await process_expired_bidding(session)
-        
-    except asyncio.CancelledError:
-        print(f"[Bidding Recovery] Timer cancelled for session {session['_id']}")
     except Exception as e:
-        print(f"[Bidding Recovery] Error in resumed timer for session {session['_id']}: {e}")
+        print(f"[Bidding Recovery] Fatal error during backfill: {e}")
 
-
-async def process_expired_bidding(session: dict):
-    """Process a bidding session that has expired"""
-    from extensions.commands.recruit.bidding import process_bidding_end
-    
-    try:
-        recruit_id = session.get("recruitId")
-        session_id = session.get("_id")
-        thread_id = int(session.get("threadId", 0))
-        message_id = int(session.get("messageId", 0))
-        
-        if not all([recruit_id, session_id, thread_id]):
-            print(f"[Bidding Recovery] Missing required data for session {session_id}")
-            return
-        
-        print(f"[Bidding Recovery] Processing bidding end for recruit {recruit_id}")
-        
-        # Call the bidding end processor
-        await process_bidding_end(
-            bot_instance,
-            mongo_client,
-            recruit_id,
-            session_id,
-            thread_id,
-            message_id
-        )
-        
-        print(f"[Bidding Recovery] Successfully processed bidding for recruit {recruit_id}")
-        
-    except Exception as e:
-        print(f"[Bidding Recovery] Error processing bidding end: {e}")
-        
-        # Try to at least reset the recruit's activeBid flag
-        try:
-            if session.get("recruitId"):
-                # Check if it's a channel not found error
-                update_fields = {"activeBid": False}
-                if "Unknown Channel" in str(e) or "404" in str(e):
-                    # Channel doesn't exist, mark ticket as closed
-                    update_fields["ticket_open"] = False
-                    print(f"[Bidding Recovery] Channel not found, marking ticket as closed")
-                
-                await mongo_client.new_recruits.update_one(
-                    {"_id": ObjectId(session["recruitId"])},
-                    {"$set": update_fields}
-                )
-                print(f"[Bidding Recovery] Reset activeBid flag for recruit {session['recruitId']}")
-                
-                # Clean up the failed session so it doesn't get reprocessed
-                await mongo_client.button_store.delete_one({"_id": session.get("_id")})
-                print(f"[Bidding Recovery] Cleaned up failed session {session.get('_id')}")
-        except Exception as reset_error:
-            print(f"[Bidding Recovery] Failed to reset activeBid: {reset_error}")
+    recovery_complete = True
 
 
 @loader.command
@@ -8,10 +8,8 @@ import asyncio
 import hikari
 import lightbulb
 import coc
-from datetime import datetime, timezone, timedelta
+from datetime import datetime
 from typing import Optional, Dict, List
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
 
 from hikari.impl import (
     ContainerComponentBuilder as Container,
@@ -28,8 +26,11 @@ from hikari.impl import (
 
 from utils.mongo import MongoClient
 from utils.constants import BLUE_ACCENT, GREEN_ACCENT
-from utils.emoji import emojis
+from utils.emoji import league_emoji, th_emoji
 from utils.classes import Clan
+from utils.recovery import recovery_step
+from utils.scheduler import schedule_periodic
+from utils.clan_registry import get_clans
 
 loader = lightbulb.Loader()
 
@@ -41,7 +42,6 @@ CLAN_INFO_PARENT_CHANNEL = 1133096989748363294  # Clan threads parent channel
 mongo_client: Optional[MongoClient] = None
 coc_client: Optional[coc.Client] = None
 bot_instance: Optional[hikari.GatewayBot] = None
-scheduler: Optional[AsyncIOScheduler] = None
 
 
 async def build_clan_info_embed(clan: Clan, api_clan: coc.Clan, guild_id: int) -> List[Container]:
@@ -57,25 +57,9 @@ async def build_clan_info_embed(clan: Clan, api_clan: coc.Clan, guild_id: int) -
     cwl_emoji = "🏆"
     if hasattr(api_clan, 'war_league') and api_clan.war_league:
         league_name = api_clan.war_league.name
-        league_emoji_map = {
-            "Champion League I": emojis.Champ1,
-            "Champion League II": emojis.Champ2,
-            "Champion League III": emojis.Champ3,
-            "Master League I": emojis.Master1,
-            "Master League II": emojis.Master2,
-            "Master League III": emojis.Master3,
-            "Crystal League I": emojis.Crystal1,
-            "Crystal League II": emojis.Crystal2,
-            "Crystal League III": emojis.Crystal3,
-            "Gold League I": emojis.Gold1,
-            "Gold League II": emojis.Gold2,
-            "Gold League III": emojis.Gold3,
-            "Silver League I": emojis.Silver1,
-            "Silver League II": emojis.Silver2,
-            "Silver League III": emojis.Silver3,
-        }
-        if league_name in league_emoji_map:
-            cwl_emoji = f"{league_emoji_map[league_name].partial_emoji}"
+        emoji = league_emoji(league_name)
+        if emoji:
+            cwl_emoji = f"{emoji.partial_emoji}"
 
     # Get capital hall level - EXACTLY like clan list
     if api_clan and api_clan.capital_districts:
@@ -93,9 +77,7 @@ async def build_clan_info_embed(clan: Clan, api_clan: coc.Clan, guild_id: int) -
     # Format recruiting - TH emoji + TH number
     recruiting = "N/A"
     if clan.th_requirements:
-        th_emoji_name = f"TH{clan.th_requirements}"
-        th_emoji = getattr(emojis, th_emoji_name, "🏛️")
-        recruiting = f"{th_emoji} TH{clan.th_requirements}"
+        recruiting = f"{th_emoji(clan.th_requirements) or '🏛️'} TH{clan.th_requirements}"
 
     # Build components list
     components = []
@@ -225,15 +207,14 @@ async def update_clan_threads():
 
     try:
         # Get all clans from database
-        clan_data = await mongo_client.clans.find({}).to_list(length=None)
+        clans = await get_clans(mongo_client)
 
-        for clan_doc in clan_data:
+        for clan in clans:
             try:
                 # Skip if no thread_id
-                if not clan_doc.get('thread_id'):
+                if not clan.thread_id:
                     continue
 
-                clan = Clan(data=clan_doc)
                 thread_id = clan.thread_id
 
                 # Skip if essential data is missing
@@ -266,7 +247,7 @@ async def update_clan_threads():
                 components = await build_clan_info_embed(clan, api_clan, guild_id)
 
                 # Check if we have an existing message
-                existing_message_id = clan_doc.get('thread_message_id')
+                existing_message_id = clan.thread_message_id
 
                 try:
                     if existing_message_id:
@@ -327,10 +308,10 @@ async def update_clan_threads():
         print(f"[Clan Info Updater] Critical error in update task: {e}")
 
 
-@loader.listener(hikari.StartedEvent)
-async def on_started(event: hikari.StartedEvent):
+@recovery_step("clan_info_updater")
+async def on_started() -> None:
     """Initialize the clan info updater when bot starts"""
-    global mongo_client, coc_client, bot_instance, scheduler
+    global mongo_client, coc_client, bot_instance
 
     # Get instances from bot data
     from utils import bot_data
@@ -342,39 +323,13 @@ async def on_started(event: hikari.StartedEvent):
         print("[Clan Info Updater] ERROR: Missing required clients!")
         return
 
-    # Initialize scheduler
-    scheduler = AsyncIOScheduler(timezone="UTC")
-
-    # Schedule the update task
-    scheduler.add_job(
+    # First run waits a full interval so startup isn't delayed by updating every clan
+    schedule_periodic(
         update_clan_threads,
-        trigger=IntervalTrigger(minutes=UPDATE_INTERVAL_MINUTES),
-        id="clan_info_updater",
-        replace_existing=True,
-        max_instances=1  # Prevent overlapping runs
+        UPDATE_INTERVAL_MINUTES * 60,
+        "clan_info_updater",
+        first_run_delay=UPDATE_INTERVAL_MINUTES * 60
     )
 
-    # Start scheduler
-    scheduler.start()
-
     print(f"[Clan Info Updater] Started - updating every {UPDATE_INTERVAL_MINUTES} minutes")
     print(f"[Clan Info Updater] First update will run in {UPDATE_INTERVAL_MINUTES} minutes to avoid startup delays")
-    
-    # Schedule first run after UPDATE_INTERVAL_MINUTES instead of immediately
-    # This prevents the 2-minute startup delay from updating all clans
-    scheduler.add_job(
-        update_clan_threads,
-        trigger="date",  # One-time trigger
-        run_date=datetime.now(timezone.utc).replace(microsecond=0) + timedelta(minutes=UPDATE_INTERVAL_MINUTES),
-        id="clan_info_initial_update",
-        replace_existing=True
-    )
-
-
-@loader.listener(hikari.StoppingEvent)
-async def on_stopping(event: hikari.StoppingEvent):
-    """Cleanup when bot stops"""
-    global scheduler
-    if scheduler:
-        scheduler.shutdown()
-        print("[Clan Info Updater] Scheduler shut down")
\ No newline at end of file
@@ -1,7 +1,9 @@
 import asyncio
+import bisect
 import lightbulb
 import hikari
 from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
 
 from hikari.impl import (
     ContainerComponentBuilder as Container,
@@ -15,23 +17,73 @@ from utils.mongo import MongoClient
 from utils.constants import MAGENTA_ACCENT
 from utils.classes import Clan
 from utils.emoji import emojis
+from utils.scheduler import schedule_periodic
+from utils.points_events import subscribe
+from utils.clan_registry import as_clan, get_clans
 
 loader = lightbulb.Loader()
 
 # Configuration
 AUTOBOARD_CHANNEL_ID = 1356702174096261271
-UPDATE_INTERVAL = 30
+RENDER_DELAY = 5  # Coalesce bursts of points changes into one edit
+RECONCILE_INTERVAL = 900  # Full reload to catch writes that bypass the points bus
+
+# Dirty marker meaning "reload every clan"
+ALL_CLANS = "*"
 
 # Global variables
-autoboard_task = None
 bot_instance = None
 mongo_client = None
 
 
+class Leaderboard:
+    """Clans kept sorted by points (highest first) as individual entries change"""
+
+    def __init__(self):
+        self.clans: Dict[str, Clan] = {}
+        self._order: List[Tuple[float, str, str]] = []  # (-points, name, tag)
+
+    @staticmethod
+    def _key(clan: Clan) -> Tuple[float, str, str]:
+        return -(clan.points or 0), (clan.name or "").lower(), clan.tag
+
+    def remove(self, tag: str) -> None:
+        clan = self.clans.pop(tag, None)
+        if clan:
+            key = self._key(clan)
+            index = bisect.bisect_left(self._order, key)
+            if index < len(self._order) and self._order[index] == key:
+                del self._order[index]
+
+    def put(self, clan: Clan) -> None:
+        self.remove(clan.tag)
+        self.clans[clan.tag] = clan
+        bisect.insort(self._order, self._key(clan))
+
+    def replace_all(self, clans: List[Clan]) -> None:
+        self.clans = {clan.tag: clan for clan in clans}
+        self._order = sorted(self._key(clan) for clan in clans)
+
+    def ranked(self) -> List[Clan]:
+        return [self.clans[tag] for _, _, tag in self._order]
+
+    def fingerprint(self) -> tuple:
+        """Everything the board shows, in display order"""
+        return tuple(
+            (clan.tag, clan.name, clan.emoji, clan.points, clan.recruit_count)
+            for clan in self.ranked()
+        )
+
+
+leaderboard = Leaderboard()
+_dirty_clans: Set[str] = set()
+_refresh_task: Optional[asyncio.Task] = None
+_last_rendered: Optional[tuple] = None
+
+
 async def create_autoboard_embed(clans: list[Clan]) -> list[Container]:
-    """Create the autoboard embed using Components V2"""
-    # Sort clans by points (highest first) for display order
-    sorted_clans = sorted(clans, key=lambda c: c.points, reverse=True)
+    """Create the autoboard embed using Components V2 (clans already ranked)"""
+    sorted_clans = clans
 
     # Build components list
     component_list = [
@@ -85,7 +137,7 @@ async def create_autoboard_embed(clans: list[Clan]) -> list[Container]:
     # Add footer
     component_list.extend([
         Separator(divider=True),
-        Text(content=f"-# 🔄 This board updates every 5 minutes • Last refresh: <t:{current_timestamp}:f>"),
+        Text(content=f"-# 🔄 This board updates as points change • Last refresh: <t:{current_timestamp}:f>"),
         Media(items=[MediaItem(media="assets/Purple_Footer.png")]),
     ])
 
@@ -100,15 +152,73 @@ async def create_autoboard_embed(clans: list[Clan]) -> list[Container]:
     return components
 
 
+async def load_leaderboard(mongo: MongoClient) -> None:
+    """Rebuild the in-memory leaderboard from the clan registry"""
+    leaderboard.replace_all(await get_clans(mongo))
+
+
+async def refresh_clans(mongo: MongoClient, tags: Set[str]) -> None:
+    """Re-read only the given clans and move them within the leaderboard"""
+    found = set()
+    async for data in mongo.clans.find({"tag": {"$in": list(tags)}}):
+        leaderboard.put(as_clan(data))
+        found.add(data["tag"])
+
+    # Clans that no longer exist
+    for tag in tags - found:
+        leaderboard.remove(tag)
+
+
+def on_points_change(clan_tag: Optional[str]) -> None:
+    """Points bus listener: mark the clan dirty and schedule a debounced refresh"""
+    global _refresh_task
+
+    _dirty_clans.add(clan_tag or ALL_CLANS)
+
+    if _refresh_task and not _refresh_task.done():
+        return
+    _refresh_task = asyncio.create_task(_refresh_loop())
+
+
+async def _refresh_loop() -> None:
+    """Apply pending changes and re-render only when the visible board changed"""
+    while _dirty_clans:
+        await asyncio.sleep(RENDER_DELAY)
+        if not bot_instance or not mongo_client:
+            return
+
+        dirty = set(_dirty_clans)
+        _dirty_clans.clear()
+
+        try:
+            if ALL_CLANS in dirty:
+                await load_leaderboard(mongo_client)
+            else:
+                await refresh_clans(mongo_client, dirty)
+
+            if leaderboard.fingerprint() != _last_rendered:
+                await update_autoboard_message(bot_instance, mongo_client)
+        except Exception as e:
+            print(f"[ClanPoints Autoboard] Error refreshing leaderboard: {type(e).__name__}: {e}")
+
+
+async def reconcile_leaderboard() -> None:
+    """Periodic safety net for clan writes made outside the bot's points paths"""
+    on_points_change(None)
+
+
 async def update_autoboard_message(bot: hikari.GatewayBot, mongo: MongoClient):
-    """Update or create the autoboard message"""
+    """Update or create the autoboard message from the in-memory leaderboard"""
+    global _last_rendered
+
     try:
-        # Get all clans from database
-        clan_data = await mongo.clans.find().to_list(length=None)
-        clans = [Clan(data=data) for data in clan_data]
+        if not leaderboard.clans:
+            await load_leaderboard(mongo)
+
+        fingerprint = leaderboard.fingerprint()
 
         # Create the embed
-        components = await create_autoboard_embed(clans)
+        components = await create_autoboard_embed(leaderboard.ranked())
 
         # Check if we have a stored message ID using bot_config collection
         try:
@@ -126,6 +236,7 @@ async def update_autoboard_message(bot: hikari.GatewayBot, mongo: MongoClient):
                     message=message_id,
                     components=components
                 )
+                _last_rendered = fingerprint
                 return
             except (hikari.NotFoundError, hikari.ForbiddenError):
                 # Message doesn't exist or we can't edit it
@@ -137,6 +248,8 @@ async def update_autoboard_message(bot: hikari.GatewayBot, mongo: MongoClient):
             components=components
         )
 
+        _last_rendered = fingerprint
+
         # Store the message ID in bot_config collection
         await mongo.bot_config.update_one(
             {"_id": "clanpoints_autoboard"},
@@ -152,58 +265,26 @@ async def update_autoboard_message(bot: hikari.GatewayBot, mongo: MongoClient):
         print(f"[ClanPoints Autoboard] Error updating autoboard: {type(e).__name__}: {e}")
 
 
-async def autoboard_update_loop(mongo: MongoClient):
-    """Main loop that updates the autoboard every 5 minutes"""
-    print("[ClanPoints Autoboard] Starting autoboard update task...")
-
-    while True:
-        try:
-            # Update the autoboard
-            await update_autoboard_message(bot_instance, mongo)
-
-            # Wait for the next update
-            await asyncio.sleep(UPDATE_INTERVAL)
-
-        except asyncio.CancelledError:
-            # Task is being cancelled, exit gracefully
-            print("[ClanPoints Autoboard] Update task cancelled")
-            break
-        except Exception as e:
-            print(f"[ClanPoints Autoboard] Error in update loop: {type(e).__name__}: {e}")
-            # Wait before retrying
-            await asyncio.sleep(60)
-
-
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
 async def on_bot_started(
         event: hikari.StartedEvent,
         mongo: MongoClient = lightbulb.di.INJECTED
 ) -> None:
-    """Start the autoboard update task when bot starts"""
-    global autoboard_task, bot_instance, mongo_client
+    """Schedule autoboard updates when bot starts"""
+    global bot_instance, mongo_client
 
     # Store bot instance for sending messages
     bot_instance = event.app
     mongo_client = mongo
 
-    # Create the task
-    autoboard_task = asyncio.create_task(autoboard_update_loop(mongo))
-    print("[ClanPoints Autoboard] Background task started!")
-
+    await load_leaderboard(mongo)
+    subscribe(on_points_change)
 
-@loader.listener(hikari.StoppingEvent)
-async def on_bot_stopping(event: hikari.StoppingEvent) -> None:
-    """Cancel the task when bot is stopping"""
-    global autoboard_task
-
-    if autoboard_task and not autoboard_task.done():
-        autoboard_task.cancel()
-        try:
-            await autoboard_task
-        except asyncio.CancelledError:
-            pass
-        print("[ClanPoints Autoboard] Background task cancelled!")
+    # Initial render, then only on points changes (plus a periodic full reconcile)
+    on_points_change(None)
+    schedule_periodic(reconcile_leaderboard, RECONCILE_INTERVAL, "clanpoints_autoboard", first_run_delay=RECONCILE_INTERVAL)
+    print(f"[ClanPoints Autoboard] Tracking {len(leaderboard.clans)} clans; board refreshes on points changes")
 
 
 @loader.command
@@ -224,6 +305,7 @@ class UpdateAutoboard(
         await ctx.respond("🔄 Updating clan points autoboard...", ephemeral=True)
 
         try:
+            await load_leaderboard(mongo)
             await update_autoboard_message(ctx.app, mongo)
             await ctx.edit_last_response("✅ Clan points autoboard updated successfully!")
         except Exception as e:
@@ -4,7 +4,6 @@ Scheduled task to send Disboard bump reminders every 6 hours.
 Checks if 6+ hours have passed since last bump and sends reminder to bump channel.
 """
 
-import asyncio
 import hikari
 import lightbulb
 from datetime import datetime, timezone, timedelta
@@ -20,7 +19,9 @@ from hikari.impl import (
     MessageActionRowBuilder as ActionRow,
 )
 
-from utils.mongo import MongoClient
+from utils import bot_data
+from utils.recovery import recovery_step
+from utils.scheduler import schedule_periodic
 from utils.constants import (
     BLUE_ACCENT,
     BUMP_CHANNEL_ID,
@@ -35,7 +36,6 @@ CHECK_INTERVAL = 3600  # Check every hour (3600 seconds)
 BUMP_COOLDOWN_HOURS = 6  # Remind after 6 hours
 
 # Global variables
-reminder_task = None
 bot_instance = None
 mongo_client = None
 
@@ -214,58 +214,17 @@ async def send_bump_reminder(first_time: bool = False):
         print(f"[Disboard Reminder] Error sending reminder: {e}")
 
 
-async def reminder_loop():
-    """Main reminder loop that checks every hour"""
-    print("[Disboard Reminder] Starting reminder monitoring task...")
+@recovery_step("disboard_reminder")
+async def on_bot_started() -> None:
+    """Schedule the reminder check when bot starts"""
+    global bot_instance, mongo_client
 
-    # Wait a bit for bot to fully initialize
-    await asyncio.sleep(10)
+    bot_instance = bot_data.data["bot"]
+    mongo_client = bot_data.data["mongo"]
 
-    while True:
-        try:
-            print(f"[Disboard Reminder] Running check at {datetime.now(timezone.utc)}")
-            await check_and_send_reminder()
-
-            # Wait for next check
-            await asyncio.sleep(CHECK_INTERVAL)
-
-        except asyncio.CancelledError:
-            print("[Disboard Reminder] Task cancelled")
-            break
-        except Exception as e:
-            print(f"[Disboard Reminder] Error in reminder loop: {e}")
-            await asyncio.sleep(60)  # Wait a minute before retrying
-
-
-@loader.listener(hikari.StartedEvent)
-@lightbulb.di.with_di
-async def on_bot_started(
-        event: hikari.StartedEvent,
-        mongo: MongoClient = lightbulb.di.INJECTED
-) -> None:
-    """Start the reminder task when bot starts"""
-    global reminder_task, bot_instance, mongo_client
-
-    bot_instance = event.app
-    mongo_client = mongo
-
-    # Start the background task
-    reminder_task = asyncio.create_task(reminder_loop())
-    print("[Disboard Reminder] Background monitoring task started!")
-
-
-@loader.listener(hikari.StoppingEvent)
-async def on_bot_stopping(event: hikari.StoppingEvent) -> None:
-    """Cancel the task when bot stops"""
-    global reminder_task
-
-    if reminder_task and not reminder_task.done():
-        reminder_task.cancel()
-        try:
-            await reminder_task
-        except asyncio.CancelledError:
-            pass
-        print("[Disboard Reminder] Background task cancelled!")
+    # Short delay lets the bot finish initializing before the first check
+    schedule_periodic(check_and_send_reminder, CHECK_INTERVAL, "disboard_reminder", first_run_delay=10)
+    print("[Disboard Reminder] Reminder check scheduled!")
 
 
 # Manual command for testing/admin use
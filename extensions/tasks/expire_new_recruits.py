@@ -1,60 +1,51 @@
 # extensions/tasks/expire_new_recruits.py
 """Daily task to expire new recruits after 12 days"""
 
-import asyncio
 import lightbulb
 import hikari
 from datetime import datetime, timedelta, timezone
 
 from utils.mongo import MongoClient
+from utils.scheduler import schedule_periodic
 
 loader = lightbulb.Loader()
 
-# Global variables
-expire_task = None
-
 # Configuration
 CHECK_INTERVAL = 3600  # Check every hour (3600 seconds)
 
 
-async def expire_old_recruits_loop(mongo: MongoClient):
-    """Loop that checks for expired recruits periodically"""
-    print("[New Recruits] Starting expiration check task...")
-
-    while True:
-        try:
-            current_time = datetime.now(timezone.utc)
-            print(f"[New Recruits] Running expiration check at {current_time.strftime('%Y-%m-%d %H:%M:%S')} UTC")
-
-            # Find and expire old recruits
-            result = await mongo.new_recruits.update_many(
-                {
-                    "expires_at": {"$lte": current_time},
-                    "is_expired": False
-                },
-                {"$set": {"is_expired": True}}
-            )
+async def expire_old_recruits(mongo: MongoClient):
+    """Mark recruits past their expiry and clean up long-expired ones"""
+    try:
+        current_time = datetime.now(timezone.utc)
+        print(f"[New Recruits] Running expiration check at {current_time.strftime('%Y-%m-%d %H:%M:%S')} UTC")
 
-            if result.modified_count > 0:
-                print(f"[New Recruits] Expired {result.modified_count} new recruits")
+        # Find and expire old recruits
+        result = await mongo.new_recruits.update_many(
+            {
+                "expires_at": {"$lte": current_time},
+                "is_expired": False
+            },
+            {"$set": {"is_expired": True}}
+        )
 
-                # Optional: Clean up very old expired recruits (> 30 days)
-                cleanup_date = current_time - timedelta(days=30)
-                cleanup_result = await mongo.new_recruits.delete_many({
-                    "is_expired": True,
-                    "expires_at": {"$lt": cleanup_date}
-                })
+        if result.modified_count > 0:
+            print(f"[New Recruits] Expired {result.modified_count} new recruits")
 
-                if cleanup_result.deleted_count > 0:
-                    print(f"[New Recruits] Cleaned up {cleanup_result.deleted_count} old expired recruits")
-            else:
-                print(f"[New Recruits] No recruits to expire")
+            # Optional: Clean up very old expired recruits (> 30 days)
+            cleanup_date = current_time - timedelta(days=30)
+            cleanup_result = await mongo.new_recruits.delete_many({
+                "is_expired": True,
+                "expires_at": {"$lt": cleanup_date}
+            })
 
-        except Exception as e:
-            print(f"[ERROR] Failed to expire recruits: {type(e).__name__}: {e}")
+            if cleanup_result.deleted_count > 0:
+                print(f"[New Recruits] Cleaned up {cleanup_result.deleted_count} old expired recruits")
+        else:
+            print(f"[New Recruits] No recruits to expire")
 
-        # Wait before next check
-        await asyncio.sleep(CHECK_INTERVAL)
+    except Exception as e:
+        print(f"[ERROR] Failed to expire recruits: {type(e).__name__}: {e}")
 
 
 @loader.listener(hikari.StartedEvent)
@@ -63,26 +54,9 @@ async def on_bot_started(
         event: hikari.StartedEvent,
         mongo: MongoClient = lightbulb.di.INJECTED
 ) -> None:
-    """Start the expiration task when bot starts"""
-    global expire_task
-
-    # Create the task
-    expire_task = asyncio.create_task(expire_old_recruits_loop(mongo))
-    print("[New Recruits] Expiration check background task started!")
-
-
-@loader.listener(hikari.StoppingEvent)
-async def on_bot_stopping(event: hikari.StoppingEvent) -> None:
-    """Cancel the task when bot is stopping"""
-    global expire_task
-
-    if expire_task and not expire_task.done():
-        expire_task.cancel()
-        try:
-            await expire_task
-        except asyncio.CancelledError:
-            pass
-        print("[New Recruits] Expiration check task cancelled!")
+    """Schedule the expiration check when bot starts"""
+    schedule_periodic(expire_old_recruits, CHECK_INTERVAL, "expire_new_recruits", args=[mongo])
+    print("[New Recruits] Expiration check scheduled!")
 
 
 # Manual command to force expire check
@@ -6,11 +6,13 @@ import hikari
 import lightbulb
 import coc
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional, Set, Tuple
 from utils.mongo import MongoClient
 from utils.constants import GREEN_ACCENT, RED_ACCENT, BLUE_ACCENT
 from utils.emoji import emojis
 from utils import bot_data
+from utils.scheduler import schedule_periodic
+from extensions.tasks import roster_watch
 
 # Import Components V2
 from hikari.impl import (
@@ -29,12 +31,62 @@ RECRUITMENT_LOG_CHANNEL = 1345589195695194113
 MINIMUM_STAY_HOURS = 24  # No refund if they leave within 24 hours
 
 # Global variables
-monitor_task = None
 bot_instance = None
 mongo_client = None
 coc_client = None
 
 
+def group_recruits_by_clan(recruits: List[Dict]) -> Dict[str, List[Dict]]:
+    """Group recruit documents by the clan they are currently tracked in"""
+    grouped: Dict[str, List[Dict]] = {}
+    for recruit in recruits:
+        grouped.setdefault(recruit["current_clan"].upper(), []).append(recruit)
+    return grouped
+
+
+async def fetch_clan_roster(clan_tag: str) -> Optional[Set[str]]:
+    """Fetch a clan's member tags once, or None if the clan could not be loaded"""
+    try:
+        clan = await coc_client.get_clan(clan_tag)
+    except Exception as e:
+        print(f"[Recruit Monitor] Failed to fetch roster for {clan_tag}, falling back to player lookups: {e}")
+        return None
+
+    if not clan:
+        return None
+
+    return {member.tag.upper() for member in clan.members}
+
+
+async def split_by_roster(recruits: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Split recruits into (still in clan, needs player lookup) using one roster call per clan.
+
+    Recruits missing from their clan's roster - or whose clan roster could not be
+    fetched - are returned in the second list so the caller can confirm with get_player.
+    """
+    grouped = group_recruits_by_clan(recruits)
+    rosters = await asyncio.gather(*(fetch_clan_roster(tag) for tag in grouped))
+
+    present, unresolved = [], []
+    for (clan_tag, clan_recruits), roster in zip(grouped.items(), rosters):
+        if roster is None:
+            unresolved.extend(clan_recruits)
+            continue
+
+        for recruit in clan_recruits:
+            if recruit["player_tag"].upper() in roster:
+                present.append(recruit)
+            else:
+                unresolved.append(recruit)
+
+    print(
+        f"[Recruit Monitor] Roster diff: {len(grouped)} clan(s) fetched, "
+        f"{len(present)} present, {len(unresolved)} need player lookup"
+    )
+    return present, unresolved
+
+
 async def check_expired_recruits():
     """Check for recruits whose 12-day monitoring period has expired"""
     # Check if coc_client is initialized
@@ -53,7 +105,17 @@ async def check_expired_recruits():
 
     print(f"[Recruit Monitor] Found {len(expired_recruits)} expired recruits to process")
 
-    for recruit in expired_recruits:
+    # One roster fetch per clan instead of one player fetch per recruit
+    present, unresolved = await split_by_roster(expired_recruits)
+
+    for recruit in present:
+        try:
+            # Success! They stayed the full 12 days
+            await process_successful_recruitment(recruit, None)
+        except Exception as e:
+            print(f"[ERROR] Failed to process expired recruit {recruit['player_tag']}: {e}")
+
+    for recruit in unresolved:
         try:
             # Check if player is still in the clan
             player = await coc_client.get_player(recruit["player_tag"])
@@ -106,7 +168,10 @@ async def check_early_departures():
 
     print(f"[Recruit Monitor] Checking {len(recruits_to_monitor)} active recruits for departures (filtered from {len(active_recruits)})")
 
-    for recruit in recruits_to_monitor:
+    # Recruits still on their clan's roster need no further API calls
+    _, unresolved = await split_by_roster(recruits_to_monitor)
+
+    for recruit in unresolved:
         try:
             # Check current clan status
             player = await coc_client.get_player(recruit["player_tag"])
@@ -255,40 +320,48 @@ async def process_expired_departure(recruit: Dict, player):
     pass
 
 
-async def monitor_loop():
-    """Main monitoring loop"""
-    print("[Recruit Monitor] Starting recruitment monitoring task...")
-    
-    # Wait for coc_client to be initialized
-    retry_count = 0
-    while not coc_client and retry_count < 10:
-        print(f"[Recruit Monitor] Waiting for CoC client initialization... (attempt {retry_count + 1}/10)")
-        await asyncio.sleep(5)
-        retry_count += 1
-    
-    if not coc_client:
-        print("[ERROR] CoC client failed to initialize after 50 seconds. Stopping recruit monitor.")
+async def on_roster_event(event_type: str, clan_tag: str, player_tag: str):
+    """Track early departures as soon as the roster watch sees a recruit leave"""
+    if event_type != roster_watch.LEAVE or not mongo_client:
         return
 
-    while True:
-        try:
-            print(f"[Recruit Monitor] Running checks at {datetime.now(timezone.utc)}")
+    recruit = await mongo_client.new_recruits.find_one({
+        "player_tag": player_tag,
+        "current_clan": clan_tag,
+        "is_expired": False,
+        "recruitment_history": {"$elemMatch": {"clan_tag": clan_tag, "left_at": None}},
+        "$or": [
+            {"monitoring_active": True},
+            {"monitoring_active": {"$exists": False}}
+        ]
+    })
+    if not recruit:
+        return
 
-            # Check for expired 12-day periods
-            await check_expired_recruits()
+    # Confirm with the API - it also tells us which clan they moved to
+    player = await coc_client.get_player(player_tag)
+    if player.clan and player.clan.tag == recruit["current_clan"]:
+        return
 
-            # Check for early departures
-            await check_early_departures()
+    await track_early_departure(recruit, player)
 
-            # Wait for next check
-            await asyncio.sleep(CHECK_INTERVAL)
 
-        except asyncio.CancelledError:
-            print("[Recruit Monitor] Task cancelled")
-            break
-        except Exception as e:
-            print(f"[Recruit Monitor] Error in monitor loop: {e}")
-            await asyncio.sleep(60)  # Wait a minute before retrying
+roster_watch.subscribe(on_roster_event)
+
+
+async def run_recruit_checks():
+    """Run the periodic recruitment checks"""
+    if not coc_client:
+        print("[ERROR] CoC client not initialized. Skipping recruit checks.")
+        return
+
+    print(f"[Recruit Monitor] Running checks at {datetime.now(timezone.utc)}")
+
+    # Check for expired 12-day periods
+    await check_expired_recruits()
+
+    # Check for early departures
+    await check_early_departures()
 
 
 @loader.listener(hikari.StartedEvent)
@@ -298,8 +371,8 @@ async def on_bot_started(
         mongo: MongoClient = lightbulb.di.INJECTED,
         coc_api: coc.Client = lightbulb.di.INJECTED
 ) -> None:
-    """Start the monitoring task when bot starts"""
-    global monitor_task, bot_instance, mongo_client, coc_client
+    """Schedule the monitoring checks when bot starts"""
+    global bot_instance, mongo_client, coc_client
 
     bot_instance = event.app
     mongo_client = mongo
@@ -311,23 +384,8 @@ async def on_bot_started(
         if coc_client:
             print("[Recruit Monitor] Using CoC client from bot_data")
 
-    # Start the background task
-    monitor_task = asyncio.create_task(monitor_loop())
-    print("[Recruit Monitor] Background monitoring task started!")
-
-
-@loader.listener(hikari.StoppingEvent)
-async def on_bot_stopping(event: hikari.StoppingEvent) -> None:
-    """Cancel the task when bot stops"""
-    global monitor_task
-
-    if monitor_task and not monitor_task.done():
-        monitor_task.cancel()
-        try:
-            await monitor_task
-        except asyncio.CancelledError:
-            pass
-        print("[Recruit Monitor] Background task cancelled!")
+    schedule_periodic(run_recruit_checks, CHECK_INTERVAL, "recruit_monitor", first_run_delay=5)
+    print("[Recruit Monitor] Monitoring checks scheduled!")
 
 
 # Manual commands for testing/admin use
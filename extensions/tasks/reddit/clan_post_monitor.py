@@ -1,4 +1,3 @@
-import asyncio
 import os
 import re
 from datetime import datetime, timezone, timedelta
@@ -6,8 +5,6 @@ from typing import Optional, Dict, List
 
 import hikari
 import lightbulb
-import asyncpraw
-import asyncprawcore
 
 from dotenv import load_dotenv
 
@@ -25,13 +22,24 @@ from hikari.impl import (
     ThumbnailComponentBuilder as Thumbnail,
 )
 
+from utils import bot_data
 from utils.mongo import MongoClient
+from utils.recovery import recovery_step, BACKGROUND
+from utils.scheduler import scheduler, schedule_periodic
 from utils.constants import RED_ACCENT
+from utils.points_events import publish_points_change
+
+from utils.lazy_import import lazy_import
+from utils.metrics import request_timer
+
+asyncpraw = lazy_import("asyncpraw")
+asyncprawcore = lazy_import("asyncprawcore")
 
 loader = lightbulb.Loader()
 
 # Configuration
 REDDIT_CHECK_INTERVAL = 60
+MONITOR_JOB_ID = "clan_post_monitor"
 DISCORD_CHANNEL_ID = 1345229148880371765
 POINTS_CHANNEL_ID = 1345589195695194113
 MONITORED_SUBREDDIT = "ClashOfClansRecruit"
@@ -49,7 +57,6 @@ def debug_print(*args, **kwargs):
 
 
 # Global variables
-reddit_monitor_task = None
 bot_instance = None
 mongo_client = None
 reddit_instance = None
@@ -99,7 +106,8 @@ async def check_and_refresh_reddit_connection():
         if reddit_instance:
             try:
                 # Simple test - try to get subreddit info
-                test_subreddit = await reddit_instance.subreddit(MONITORED_SUBREDDIT, fetch=True)
+                with request_timer("reddit", "subreddit_about"):
+                    test_subreddit = await reddit_instance.subreddit(MONITORED_SUBREDDIT, fetch=True)
                 return True
             except Exception as e:
                 debug_print(f"Reddit connection test failed: {e}")
@@ -243,7 +251,8 @@ async def check_reddit_posts(startup_mode=False):
 
         # Get recent posts (increase limit on startup to catch older posts)
         post_limit = 100 if startup_mode else 50
-        new_posts = [post async for post in subreddit.new(limit=post_limit)]
+        with request_timer("reddit", "subreddit_new"):
+            new_posts = [post async for post in subreddit.new(limit=post_limit)]
 
         debug_print(f"Checking {len(new_posts)} posts. Keywords: {', '.join(SEARCH_KEYWORDS)}")
         debug_print(
@@ -306,6 +315,7 @@ async def check_reddit_posts(startup_mode=False):
                                     {"tag": tag},
                                     {"$set": {"points": new_points}}
                                 )
+                                publish_points_change(tag)
 
                                 debug_print(
                                     f"Awarded {REDDIT_POST_POINTS} points to {clan_data.get('name')} - Total: {new_points}")
@@ -357,30 +367,6 @@ async def check_reddit_posts(startup_mode=False):
         debug_print(f"Error checking Reddit: {type(e).__name__}: {e}")
 
 
-async def reddit_monitor_loop():
-    """Main loop that monitors Reddit"""
-    debug_print("Starting Reddit monitoring loop...")
-    
-    # Run initial check immediately on startup
-    try:
-        print("[Clan Post Monitor] Running initial startup check for posts from last 48 hours...")
-        await check_reddit_posts(startup_mode=True)
-    except Exception as e:
-        print(f"[Clan Post Monitor] Error in startup check: {type(e).__name__}: {e}")
-
-    while True:
-        try:
-            await check_reddit_posts()
-            await asyncio.sleep(REDDIT_CHECK_INTERVAL)
-
-        except asyncio.CancelledError:
-            debug_print("Monitor loop cancelled")
-            break
-        except Exception as e:
-            debug_print(f"Error in monitor loop: {type(e).__name__}: {e}")
-            await asyncio.sleep(60)  # Wait a minute before retrying
-
-
 async def initialize_reddit():  # Note: async
     """Initialize Reddit instance with detailed debugging"""
     global reddit_instance_created_at
@@ -428,26 +414,34 @@ async def initialize_reddit():  # Note: async
         return None
 
 
-@loader.listener(hikari.StartedEvent)
-@lightbulb.di.with_di
-async def on_bot_started(
-        event: hikari.StartedEvent,
-        mongo: MongoClient = lightbulb.di.INJECTED
-) -> None:
+@recovery_step("reddit_clan_posts", priority=BACKGROUND)
+async def on_bot_started() -> None:
     """Start the Reddit monitor when bot starts"""
-    global reddit_monitor_task, bot_instance, mongo_client, reddit_instance
+    global bot_instance, mongo_client, reddit_instance
 
     # Store instances
-    bot_instance = event.app
-    mongo_client = mongo
+    bot_instance = bot_data.data["bot"]
+    mongo_client = bot_data.data["mongo"]
 
     # Initialize Reddit
     reddit_instance = await initialize_reddit()  # Add await
 
     if reddit_instance:
-        # Start monitoring task
-        reddit_monitor_task = asyncio.create_task(reddit_monitor_loop())
-        print(f"[Clan Post Monitor] Task started at {datetime.now(timezone.utc).isoformat()}")
+        # Catch up on posts from the last 48 hours, then check on an interval
+        print("[Clan Post Monitor] Scheduling startup check for posts from last 48 hours...")
+        scheduler.add_job(
+            check_reddit_posts,
+            kwargs={"startup_mode": True},
+            id=f"{MONITOR_JOB_ID}_startup",
+            replace_existing=True
+        )
+        schedule_periodic(
+            check_reddit_posts,
+            REDDIT_CHECK_INTERVAL,
+            MONITOR_JOB_ID,
+            first_run_delay=REDDIT_CHECK_INTERVAL
+        )
+        print(f"[Clan Post Monitor] Scheduled at {datetime.now(timezone.utc).isoformat()}")
         print(f"[Clan Post Monitor] Monitoring r/{MONITORED_SUBREDDIT} for keywords: {', '.join(SEARCH_KEYWORDS)}")
         print(f"[Clan Post Monitor] Check interval: {REDDIT_CHECK_INTERVAL} seconds")
         debug_print("Clan Post Monitor task started!")
@@ -458,15 +452,7 @@ async def on_bot_started(
 @loader.listener(hikari.StoppingEvent)
 async def on_bot_stopping(event: hikari.StoppingEvent) -> None:
     """Stop the Reddit monitor when bot stops"""
-    global reddit_monitor_task, reddit_instance
-
-    if reddit_monitor_task and not reddit_monitor_task.done():
-        reddit_monitor_task.cancel()
-        try:
-            await reddit_monitor_task
-        except asyncio.CancelledError:
-            pass
-        debug_print("Clan Post Monitor task cancelled")
+    global reddit_instance
 
     # Close Reddit connection
     if reddit_instance:
@@ -761,6 +747,7 @@ if ENABLE_REDDIT_DEBUG_COMMANDS:
                             {"tag": tag},
                             {"$set": {"points": new_points}}
                         )
+                        publish_points_change(tag)
                         
                         # Send points notification
                         points_components = await create_points_notification(clan_data)
@@ -1,4 +1,3 @@
-import asyncio
 import os
 import re
 from datetime import datetime, timezone
@@ -6,8 +5,6 @@ from typing import Optional, Dict, List
 
 import hikari
 import lightbulb
-import asyncpraw
-import asyncprawcore
 
 from dotenv import load_dotenv
 
@@ -25,13 +22,23 @@ from hikari.impl import (
     ThumbnailComponentBuilder as Thumbnail,
 )
 
+from utils import bot_data
 from utils.mongo import MongoClient
+from utils.recovery import recovery_step, BACKGROUND
+from utils.scheduler import scheduler, schedule_periodic
 from utils.constants import RED_ACCENT
 
+from utils.lazy_import import lazy_import
+from utils.metrics import request_timer
+
+asyncpraw = lazy_import("asyncpraw")
+asyncprawcore = lazy_import("asyncprawcore")
+
 loader = lightbulb.Loader()
 
 # Configuration
 REDDIT_CHECK_INTERVAL = 60
+MONITOR_JOB_ID = "th17_search_monitor"
 DISCORD_CHANNEL_ID = 1345220245077360660  # TH17 recruitment notifications channel
 PING_ROLE_ID = 1313898812787527754  # Role to ping for TH17 searches
 MONITORED_SUBREDDIT = "ClashOfClansRecruit"
@@ -47,7 +54,6 @@ def debug_print(*args, **kwargs):
 
 
 # Global variables
-reddit_monitor_task = None
 bot_instance = None
 mongo_client = None
 reddit_instance = None
@@ -100,7 +106,8 @@ async def check_and_refresh_reddit_connection():
         if reddit_instance:
             try:
                 # Simple test - try to get subreddit info
-                test_subreddit = await reddit_instance.subreddit(MONITORED_SUBREDDIT, fetch=True)
+                with request_timer("reddit", "subreddit_about"):
+                    test_subreddit = await reddit_instance.subreddit(MONITORED_SUBREDDIT, fetch=True)
                 return True
             except Exception as e:
                 debug_print(f"Reddit connection test failed: {e}")
@@ -241,7 +248,8 @@ async def check_th17_posts():
         subreddit = await reddit_instance.subreddit(MONITORED_SUBREDDIT)
 
         # Get recent posts (last 25)
-        new_posts = [post async for post in subreddit.new(limit=25)]
+        with request_timer("reddit", "subreddit_new"):
+            new_posts = [post async for post in subreddit.new(limit=25)]
 
         debug_print(
             f"Checking {len(new_posts)} posts. Last check: {datetime.fromtimestamp(last_check_time) if last_check_time else 'Never'}"
@@ -331,23 +339,6 @@ async def check_th17_posts():
         debug_print(f"Error checking Reddit: {type(e).__name__}: {e}")
 
 
-async def reddit_monitor_loop():
-    """Main loop that monitors Reddit for TH17 posts"""
-    debug_print("Starting TH17 Reddit monitoring loop...")
-
-    while True:
-        try:
-            await check_th17_posts()
-            await asyncio.sleep(REDDIT_CHECK_INTERVAL)
-
-        except asyncio.CancelledError:
-            debug_print("Monitor loop cancelled")
-            break
-        except Exception as e:
-            debug_print(f"Error in monitor loop: {type(e).__name__}: {e}")
-            await asyncio.sleep(60)  # Wait a minute before retrying
-
-
 async def initialize_reddit():
     """Initialize Reddit instance with detailed debugging"""
     global reddit_instance_created_at
@@ -396,26 +387,21 @@ async def initialize_reddit():
         return None
 
 
-@loader.listener(hikari.StartedEvent)
-@lightbulb.di.with_di
-async def on_bot_started(
-        event: hikari.StartedEvent,
-        mongo: MongoClient = lightbulb.di.INJECTED
-) -> None:
+@recovery_step("reddit_th17_search", priority=BACKGROUND)
+async def on_bot_started() -> None:
     """Start the TH17 Reddit monitor when bot starts"""
-    global reddit_monitor_task, bot_instance, mongo_client, reddit_instance
+    global bot_instance, mongo_client, reddit_instance
 
     # Store instances
-    bot_instance = event.app
-    mongo_client = mongo
+    bot_instance = bot_data.data["bot"]
+    mongo_client = bot_data.data["mongo"]
 
     # Initialize Reddit
     reddit_instance = await initialize_reddit()
 
     if reddit_instance:
-        # Start monitoring task
-        reddit_monitor_task = asyncio.create_task(reddit_monitor_loop())
-        debug_print("TH17 Search Monitor task started!")
+        schedule_periodic(check_th17_posts, REDDIT_CHECK_INTERVAL, MONITOR_JOB_ID)
+        debug_print("TH17 Search Monitor scheduled!")
     else:
         print("[TH17 Search Monitor] Failed to initialize Reddit API. Check your credentials.")
 
@@ -423,15 +409,7 @@ async def on_bot_started(
 @loader.listener(hikari.StoppingEvent)
 async def on_bot_stopping(event: hikari.StoppingEvent) -> None:
     """Stop the TH17 Reddit monitor when bot stops"""
-    global reddit_monitor_task, reddit_instance
-
-    if reddit_monitor_task and not reddit_monitor_task.done():
-        reddit_monitor_task.cancel()
-        try:
-            await reddit_monitor_task
-        except asyncio.CancelledError:
-            pass
-        debug_print("TH17 Search Monitor task cancelled")
+    global reddit_instance
 
     # Close Reddit connection
     if reddit_instance:
@@ -492,7 +470,7 @@ if ENABLE_REDDIT_DEBUG_COMMANDS:
             status_lines = []
 
             # Check if monitor is running
-            if reddit_monitor_task and not reddit_monitor_task.done():
+            if scheduler.get_job(MONITOR_JOB_ID):
                 status_lines.append("✅ Monitor is running")
             else:
                 status_lines.append("❌ Monitor is not running")
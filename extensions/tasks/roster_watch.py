@@ -0,0 +1,169 @@
+# extensions/tasks/roster_watch.py
+"""Background task that watches rosters of clans holding active recruits and emits join/leave events"""
+
+import asyncio
+import hikari
+import lightbulb
+import coc
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+from utils.mongo import MongoClient
+from utils import bot_data
+from utils.scheduler import schedule_periodic
+
+loader = lightbulb.Loader()
+
+# Configuration
+POLL_INTERVAL = 120  # Poll watched clans every 2 minutes
+WATCHLIST_REFRESH_INTERVAL = 600  # Re-read which clans hold active recruits every 10 minutes
+
+# Event types passed to subscribers
+JOIN = "join"
+LEAVE = "leave"
+
+# Subscriber signature: async def handler(event_type, clan_tag, player_tag)
+RosterHandler = Callable[[str, str, str], Awaitable[None]]
+
+# Global variables
+mongo_client = None
+coc_client = None
+last_refresh: Optional[datetime] = None
+
+# Last known state per watched clan
+last_rosters: Dict[str, Set[str]] = {}
+clan_details: Dict[str, Dict] = {}
+last_polled_at: Dict[str, datetime] = {}
+watched_clans: Set[str] = set()
+_subscribers: List[RosterHandler] = []
+
+
+def subscribe(handler: RosterHandler) -> None:
+    """Register a coroutine to receive join/leave events"""
+    if handler not in _subscribers:
+        _subscribers.append(handler)
+
+
+def unsubscribe(handler: RosterHandler) -> None:
+    """Remove a previously registered handler"""
+    if handler in _subscribers:
+        _subscribers.remove(handler)
+
+
+def get_member_clan(player_tag: str, max_age: int = POLL_INTERVAL * 2) -> Optional[Dict]:
+    """
+    Return the watched clan a player is currently in, if a recent roster shows them.
+
+    Only positive answers are meaningful - a miss just means the player is not in a
+    watched clan (or the roster is stale), so callers should fall back to the CoC API.
+    """
+    player_tag = player_tag.upper()
+    now = datetime.now(timezone.utc)
+
+    for clan_tag, roster in last_rosters.items():
+        polled_at = last_polled_at.get(clan_tag)
+        if not polled_at or (now - polled_at).total_seconds() > max_age:
+            continue
+        if player_tag in roster:
+            return clan_details.get(clan_tag)
+
+    return None
+
+
+async def _emit(event_type: str, clan_tag: str, player_tag: str):
+    """Fan an event out to every subscriber, isolating their failures"""
+    for handler in list(_subscribers):
+        try:
+            await handler(event_type, clan_tag, player_tag)
+        except Exception as e:
+            print(f"[Roster Watch] Subscriber {getattr(handler, '__name__', handler)} failed on {event_type} {player_tag}: {e}")
+
+
+async def refresh_watchlist():
+    """Watch only clans that currently hold actively monitored recruits"""
+    global watched_clans
+
+    clan_tags = await mongo_client.new_recruits.distinct(
+        "current_clan",
+        {
+            "is_expired": False,
+            "current_clan": {"$ne": None},
+            "expires_at": {"$gt": datetime.now(timezone.utc)},
+            "$or": [
+                {"monitoring_active": True},
+                {"monitoring_active": {"$exists": False}}
+            ]
+        }
+    )
+    watched_clans = {tag.upper() for tag in clan_tags if tag}
+
+    # Forget clans that no longer hold recruits
+    for clan_tag in list(last_rosters):
+        if clan_tag not in watched_clans:
+            last_rosters.pop(clan_tag, None)
+            clan_details.pop(clan_tag, None)
+            last_polled_at.pop(clan_tag, None)
+
+
+async def poll_clan(clan_tag: str):
+    """Fetch one clan's roster and emit events for the delta against the last poll"""
+    try:
+        clan = await coc_client.get_clan(clan_tag)
+    except Exception as e:
+        print(f"[Roster Watch] Failed to fetch {clan_tag}: {e}")
+        return
+
+    if not clan:
+        return
+
+    roster = {member.tag.upper() for member in clan.members}
+    previous = last_rosters.get(clan_tag)
+
+    last_rosters[clan_tag] = roster
+    last_polled_at[clan_tag] = datetime.now(timezone.utc)
+    clan_details[clan_tag] = {
+        "tag": clan.tag,
+        "name": clan.name,
+        "badge_url": clan.badge.url if clan.badge else None
+    }
+
+    # First sighting only establishes the baseline
+    if previous is None:
+        return
+
+    for player_tag in previous - roster:
+        await _emit(LEAVE, clan_tag, player_tag)
+    for player_tag in roster - previous:
+        await _emit(JOIN, clan_tag, player_tag)
+
+
+async def watch_tick():
+    """Refresh the watchlist when due, then poll every watched clan"""
+    global last_refresh
+
+    if not coc_client:
+        print("[ERROR] CoC client not initialized. Skipping roster watch.")
+        return
+
+    now = datetime.now(timezone.utc)
+    if not last_refresh or (now - last_refresh).total_seconds() >= WATCHLIST_REFRESH_INTERVAL:
+        await refresh_watchlist()
+        last_refresh = now
+
+    await asyncio.gather(*(poll_clan(tag) for tag in watched_clans))
+
+
+@loader.listener(hikari.StartedEvent)
+@lightbulb.di.with_di
+async def on_bot_started(
+        event: hikari.StartedEvent,
+        mongo: MongoClient = lightbulb.di.INJECTED,
+        coc_api: coc.Client = lightbulb.di.INJECTED
+) -> None:
+    """Schedule the roster watch when bot starts"""
+    global mongo_client, coc_client
+
+    mongo_client = mongo
+    coc_client = coc_api or bot_data.data.get("coc_client")
+
+    schedule_periodic(watch_tick, POLL_INTERVAL, "roster_watch")
+    print("[Roster Watch] Roster polling scheduled!")
@@ -10,18 +10,28 @@ import logging
 # Suppress py.warnings logger to hide deprecation warnings in terminal
 logging.getLogger("py.warnings").setLevel(logging.ERROR)
 
+import asyncio
+import math
+from utils.startup import StartupProfiler, load_cogs, load_extensions
+
+# Started first so the report covers dependency imports too
+profiler = StartupProfiler()
+
 import os
 import hikari
 import lightbulb
 from dotenv import load_dotenv
 from utils.mongo import MongoClient
 import coc
-from utils.startup import load_cogs
 from utils.cloudinary_client import CloudinaryClient
 from extensions.autocomplete import preload_autocomplete_cache
 from utils.session_cleanup import start_cleanup_task
+from utils.scheduler import start_scheduler, resume_scheduler, shutdown_scheduler
+from utils.clan_registry import start_clan_registry, stop_clan_registry
+from utils.recovery import recovery_step, run_recovery, CRITICAL
+from utils.metrics import instrument_coc_client, register_collector, start_metrics_server, stop_metrics_server
 from extensions.events.message import dm_screenshot_upload
-from utils import bot_data
+from utils import bot_data, user_cache
 
 load_dotenv()
 
@@ -61,9 +71,82 @@ registry.register_value(coc.Client, clash_client)
 registry.register_value(CloudinaryClient, cloudinary_client)
 registry.register_value(hikari.GatewayBot, bot)
 
+async def load_clan_data() -> None:
+    """Clan registry, then the autocomplete indexes built from it"""
+    await start_clan_registry(mongo_client)
+    await preload_autocomplete_cache(mongo_client)
+
+
+def runtime_gauges():
+    """Gateway latency and cache sizes, read when metrics are scraped"""
+    from utils import ai_client
+
+    if not math.isnan(bot.heartbeat_latency):  # NaN until the first heartbeat
+        yield "bot_gateway_latency_seconds", "Discord gateway heartbeat latency", {}, bot.heartbeat_latency
+    for name, value in user_cache.get_cache_stats().items():
+        if isinstance(value, (int, float)):
+            yield "bot_user_cache", "User/member lookup cache counters", {"stat": name}, value
+    for name, value in ai_client.get_cache_stats().items():
+        yield "bot_ai_cache", "AI response cache counters", {"stat": name}, value
+
+
+register_collector(runtime_gauges)
+
+
+async def send_reboot_notice() -> None:
+    """DM whoever ran /reboot that the bot is back"""
+    try:
+        reboot_status = await mongo_client.bot_config.find_one({"_id": "reboot_status"})
+        if reboot_status and reboot_status.get("reboot_pending"):
+            user_id = reboot_status.get("user_id")
+            if user_id:
+                try:
+                    from hikari.impl import (
+                        ContainerComponentBuilder as Container,
+                        TextDisplayComponentBuilder as Text,
+                        MediaGalleryComponentBuilder as Media,
+                        MediaGalleryItemBuilder as MediaItem,
+                    )
+                    from utils.constants import GREEN_ACCENT
+
+                    dm_channel = await bot.rest.create_dm_channel(user_id)
+                    await bot.rest.create_message(
+                        channel=dm_channel,
+                        components=[
+                            Container(
+                                accent_color=GREEN_ACCENT,
+                                components=[
+                                    Text(content=(
+                                        "## ✅ Bot is Back Online!\n\n"
+                                        "Reboot completed successfully.\n"
+                                        "All systems operational."
+                                    )),
+                                    Media(items=[MediaItem(media="assets/Green_Footer.png")])
+                                ]
+                            )
+                        ]
+                    )
+                except Exception as e:
+                    print(f"Failed to send reboot notification: {e}")
+
+            # Clear the reboot flag
+            await mongo_client.bot_config.delete_one({"_id": "reboot_status"})
+    except Exception as e:
+        print(f"Failed to check reboot status: {e}")
+
+
 @bot.listen(hikari.StartingEvent)
 async def on_starting(_: hikari.StartingEvent) -> None:
     """Bot starting event"""
+    # Shared scheduler must exist before extensions register their jobs
+    await profiler.timed("scheduler", start_scheduler(mongo_client))
+
+    # Shared clan registry, followed through a change stream from here on.
+    # Its Mongo round trips and the CoC login overlap with the extension imports below.
+    clan_data = asyncio.create_task(profiler.timed("clan registry + autocomplete", load_clan_data()))
+    coc_login = asyncio.create_task(profiler.timed("coc login", clash_client.login_with_tokens("")))
+    await asyncio.sleep(0)
+
     # Non-command extensions that need to be loaded explicitly
     all_extensions = [
         "extensions.components",
@@ -86,6 +169,7 @@ async def on_starting(_: hikari.StartingEvent) -> None:
         "extensions.tasks.reddit.th17_search_monitor",
         "extensions.tasks.expire_new_recruits",
         "extensions.tasks.recruit_monitor",
+        "extensions.tasks.roster_watch",
         "extensions.tasks.clan_info_updater",
         "extensions.tasks.bidding_recovery",
         "extensions.events.message.ticket_account_collection",
@@ -99,59 +183,55 @@ async def on_starting(_: hikari.StartingEvent) -> None:
         "extensions.commands.poll",
     ] + load_cogs(disallowed={"example"})
 
-    await client.load_extensions(*all_extensions)
-    await client.start()
-    await clash_client.login_with_tokens("")
+    try:
+        await load_extensions(client, all_extensions, profiler)
+    except BaseException:
+        # Don't leave the registry load and CoC login running with nobody awaiting them
+        for task in (clan_data, coc_login):
+            task.cancel()
+        await asyncio.gather(clan_data, coc_login, return_exceptions=True)
+        raise
+    await clan_data
+
+    # Command sync, CoC login and the reboot DM don't depend on each other
+    await asyncio.gather(
+        profiler.timed("lightbulb start", client.start()),
+        coc_login,
+        profiler.timed("reboot notice", send_reboot_notice()),
+    )
+
+    if not instrument_coc_client(clash_client):
+        print("[Metrics] CoC client has no HTTP client to time")
+    await start_metrics_server()
 
     dm_screenshot_upload.load(bot)
+    user_cache.load(bot)
     start_cleanup_task()
 
-    # Check for reboot notification
-    try:
-        reboot_status = await mongo_client.bot_config.find_one({"_id": "reboot_status"})
-        if reboot_status and reboot_status.get("reboot_pending"):
-            user_id = reboot_status.get("user_id")
-            if user_id:
-                try:
-                    from hikari.impl import (
-                        ContainerComponentBuilder as Container,
-                        TextDisplayComponentBuilder as Text,
-                        MediaGalleryComponentBuilder as Media,
-                        MediaGalleryItemBuilder as MediaItem,
-                    )
-                    from utils.constants import GREEN_ACCENT
+    # print("Bot started with DM screenshot listener and cleanup task")
 
-                    dm_channel = await bot.rest.create_dm_channel(user_id)
-                    await bot.rest.create_message(
-                        channel=dm_channel,
-                        components=[
-                            Container(
-                                accent_color=GREEN_ACCENT,
-                                components=[
-                                    Text(content=(
-                                        "## ✅ Bot is Back Online!\n\n"
-                                        "Reboot completed successfully.\n"
-                                        "All systems operational."
-                                    )),
-                                    Media(items=[MediaItem(media="assets/Green_Footer.png")])
-                                ]
-                            )
-                        ]
-                    )
-                except Exception as e:
-                    print(f"Failed to send reboot notification: {e}")
+@recovery_step("scheduler", priority=CRITICAL, after=("bidding_backfill", "poll_backfill"))
+async def resume_jobs() -> None:
+    """Run scheduled jobs (including ones missed while offline) now that clients are ready"""
+    resume_scheduler()
 
-            # Clear the reboot flag
-            await mongo_client.bot_config.delete_one({"_id": "reboot_status"})
-    except Exception as e:
-        print(f"Failed to check reboot status: {e}")
 
-    # print("Bot started with DM screenshot listener and cleanup task")
+@bot.listen(hikari.StartedEvent)
+async def on_started(_: hikari.StartedEvent) -> None:
+    """Bot started event"""
+    profiler.report()
+
+    # Bidding deadlines and poll endings first, REST-heavy scans last
+    await run_recovery()
 
 @bot.listen(hikari.StoppingEvent)
 async def on_stopping(_: hikari.StoppingEvent) -> None:
     """Bot stopping event"""
+    stop_clan_registry()
+    await shutdown_scheduler()
+    await stop_metrics_server()
     dm_screenshot_upload.unload(bot)
+    user_cache.unload(bot)
     # print("Bot stopped, event listeners unloaded")
     # Properly close the coc.py client to avoid unclosed session warnings
     await clash_client.close()
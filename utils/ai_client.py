@@ -0,0 +1,206 @@
+# utils/ai_client.py
+
+"""
+Shared client for the Anthropic Messages API.
+
+Responses are cached by a hash of the full request (model, system prompt,
+messages, max_tokens), so a repeated question or a re-submitted ticket answer
+is served without another model round trip. Identical requests that arrive
+while one is already in flight share its result.
+
+System prompts are sent as a cacheable block (Anthropic prompt caching), and
+every API call's latency and token usage is recorded under the caller's tag
+(e.g. "ticket:<channel_id>") so cost can be read per ticket.
+
+Set ANTHROPIC_API_URL to point at utils/ai_stub_server for offline runs.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+
+from utils.metrics import request_timer
+from utils.user_cache import TTLCache
+
+# API Configuration
+ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+ANTHROPIC_API_URL = os.getenv("ANTHROPIC_API_URL", "https://api.anthropic.com/v1/messages")
+ANTHROPIC_VERSION = "2023-06-01"
+REQUEST_TIMEOUT = 60  # seconds
+
+# Cache configuration
+DEFAULT_TTL = 3600  # seconds
+MAX_TTL = 86400  # Upper bound for any caller's ttl
+MAX_CACHED_RESPONSES = 500
+
+# Usage accounting
+MAX_TRACKED_TAGS = 500  # Oldest tags are dropped first
+USAGE_FIELDS = ("input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+
+stats: Dict[str, int] = {
+    "requests": 0,
+    "cache_hits": 0,
+    "deduplicated": 0,
+    "api_calls": 0,
+    "api_errors": 0,
+}
+
+_responses = TTLCache(MAX_TTL, MAX_CACHED_RESPONSES)  # key -> (expires_at, text)
+_inflight: Dict[str, asyncio.Future] = {}
+_usage_by_tag: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+
+
+class AIRequestError(Exception):
+    """The API call failed; status is the HTTP status, or None for network errors"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+def is_configured() -> bool:
+    """Whether requests can be sent (an API key, or a stub server URL)"""
+    return bool(ANTHROPIC_API_KEY) or not ANTHROPIC_API_URL.startswith("https://api.anthropic.com")
+
+
+def request_key(model: str, system: str, messages: List[dict], max_tokens: int) -> str:
+    """Content hash identifying a request"""
+    payload = json.dumps(
+        {"model": model, "system": system, "messages": messages, "max_tokens": max_tokens},
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _record_usage(tag: Optional[str], latency: Optional[float], usage: Optional[dict]) -> None:
+    """Add one call (latency None for a cache hit) to the tag's running totals"""
+    if tag is None:
+        return
+
+    totals = _usage_by_tag.get(tag)
+    if totals is None:
+        totals = {"calls": 0, "cache_hits": 0, "latency": 0.0, **{field: 0 for field in USAGE_FIELDS}}
+        _usage_by_tag[tag] = totals
+        while len(_usage_by_tag) > MAX_TRACKED_TAGS:
+            _usage_by_tag.popitem(last=False)
+    _usage_by_tag.move_to_end(tag)
+
+    if latency is None:
+        totals["cache_hits"] += 1
+        return
+
+    totals["calls"] += 1
+    totals["latency"] += latency
+    for field in USAGE_FIELDS:
+        totals[field] += (usage or {}).get(field) or 0
+
+
+async def _post(payload: dict) -> Tuple[str, dict]:
+    headers = {
+        "x-api-key": ANTHROPIC_API_KEY or "stub",
+        "anthropic-version": ANTHROPIC_VERSION,
+        "content-type": "application/json"
+    }
+
+    stats["api_calls"] += 1
+    try:
+        with request_timer("anthropic", "messages"):
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as session:
+                async with session.post(ANTHROPIC_API_URL, headers=headers, json=payload) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        raise AIRequestError(f"API error {response.status}: {error_text}", response.status)
+                    result = await response.json()
+                    return result["content"][0]["text"], result.get("usage") or {}
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise AIRequestError(f"Network error: {e}") from e
+    except (KeyError, IndexError, ValueError) as e:
+        raise AIRequestError(f"Malformed response: {e}") from e
+
+
+async def create_message(
+        system: str,
+        messages: List[dict],
+        model: str,
+        max_tokens: int,
+        ttl: float = DEFAULT_TTL,
+        tag: Optional[str] = None
+) -> str:
+    """
+    Response text for a Messages API request, from the cache when the same
+    request was answered within ttl seconds. Raises AIRequestError on failure
+    (failures are never cached). Latency and tokens are recorded under tag.
+    """
+    stats["requests"] += 1
+    key = request_key(model, system, messages, max_tokens)
+
+    cached = _responses.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        stats["cache_hits"] += 1
+        _record_usage(tag, None, None)
+        return cached[1]
+
+    task = _inflight.get(key)
+    owner = task is None
+    if not owner:
+        stats["deduplicated"] += 1
+    else:
+        payload = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "messages": messages,
+            # Static prompt marked cacheable; prompts under the model's minimum are simply sent uncached
+            "system": [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+        }
+        task = asyncio.ensure_future(_post(payload))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    start = time.perf_counter()
+    try:
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        text, usage = await asyncio.shield(task)
+    except AIRequestError:
+        stats["api_errors"] += 1
+        raise
+
+    if owner:
+        latency = time.perf_counter() - start
+        _record_usage(tag, latency, usage)
+        print(
+            f"[AI] {tag or model}: {latency:.2f}s, {usage.get('input_tokens', 0)} in "
+            f"(+{usage.get('cache_read_input_tokens') or 0} cached) / {usage.get('output_tokens', 0)} out"
+        )
+    else:
+        _record_usage(tag, None, None)
+
+    _responses.put(key, (time.monotonic() + min(ttl, MAX_TTL), text))
+    return text
+
+
+def clear_cache() -> None:
+    """Forget every cached response"""
+    _responses.clear()
+
+
+def get_usage(tag: str) -> Dict[str, float]:
+    """Calls, cache hits, total latency and token counts recorded under tag"""
+    return dict(_usage_by_tag.get(tag) or {})
+
+
+def get_cache_stats() -> Dict[str, float]:
+    """Hit/miss counters and the current cache size"""
+    served = stats["cache_hits"] + stats["deduplicated"]
+    return {
+        **stats,
+        "hit_rate": served / stats["requests"] if stats["requests"] else 0.0,
+        "cached_responses": len(_responses),
+        "in_flight": len(_inflight),
+    }
@@ -0,0 +1,96 @@
+# utils/ai_stub_server.py
+
+"""
+Local stand-in for the Anthropic Messages API, for exercising the AI paths
+(and the response cache in utils/ai_client) without network access or an API key.
+
+Replies are deterministic: the same request always gets the same text, and
+every request received is counted so cache hits can be verified.
+
+Run it standalone and point the bot at it:
+    python -m utils.ai_stub_server --port 8765
+    ANTHROPIC_API_URL=http://127.0.0.1:8765/v1/messages python main.py
+
+or in-process with start_stub_server() / stop_stub_server().
+"""
+
+import argparse
+import hashlib
+from typing import Dict, Optional
+
+from aiohttp import web
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+stats: Dict[str, int] = {"requests": 0}
+_runner: Optional[web.AppRunner] = None
+
+
+def stub_reply(payload: dict) -> str:
+    """Deterministic reply text for a request"""
+    messages = payload.get("messages") or [{}]
+    last = messages[-1].get("content", "")
+    if isinstance(last, list):
+        last = "\n".join(block.get("text", "") for block in last if isinstance(block, dict))
+
+    digest = hashlib.sha256(repr(payload).encode("utf-8")).hexdigest()[:8]
+    return f"[stub {digest}] {last}"
+
+
+async def handle_messages(request: web.Request) -> web.Response:
+    stats["requests"] += 1
+    try:
+        payload = await request.json()
+    except ValueError:
+        return web.json_response({"type": "error", "error": {"message": "invalid JSON"}}, status=400)
+
+    text = stub_reply(payload)
+    return web.json_response({
+        "id": f"msg_stub_{stats['requests']}",
+        "type": "message",
+        "role": "assistant",
+        "model": payload.get("model", "stub"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "usage": {
+            "input_tokens": len(repr(payload)) // 4,
+            "output_tokens": len(text) // 4,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+        },
+    })
+
+
+def create_app() -> web.Application:
+    app = web.Application()
+    app.router.add_post("/v1/messages", handle_messages)
+    return app
+
+
+async def start_stub_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> str:
+    """Serve the stub in the running event loop; returns the messages URL"""
+    global _runner
+
+    if _runner is None:
+        _runner = web.AppRunner(create_app())
+        await _runner.setup()
+        await web.TCPSite(_runner, host, port).start()
+        print(f"[AI Stub] Listening on http://{host}:{port}/v1/messages")
+    return f"http://{host}:{port}/v1/messages"
+
+
+async def stop_stub_server() -> None:
+    global _runner
+
+    if _runner is not None:
+        await _runner.cleanup()
+        _runner = None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Anthropic Messages API stub")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+    web.run_app(create_app(), host=args.host, port=args.port)
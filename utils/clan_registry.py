@@ -0,0 +1,328 @@
+# utils/clan_registry.py
+
+"""
+Shared in-memory registry of family clans.
+
+Loaded once from settings.clan_data and kept current by a MongoDB change
+stream. Deployments without change streams (standalone servers) fall back to
+polling, plus targeted re-reads whenever the points bus reports a write.
+Clan objects are shared between callers - treat them as read-only.
+"""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional, Set
+
+from bson import Timestamp
+from pymongo.errors import OperationFailure, PyMongoError
+
+from utils.classes import Clan
+from utils.points_events import subscribe
+from utils.scheduler import schedule_periodic, remove_job
+
+# Configuration
+POLL_INTERVAL = 60  # Fallback full reload when change streams are unavailable
+RETRY_DELAY = 10  # Wait before reopening a failed change stream
+POLL_JOB_ID = "clan_registry_poll"
+
+# Server error codes meaning change streams can't run here
+CHANGE_STREAMS_UNSUPPORTED = {40573}  # "only supported on replica sets"
+CHANGE_STREAM_HISTORY_LOST = 286
+
+# Registry state
+_clans: Dict[str, Clan] = {}  # tag -> clan
+_tag_by_id: Dict[object, str] = {}  # document _id -> tag (delete events only carry _id)
+_by_type: Dict[str, Set[str]] = {}
+_by_status: Dict[str, Set[str]] = {}
+_by_role_id: Dict[int, str] = {}
+
+_loaded = False
+_load_lock = asyncio.Lock()
+_watch_task: Optional[asyncio.Task] = None
+_mongo = None
+mode = "stopped"  # "change_stream", "polling" or "stopped"
+version = 0  # Bumped on every change, so derived caches know when to rebuild
+
+
+def _unindex(tag: str) -> None:
+    global version
+
+    clan = _clans.pop(tag, None)
+    if not clan:
+        return
+
+    version += 1
+
+    _tag_by_id.pop(clan._data.get("_id"), None)
+    for lookup, key in ((_by_type, clan.type), (_by_status, clan.status)):
+        tags = lookup.get(key)
+        if tags:
+            tags.discard(tag)
+            if not tags:
+                del lookup[key]
+    if clan.role_id and _by_role_id.get(clan.role_id) == tag:
+        del _by_role_id[clan.role_id]
+
+
+def as_clan(data: dict) -> Clan:
+    """
+    Clan for a raw document, reusing the registry's instance when the
+    document is unchanged (so its parsed fields aren't rebuilt per caller)
+    """
+    clan = _clans.get(data.get("tag"))
+    if clan is not None and (clan._data is data or clan._data == data):
+        return clan
+    return Clan(data=data)
+
+
+def _index(data: dict) -> None:
+    """Add or replace one clan document in every lookup"""
+    global version
+
+    try:
+        clan = as_clan(data)
+    except Exception as e:
+        print(f"[Clan Registry] Skipping unreadable clan {data.get('tag')}: {e}")
+        return
+
+    if not clan.tag:
+        return
+
+    # Unchanged document (e.g. a poll reload) - keep the instance and version
+    if _clans.get(clan.tag) is clan and _tag_by_id.get(data.get("_id")) == clan.tag:
+        return
+
+    # A tag can change on edit - drop whatever this document was indexed as
+    old_tag = _tag_by_id.get(data.get("_id"))
+    if old_tag:
+        _unindex(old_tag)
+    _unindex(clan.tag)
+
+    _clans[clan.tag] = clan
+    version += 1
+    _tag_by_id[data.get("_id")] = clan.tag
+    _by_type.setdefault(clan.type, set()).add(clan.tag)
+    _by_status.setdefault(clan.status, set()).add(clan.tag)
+    if clan.role_id:
+        _by_role_id[clan.role_id] = clan.tag
+
+
+def _clear() -> None:
+    global version
+
+    _clans.clear()
+    _tag_by_id.clear()
+    _by_type.clear()
+    _by_status.clear()
+    _by_role_id.clear()
+    version += 1
+
+
+def _remove_by_id(doc_id) -> None:
+    tag = _tag_by_id.get(doc_id)
+    if tag:
+        _unindex(tag)
+
+
+async def reload(mongo) -> None:
+    """Replace the registry contents with a fresh read of every clan"""
+    global _loaded
+
+    docs = await mongo.clans.find().to_list(length=None)
+
+    # Reconcile in place so unchanged clans keep their shared instances
+    seen_ids = {data.get("_id") for data in docs}
+    for doc_id in [doc_id for doc_id in _tag_by_id if doc_id not in seen_ids]:
+        _remove_by_id(doc_id)
+    for data in docs:
+        _index(data)
+
+    _loaded = True
+
+
+async def _ensure_loaded(mongo) -> None:
+    if _loaded:
+        return
+    async with _load_lock:
+        if not _loaded:
+            await reload(mongo)
+
+
+async def refresh_clan(mongo, tag: str) -> Optional[Clan]:
+    """Re-read one clan from the database (removing it if it's gone)"""
+    data = await mongo.clans.find_one({"tag": tag})
+    if data:
+        _index(data)
+    else:
+        _unindex(tag)
+    return _clans.get(tag)
+
+
+# ========== READS ==========
+
+async def get_clans(mongo) -> List[Clan]:
+    """Every clan"""
+    await _ensure_loaded(mongo)
+    return list(_clans.values())
+
+
+async def get_clan(mongo, tag: str) -> Optional[Clan]:
+    """Clan by tag"""
+    await _ensure_loaded(mongo)
+    return _clans.get(tag)
+
+
+async def get_clans_by_tags(mongo, tags: Iterable[str]) -> List[Clan]:
+    """Clans for the given tags, in the order given, skipping unknown tags"""
+    await _ensure_loaded(mongo)
+    return [_clans[tag] for tag in tags if tag in _clans]
+
+
+async def get_clans_by_type(mongo, clan_type: str) -> List[Clan]:
+    """Clans of one type (e.g. "FWA")"""
+    await _ensure_loaded(mongo)
+    return [_clans[tag] for tag in _by_type.get(clan_type, ())]
+
+
+async def get_clans_by_status(mongo, status: str) -> List[Clan]:
+    """Clans with one status (e.g. "Trial")"""
+    await _ensure_loaded(mongo)
+    return [_clans[tag] for tag in _by_status.get(status, ())]
+
+
+async def get_clan_by_role(mongo, role_id: int) -> Optional[Clan]:
+    """Clan whose member role is role_id"""
+    await _ensure_loaded(mongo)
+    tag = _by_role_id.get(role_id)
+    return _clans.get(tag) if tag else None
+
+
+async def get_clan_docs(mongo, clan_type: Optional[str] = None) -> List[dict]:
+    """Raw clan documents (optionally of one type) for code that works with dicts"""
+    clans = await get_clans_by_type(mongo, clan_type) if clan_type else await get_clans(mongo)
+    return [clan._data for clan in clans]
+
+
+async def get_distinct(mongo, field: str) -> List:
+    """Distinct non-empty values of a clan field, like clans.distinct(field)"""
+    await _ensure_loaded(mongo)
+    values = {clan._data.get(field) for clan in _clans.values()}
+    return sorted(value for value in values if value not in (None, ""))
+
+
+# ========== KEEPING CURRENT ==========
+
+def _apply_change(change: dict) -> None:
+    operation = change.get("operationType")
+
+    if operation in ("insert", "update", "replace"):
+        document = change.get("fullDocument")
+        if document:
+            _index(document)
+        else:
+            # Deleted again before the lookup ran
+            _remove_by_id(change["documentKey"]["_id"])
+    elif operation == "delete":
+        _remove_by_id(change["documentKey"]["_id"])
+    elif operation in ("drop", "rename", "dropDatabase", "invalidate"):
+        _clear()
+
+
+async def _poll() -> None:
+    """Fallback: full reload on an interval"""
+    if _mongo is not None:
+        await reload(_mongo)
+
+
+def _on_points_change(clan_tag: Optional[str]) -> None:
+    """While polling, pick up the bot's own writes right away instead of on the next poll"""
+    if mode != "polling" or _mongo is None:
+        return
+    if clan_tag:
+        asyncio.create_task(refresh_clan(_mongo, clan_tag))
+    else:
+        asyncio.create_task(reload(_mongo))
+
+
+async def _cluster_time(mongo) -> Optional[Timestamp]:
+    """
+    Current cluster time. Taken before a reload so the stream opened afterwards
+    starts from it, and writes made during the reload aren't missed.
+    """
+    try:
+        reply = await mongo.get_database("admin").command("hello")
+    except PyMongoError as e:
+        print(f"[Clan Registry] Could not read cluster time: {e}")
+        return None
+    return reply.get("operationTime")  # Absent on standalone servers
+
+
+async def _watch(mongo, start_at: Optional[Timestamp]) -> None:
+    """Follow the change stream; reload and reopen on errors, or fall back to polling"""
+    global mode
+
+    resume_token = None
+    while True:
+        try:
+            async with await mongo.clans.watch(
+                    full_document="updateLookup",
+                    resume_after=resume_token,
+                    start_at_operation_time=start_at if resume_token is None else None
+            ) as stream:
+                if mode != "change_stream":
+                    remove_job(POLL_JOB_ID)
+                    mode = "change_stream"
+                    print("[Clan Registry] Following change stream")
+
+                async for change in stream:
+                    resume_token = stream.resume_token
+                    _apply_change(change)
+                    if change.get("operationType") == "invalidate":
+                        resume_token = None
+                        start_at = await _cluster_time(mongo)
+                        await reload(mongo)
+
+        except OperationFailure as e:
+            if e.code in CHANGE_STREAMS_UNSUPPORTED:
+                mode = "polling"
+                schedule_periodic(_poll, POLL_INTERVAL, POLL_JOB_ID, first_run_delay=POLL_INTERVAL)
+                print(f"[Clan Registry] Change streams unavailable - polling every {POLL_INTERVAL}s")
+                return
+            if e.code == CHANGE_STREAM_HISTORY_LOST:
+                resume_token = None
+            print(f"[Clan Registry] Change stream error: {e}")
+        except PyMongoError as e:
+            print(f"[Clan Registry] Change stream interrupted: {e}")
+
+        # Resync whatever was missed before reopening
+        await asyncio.sleep(RETRY_DELAY)
+        start_at = await _cluster_time(mongo)
+        try:
+            await reload(mongo)
+        except PyMongoError as e:
+            print(f"[Clan Registry] Reload failed: {e}")
+
+
+async def start_clan_registry(mongo) -> None:
+    """Load every clan and start following changes"""
+    global _mongo, _watch_task
+
+    _mongo = mongo
+    start_at = await _cluster_time(mongo)
+    async with _load_lock:
+        await reload(mongo)
+    subscribe(_on_points_change)
+
+    if _watch_task is None or _watch_task.done():
+        _watch_task = asyncio.create_task(_watch(mongo, start_at))
+    print(f"[Clan Registry] Loaded {len(_clans)} clans")
+
+
+def stop_clan_registry() -> None:
+    """Stop following changes (reads keep serving the last known state)"""
+    global _watch_task, mode
+
+    if _watch_task and not _watch_task.done():
+        _watch_task.cancel()
+    _watch_task = None
+    remove_job(POLL_JOB_ID)
+    mode = "stopped"
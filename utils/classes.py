@@ -1,22 +1,31 @@
 import random
 from utils.emoji import EmojiType
 
+# Marks a lazily computed field that hasn't been computed yet
+_UNSET = object()
+
 
 class Clan:
+    """
+    A clan document. Slotted and read-only by convention: instances are shared
+    through the clan registry, and derived fields are computed on first use.
+    """
+
+    __slots__ = (
+        "_data", "_partial_emoji",
+        "announcement_id", "chat_channel_id", "emoji", "tag", "leader_id", "leader_role_id",
+        "leadership_channel_id", "logo", "banner", "name", "profile", "role_id",
+        "rules_channel_id", "status", "th_attribute", "th_requirements", "thread_id",
+        "thread_message_id", "type", "points", "recruit_count", "placeholder_points",
+        "recruit_welcome",
+    )
+
     def __init__(self, data: dict):
         self._data = data
+        self._partial_emoji = _UNSET
         self.announcement_id: int = data.get("announcement_id")
         self.chat_channel_id: int = data.get("chat_channel_id")
         self.emoji: str = data.get("emoji")
-
-        # only attempt to parse if it at least has two colons
-        if self.emoji.count(":") >= 2:
-            try:
-                self.partial_emoji = EmojiType(self.emoji).partial_emoji
-            except (IndexError, ValueError):
-                self.partial_emoji = None
-        else:
-            self.partial_emoji = None
         self.tag: str = data.get("tag")
         self.leader_id: int = data.get("leader_id")
         self.leader_role_id: int = data.get("leader_role_id")
@@ -38,7 +47,24 @@ class Clan:
         self.placeholder_points: float = data.get("placeholder_points", 0.0)
         self.recruit_welcome: str = data.get("recruit_welcome")
 
+    @property
+    def partial_emoji(self):
+        """The clan emoji as a hikari emoji, parsed on first access (None if not a custom emoji)"""
+        if self._partial_emoji is _UNSET:
+            emoji = None
+            # only attempt to parse if it at least has two colons
+            if isinstance(self.emoji, str) and self.emoji.count(":") >= 2:
+                try:
+                    emoji = EmojiType(self.emoji).partial_emoji
+                except (IndexError, ValueError):
+                    emoji = None
+            self._partial_emoji = emoji
+        return self._partial_emoji
+
+
 class Auction:
+    __slots__ = ("_data", "player_tag", "is_finalized", "winner", "amount", "bids")
+
     def __init__(self, data: dict):
         self._data = data
         self.player_tag: str = data.get("player_tag")
@@ -59,6 +85,8 @@ class Auction:
 
 
 class Bid:
+    __slots__ = ("_data", "clan_tag", "placed_by", "amount")
+
     def __init__(self, data):
         self._data = data
         self.clan_tag: str = data.get("clan_tag")
@@ -83,6 +111,13 @@ class FWA:
 class NewRecruit:
     """Represents a new recruit being tracked for 12 days"""
 
+    __slots__ = (
+        "_data", "player_tag", "player_name", "player_th_level",
+        "discord_user_id", "ticket_channel_id", "ticket_thread_id",
+        "created_at", "expires_at",
+        "recruitment_history", "current_clan", "total_clans_joined", "is_expired",
+    )
+
     def __init__(self, data: dict):
         self._data = data
 
@@ -125,4 +160,4 @@ class NewRecruit:
             return 0
         from datetime import datetime, timezone
         delta = self.expires_at - datetime.now(timezone.utc)
-        return max(0, delta.total_seconds() / 86400)
\ No newline at end of file
+        return max(0, delta.total_seconds() / 86400)
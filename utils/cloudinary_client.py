@@ -1,6 +1,3 @@
-import cloudinary
-import cloudinary.uploader
-import cloudinary.api
 import os
 from typing import Optional, Dict, Any
 import aiohttp
@@ -11,13 +8,23 @@ class CloudinaryClient:
     """Handles all Cloudinary operations for the bot"""
 
     def __init__(self):
-        # Configure Cloudinary using environment variables
-        cloudinary.config(
-            cloud_name="dxmtzuomk",
-            api_key=os.getenv("CLOUDINARY_API_KEY"),
-            api_secret=os.getenv("CLOUDINARY_API_SECRET"),
-            secure=True
-        )
+        # The SDK is imported and configured on first use, keeping it off the startup path
+        self._uploader_module = None
+
+    def _uploader(self):
+        """cloudinary.uploader, configured from environment variables"""
+        if self._uploader_module is None:
+            import cloudinary
+            import cloudinary.uploader
+
+            cloudinary.config(
+                cloud_name="dxmtzuomk",
+                api_key=os.getenv("CLOUDINARY_API_KEY"),
+                api_secret=os.getenv("CLOUDINARY_API_SECRET"),
+                secure=True
+            )
+            self._uploader_module = cloudinary.uploader
+        return self._uploader_module
 
     async def upload_image_from_url(self, image_url: str, folder: str, public_id: Optional[str] = None) -> Dict[
         str, Any]:
@@ -34,10 +41,11 @@ class CloudinaryClient:
         """
         try:
             # Run the upload in a thread pool since cloudinary.uploader is synchronous
+            uploader = self._uploader()
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: cloudinary.uploader.upload(
+                lambda: uploader.upload(
                     image_url,
                     folder=folder,
                     public_id=public_id,
@@ -64,10 +72,11 @@ class CloudinaryClient:
             Dictionary containing upload results
         """
         try:
+            uploader = self._uploader()
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: cloudinary.uploader.upload(
+                lambda: uploader.upload(
                     image_data,
                     folder=folder,
                     public_id=public_id,
@@ -91,10 +100,11 @@ class CloudinaryClient:
             Dictionary containing deletion results
         """
         try:
+            uploader = self._uploader()
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: cloudinary.uploader.destroy(public_id)
+                lambda: uploader.destroy(public_id)
             )
             return result
         except Exception as e:
@@ -1,26 +1,50 @@
-
+import re
+from typing import Dict, Optional
 
 import hikari
 
+_CUSTOM_EMOJI = re.compile(r"<(a?):(\w+):(\d+)>")
+
 
 class EmojiType:
+    """
+    A custom emoji string, parsed once on creation.
+    Instances are immutable so the module-level table can be shared freely.
+    """
+
+    __slots__ = ("emoji_string", "partial_emoji")
+
     def __init__(self, emoji_string):
-        self.emoji_string = emoji_string
-        self.str = emoji_string
+        object.__setattr__(self, "emoji_string", emoji_string)
+        object.__setattr__(self, "partial_emoji", self._parse(emoji_string))
+
+    @staticmethod
+    def _parse(emoji_string: str) -> hikari.CustomEmoji:
+        match = _CUSTOM_EMOJI.fullmatch(emoji_string.strip())
+        if not match:
+            raise ValueError(f"Not a custom emoji: {emoji_string!r}")
+        animated, name, emoji_id = match.groups()
+        return hikari.CustomEmoji(
+            name=name,
+            id=hikari.Snowflake(int(emoji_id)),
+            is_animated=bool(animated)
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
     def __str__(self):
         return self.emoji_string
 
+    def __repr__(self):
+        return f"EmojiType({self.emoji_string!r})"
+
     @property
-    def partial_emoji(self):
-        emoji = self.emoji_string.split(':')
-        animated = '<a:' in self.emoji_string
-        emoji = hikari.CustomEmoji(
-            name=emoji[1][1:],
-            id=hikari.Snowflake(int(str(emoji[2])[:-1])),
-            is_animated=animated
-        )
-        return emoji
+    def str(self):
+        return self.emoji_string
 
 class Emojis:
     def __init__(self):
@@ -81,8 +105,31 @@ class Emojis:
 emojis = Emojis()
 
 
+# O(1) typed lookups, built once from the table above
+TH_EMOJIS: Dict[int, EmojiType] = {
+    int(name[2:]): emoji for name, emoji in vars(emojis).items()
+    if name.startswith("TH") and name[2:].isdigit()
+}
 
+LEAGUE_EMOJIS: Dict[str, EmojiType] = {
+    f"{league} League {division}": getattr(emojis, f"{prefix}{number}")
+    for league, prefix in (
+        ("Champion", "Champ"), ("Master", "Master"), ("Crystal", "Crystal"),
+        ("Gold", "Gold"), ("Silver", "Silver"),
+    )
+    for number, division in ((1, "I"), (2, "II"), (3, "III"))
+}
 
 
+def th_emoji(th_level) -> Optional[EmojiType]:
+    """TH emoji for a town hall level (14, "14" or "TH14"), None if there isn't one"""
+    try:
+        level = int(str(th_level).upper().removeprefix("TH"))
+    except (TypeError, ValueError):
+        return None
+    return TH_EMOJIS.get(level)
 
 
+def league_emoji(league_name: str) -> Optional[EmojiType]:
+    """League emoji for a CWL league name (e.g. "Master League II"), None if there isn't one"""
+    return LEAGUE_EMOJIS.get(league_name)
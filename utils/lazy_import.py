@@ -0,0 +1,34 @@
+# utils/lazy_import.py
+
+"""
+Deferred imports for heavy optional dependencies.
+
+    asyncpraw = lazy_import("asyncpraw")
+
+binds a module object whose code only runs on first attribute access, so
+extensions that merely *might* use Reddit or PIL don't pay for them at load.
+The Reddit monitors, for example, only touch asyncpraw once a scan runs, well
+after startup; importing it up front would add its import time to every boot.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Module that is actually imported the first time one of its attributes is used"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
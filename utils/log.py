@@ -0,0 +1,110 @@
+# utils/log.py
+
+"""
+Leveled, structured logging in the bot's "[Tag] message" style.
+
+    log = get_logger("BAND API")
+    log.info("Fetched posts", count=len(posts))     # [BAND API] Fetched posts count=12
+    if log.debug_enabled:
+        log.debug("Raw response", body=json.dumps(data)[:1000])
+
+Disabled levels return before any formatting; guard debug output that is
+expensive to *build* with debug_enabled so it isn't computed at all.
+
+LOG_LEVEL sets the default level (INFO). LOG_LEVEL_<TAG> overrides one tag,
+e.g. LOG_LEVEL_BAND_API=DEBUG. LOG_FORMAT=json emits one JSON object per line.
+"""
+
+import json
+import logging
+import os
+import re
+import sys
+from typing import Dict
+
+DEBUG, INFO, WARNING, ERROR = logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR
+
+_handler = logging.StreamHandler(sys.stdout)
+_root = logging.getLogger("bot")
+_root.addHandler(_handler)
+_root.propagate = False
+_root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+_loggers: Dict[str, "Logger"] = {}
+
+
+class _Formatter(logging.Formatter):
+    def __init__(self, as_json: bool):
+        super().__init__()
+        self.as_json = as_json
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = getattr(record, "fields", {})
+        if self.as_json:
+            payload = {"level": record.levelname, "tag": record.tag, "message": record.getMessage(), **fields}
+            if record.exc_info:
+                payload["exc_info"] = self.formatException(record.exc_info)
+            return json.dumps(payload, default=str)
+
+        line = f"[{record.tag}] {record.getMessage()}"
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+_handler.setFormatter(_Formatter(os.getenv("LOG_FORMAT", "").lower() == "json"))
+
+
+class Logger:
+    """Tagged logger; keyword arguments become structured fields"""
+
+    __slots__ = ("tag", "_logger", "_configured_level")
+
+    def __init__(self, tag: str):
+        self.tag = tag
+        name = re.sub(r"\W+", "_", tag).strip("_").lower()
+        self._logger = logging.getLogger(f"bot.{name}")
+        level = os.getenv(f"LOG_LEVEL_{name.upper()}")
+        # NOTSET defers to LOG_LEVEL
+        self._configured_level = level.upper() if level else logging.NOTSET
+        self._logger.setLevel(self._configured_level)
+
+    @property
+    def debug_enabled(self) -> bool:
+        return self._logger.isEnabledFor(DEBUG)
+
+    def set_level(self, level: int) -> None:
+        self._logger.setLevel(level)
+
+    def reset_level(self) -> None:
+        """Back to the level from LOG_LEVEL_<TAG> / LOG_LEVEL"""
+        self._logger.setLevel(self._configured_level)
+
+    def _log(self, level: int, message: str, exc_info: bool, fields: dict) -> None:
+        self._logger.log(level, message, exc_info=exc_info, extra={"tag": self.tag, "fields": fields})
+
+    def debug(self, message: str, **fields) -> None:
+        if self._logger.isEnabledFor(DEBUG):
+            self._log(DEBUG, message, False, fields)
+
+    def info(self, message: str, **fields) -> None:
+        if self._logger.isEnabledFor(INFO):
+            self._log(INFO, message, False, fields)
+
+    def warning(self, message: str, **fields) -> None:
+        if self._logger.isEnabledFor(WARNING):
+            self._log(WARNING, message, False, fields)
+
+    def error(self, message: str, exc_info: bool = False, **fields) -> None:
+        if self._logger.isEnabledFor(ERROR):
+            self._log(ERROR, message, exc_info, fields)
+
+
+def get_logger(tag: str) -> Logger:
+    """Shared logger for a subsystem tag"""
+    logger = _loggers.get(tag)
+    if logger is None:
+        logger = _loggers[tag] = Logger(tag)
+    return logger
@@ -0,0 +1,283 @@
+# utils/metrics.py
+
+"""
+In-process metrics for the bot's hot paths.
+
+Counters and histograms live in this module and are rendered in the
+Prometheus text format, both on a local HTTP endpoint (METRICS_PORT, bound to
+127.0.0.1) and through /utilities metrics.
+
+    with EXTERNAL_REQUESTS.time(EXTERNAL_ERRORS, service="clashking", operation="discord_links"):
+        ...
+
+Recording is a dict lookup and a bisect, so it is cheap enough for every
+Mongo command and component interaction. Values count since last restart.
+"""
+
+import bisect
+import os
+import re
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from aiohttp import web
+
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9464"))  # 0 disables the endpoint
+
+# Seconds; spans a Mongo point lookup up to a slow scheduler job
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_metrics: Dict[str, "Counter | Histogram"] = {}
+_collectors: List[Callable[[], Iterable[Tuple[str, str, Dict[str, str], float]]]] = []
+_runner: Optional[web.AppRunner] = None
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Counter:
+    """Monotonic count per label set"""
+
+    __slots__ = ("name", "help", "values")
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _labels(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_format_labels(labels)} {value}" for labels, value in self.values.items()]
+        return lines
+
+
+class Histogram:
+    """Distribution of observed values (seconds) per label set"""
+
+    __slots__ = ("name", "help", "buckets", "series")
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = buckets
+        # labels -> [per-bucket counts (last is +Inf), sum, count]
+        self.series: Dict[Labels, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        self._observe(_labels(labels), value)
+
+    def _observe(self, key: Labels, value: float) -> None:
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def time(self, errors: Optional[Counter] = None, **labels) -> "Timer":
+        """Context manager observing the block's duration; exceptions also count in errors"""
+        return Timer(self, _labels(labels), errors)
+
+    def quantile(self, key: Labels, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation"""
+        counts, _, total = self.series[key]
+        target, seen = q * total, 0
+        for bound, count in zip(self.buckets, counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total, count) in self.series.items():
+            cumulative = 0
+            for bound, bucket in zip(self.buckets, counts):
+                cumulative += bucket
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(labels, le)} {cumulative}")
+            le = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_format_labels(labels, le)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class Timer:
+    """Times a with-block into a histogram series"""
+
+    __slots__ = ("histogram", "key", "errors", "start")
+
+    def __init__(self, histogram: Histogram, key: Labels, errors: Optional[Counter]):
+        self.histogram = histogram
+        self.key = key
+        self.errors = errors
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.histogram._observe(self.key, time.perf_counter() - self.start)
+        if exc_type is not None and self.errors is not None:
+            self.errors.values[self.key] = self.errors.values.get(self.key, 0) + 1
+
+
+def counter(name: str, help_text: str) -> Counter:
+    """Get or create a counter"""
+    if name not in _metrics:
+        _metrics[name] = Counter(name, help_text)
+    return _metrics[name]
+
+
+def histogram(name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+    """Get or create a histogram"""
+    if name not in _metrics:
+        _metrics[name] = Histogram(name, help_text, buckets)
+    return _metrics[name]
+
+
+def register_collector(collect: Callable[[], Iterable[Tuple[str, str, Dict[str, str], float]]]) -> None:
+    """Add a scrape-time source of gauges, yielding (name, help, labels, value)"""
+    _collectors.append(collect)
+
+
+# Shared metrics
+MONGO_COMMANDS = histogram("bot_mongo_command_seconds", "MongoDB command latency by collection and command")
+MONGO_ERRORS = counter("bot_mongo_command_errors_total", "Failed MongoDB commands by collection and command")
+EXTERNAL_REQUESTS = histogram("bot_external_request_seconds", "Outbound API latency by service and operation")
+EXTERNAL_ERRORS = counter("bot_external_request_errors_total", "Failed outbound API calls by service and operation")
+COMPONENT_HANDLERS = histogram("bot_component_handler_seconds", "register_action handler latency by action")
+COMPONENT_ERRORS = counter("bot_component_handler_errors_total", "register_action handlers that raised, by action")
+SCHEDULER_JOBS = histogram("bot_scheduler_job_seconds", "Scheduler job duration by job")
+SCHEDULER_JOB_ERRORS = counter("bot_scheduler_job_errors_total", "Failed scheduler job runs by job")
+SCHEDULER_JOBS_MISSED = counter("bot_scheduler_job_missed_total", "Scheduler runs that started late or were skipped")
+
+
+def request_timer(service: str, operation: str) -> Timer:
+    """Time one outbound API call (CoC, Reddit, ClashKing, Anthropic, Discord REST...)"""
+    return EXTERNAL_REQUESTS.time(EXTERNAL_ERRORS, service=service, operation=operation)
+
+
+# Player/clan tags and numeric IDs in API paths, folded so each endpoint is one series
+_PATH_IDS = re.compile(r"/(?:%23|#)[^/]+|/\d+")
+
+
+def instrument_coc_client(client) -> bool:
+    """
+    Time every request coc.py makes. Its HTTP client only exists after login,
+    so call this once logged in; returns False if the client isn't there.
+    """
+    http = getattr(client, "http", None)
+    request = getattr(http, "request", None)
+    if request is None or getattr(request, "_timed", False):
+        return request is not None
+
+    async def timed_request(route, *args, **kwargs):
+        operation = _PATH_IDS.sub("/{id}", getattr(route, "path", "") or "unknown")
+        with request_timer("coc", operation):
+            return await request(route, *args, **kwargs)
+
+    timed_request._timed = True
+    http.request = timed_request
+    return True
+
+
+# Per-object IDs (poll_end_123, reminder_<ObjectId>) would give one series per object
+_JOB_ID_SUFFIX = re.compile(r"_(?:\d+|[0-9a-f]{24})(?:_.*)?$")
+
+
+def job_label(job_id: str) -> str:
+    """Job family for a scheduler job ID"""
+    return _JOB_ID_SUFFIX.sub("", job_id)
+
+
+def render() -> str:
+    """Every metric in the Prometheus text exposition format"""
+    lines = []
+    for metric in _metrics.values():
+        lines += metric.render()
+
+    gauges: Dict[str, Tuple[str, List[str]]] = {}
+    for collect in _collectors:
+        try:
+            for name, help_text, labels, value in collect():
+                gauges.setdefault(name, (help_text, []))[1].append(
+                    f"{name}{_format_labels(_labels(labels))} {value}"
+                )
+        except Exception as e:
+            print(f"[Metrics] Collector {getattr(collect, '__name__', collect)} failed: {e}")
+    for name, (help_text, samples) in gauges.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", *samples]
+
+    return "\n".join(lines) + "\n"
+
+
+def summarize(metric: Histogram, limit: Optional[int] = None) -> List[Dict[str, object]]:
+    """Per-series count, average and p95, busiest first"""
+    rows = []
+    for key, (_, total, count) in metric.series.items():
+        rows.append({
+            "labels": dict(key),
+            "count": count,
+            "avg": total / count if count else 0.0,
+            "p95": metric.quantile(key, 0.95),
+        })
+    rows.sort(key=lambda row: row["count"], reverse=True)
+    return rows[:limit] if limit else rows
+
+
+def error_count(metric: Counter, labels: Dict[str, object]) -> int:
+    return int(metric.values.get(_labels(labels), 0))
+
+
+async def handle_metrics(_: web.Request) -> web.Response:
+    return web.Response(text=render(), content_type="text/plain", charset="utf-8")
+
+
+async def start_metrics_server(host: str = METRICS_HOST, port: int = METRICS_PORT) -> None:
+    """Serve /metrics for a local Prometheus scraper"""
+    global _runner
+
+    if _runner is not None or not port:
+        return
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle_metrics)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as e:
+        await runner.cleanup()
+        print(f"[Metrics] Could not listen on {host}:{port}: {e}")
+        return
+    _runner = runner
+    print(f"[Metrics] Serving http://{host}:{port}/metrics")
+
+
+async def stop_metrics_server() -> None:
+    global _runner
+
+    if _runner is not None:
+        await _runner.cleanup()
+        _runner = None
@@ -1,8 +1,36 @@
-from pymongo import AsyncMongoClient
+from pymongo import AsyncMongoClient, monitoring
+
+from utils.metrics import MONGO_COMMANDS, MONGO_ERRORS
+
+
+class CommandMetrics(monitoring.CommandListener):
+    """Records every command's latency in utils.metrics, by collection and command"""
+
+    def __init__(self):
+        self._pending = {}  # request_id -> (collection, command)
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        target = event.command.get(event.command_name)
+        if not isinstance(target, str):  # getMore carries a cursor id; admin commands have no collection
+            target = event.command.get("collection", "-")
+        self._pending[event.request_id] = (target, event.command_name)
+
+    def _finish(self, event, failed: bool) -> None:
+        collection, command = self._pending.pop(event.request_id, ("-", event.command_name))
+        MONGO_COMMANDS.observe(event.duration_micros / 1e6, collection=collection, command=command)
+        if failed:
+            MONGO_ERRORS.inc(collection=collection, command=command)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, True)
 
 
 class MongoClient(AsyncMongoClient):
     def __init__(self, uri: str, **kwargs):
+        kwargs.setdefault("event_listeners", [CommandMetrics()])
         super().__init__(host=uri, **kwargs)
         self.__settings = self.get_database("settings")
         self.button_store = self.__settings.get_collection("button_store")
@@ -11,6 +39,8 @@ class MongoClient(AsyncMongoClient):
         self.fwa = self.__settings.get_collection("fwa_data")
         self.fwa_band_data = self.__settings.get_collection("fwa_band_data")
         self.user_tasks = self.__settings.get_collection("user_tasks")
+        self.tasks = self.__settings.get_collection("tasks")
+        self.task_reminders = self.__settings.get_collection("task_reminders")
         self.user_profiles = self.__settings.get_collection("user_profiles")
         self.bot_config = self.__settings.get_collection("bot_config")
         self.reddit_monitor = self.__settings.get_collection("reddit_monitor")
@@ -24,4 +54,5 @@ class MongoClient(AsyncMongoClient):
         self.disboard_bump = self.__settings.get_collection("disboard_bump")
         self.staff_quiz_results = self.__settings.get_collection("staff_quiz_results")
         self.staff_mod_quiz_results = self.__settings.get_collection("staff_mod_quiz_results")
-        self.staff_logs = self.__settings.get_collection("staff_logs")
\ No newline at end of file
+        self.staff_logs = self.__settings.get_collection("staff_logs")
+        self.counters = self.__settings.get_collection("counters")
\ No newline at end of file
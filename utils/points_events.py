@@ -0,0 +1,42 @@
+# utils/points_events.py
+
+"""
+In-process bus for clan points changes.
+
+Anything that writes a clan's points, recruit count or board-visible fields
+(name, emoji) publishes here after the write; listeners such as the points
+autoboard re-read only what changed instead of polling every clan.
+"""
+
+from typing import Callable, List, Optional
+
+# Listener signature: def handler(clan_tag) - clan_tag None means "any/all clans"
+PointsListener = Callable[[Optional[str]], None]
+
+_listeners: List[PointsListener] = []
+
+
+def subscribe(listener: PointsListener) -> None:
+    """Register a listener for points changes"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def unsubscribe(listener: PointsListener) -> None:
+    """Remove a previously registered listener"""
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def publish_points_change(clan_tag: Optional[str] = None) -> None:
+    """
+    Announce that a clan's points/recruit count changed (None for bulk changes).
+
+    Listeners must be cheap and non-blocking (mark dirty, schedule work), so
+    publishing never slows down the command that made the change.
+    """
+    for listener in list(_listeners):
+        try:
+            listener(clan_tag)
+        except Exception as e:
+            print(f"[Points Events] Listener {getattr(listener, '__name__', listener)} failed for {clan_tag}: {e}")
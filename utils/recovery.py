@@ -0,0 +1,151 @@
+# utils/recovery.py
+
+"""
+Startup recovery pipeline.
+
+Extensions declare their after-start work with @recovery_step instead of
+each listening for StartedEvent and racing one another. run_recovery() runs
+the steps tier by tier - every CRITICAL step (bidding deadlines, poll endings,
+resuming the scheduler) before any NORMAL one, NORMAL before BACKGROUND - and
+within a tier starts each step as soon as the steps it runs after are done.
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Priority tiers, run in this order
+CRITICAL, NORMAL, BACKGROUND = 0, 1, 2
+TIER_NAMES = {CRITICAL: "critical", NORMAL: "normal", BACKGROUND: "background"}
+
+# Default pace for REST-heavy scans, so recovery doesn't burn the rate limit
+DEFAULT_RATE = 5  # requests per second
+
+
+class RecoveryStep:
+    """One unit of startup work and the outcome of its last run"""
+
+    __slots__ = ("name", "func", "priority", "after", "duration", "error")
+
+    def __init__(self, name: str, func: Callable[[], Awaitable[None]], priority: int, after: Tuple[str, ...]):
+        self.name = name
+        self.func = func
+        self.priority = priority
+        self.after = after
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+
+
+_steps: Dict[str, RecoveryStep] = {}
+last_run: Dict[str, object] = {}  # Summary of the most recent run_recovery()
+
+
+def recovery_step(name: str, priority: int = NORMAL, after: Iterable[str] = ()):
+    """Register an async, argument-less function to run once the bot has started"""
+    def decorator(func: Callable[[], Awaitable[None]]):
+        _steps[name] = RecoveryStep(name, func, priority, tuple(after))
+        return func
+    return decorator
+
+
+def _dependencies(step: RecoveryStep) -> List[str]:
+    """Steps this one really waits for - unknown or lower-tier names would never finish first"""
+    deps = []
+    for dep in step.after:
+        other = _steps.get(dep)
+        if other is None:
+            print(f"[Recovery] {step.name}: unknown dependency {dep!r}, ignoring")
+        elif other.priority > step.priority:
+            print(f"[Recovery] {step.name}: {dep!r} runs in a later tier, ignoring")
+        else:
+            deps.append(dep)
+    return deps
+
+
+def _find_cycle(graph: Dict[str, List[str]]) -> Optional[List[str]]:
+    visiting, visited = [], set()
+
+    def visit(name: str) -> Optional[List[str]]:
+        if name in visiting:
+            return visiting[visiting.index(name):] + [name]
+        if name in visited:
+            return None
+        visiting.append(name)
+        for dep in graph.get(name, ()):
+            cycle = visit(dep)
+            if cycle:
+                return cycle
+        visiting.pop()
+        visited.add(name)
+        return None
+
+    for name in graph:
+        cycle = visit(name)
+        if cycle:
+            return cycle
+    return None
+
+
+async def _run_step(step: RecoveryStep, deps: List[str], finished: Dict[str, asyncio.Event]) -> None:
+    # Ordering only - a failed dependency doesn't stop the steps after it
+    for dep in deps:
+        await finished[dep].wait()
+
+    start = time.perf_counter()
+    try:
+        await step.func()
+        step.error = None
+    except Exception as e:
+        step.error = f"{type(e).__name__}: {e}"
+        print(f"[Recovery] {step.name} failed: {step.error}")
+    finally:
+        step.duration = time.perf_counter() - start
+        finished[step.name].set()
+
+
+async def run_recovery() -> None:
+    """Run every registered step in priority order and report the time taken"""
+    start = time.perf_counter()
+    steps = list(_steps.values())
+    finished = {step.name: asyncio.Event() for step in steps}
+
+    graph = {step.name: _dependencies(step) for step in steps}
+    cycle = _find_cycle(graph)
+    if cycle:
+        print(f"[Recovery] Dependency cycle {' -> '.join(cycle)}; running those steps unordered")
+        for name in cycle:
+            graph[name] = []
+
+    tier_times = {}
+    for tier in sorted({step.priority for step in steps}):
+        tier_start = time.perf_counter()
+        await asyncio.gather(*(
+            _run_step(step, graph[step.name], finished)
+            for step in steps if step.priority == tier
+        ))
+        tier_times[TIER_NAMES.get(tier, str(tier))] = time.perf_counter() - tier_start
+
+    total = time.perf_counter() - start
+    failed = [step.name for step in steps if step.error]
+    last_run.update(total=total, tiers=tier_times, failed=failed, finished_at=time.time())
+
+    print(f"[Recovery] {len(steps)} step(s) in {total:.2f}s "
+          f"({', '.join(f'{name} {seconds:.2f}s' for name, seconds in tier_times.items())})")
+    for step in sorted(steps, key=lambda s: (s.priority, -(s.duration or 0))):
+        status = "failed" if step.error else "ok"
+        print(f"[Recovery]   {TIER_NAMES.get(step.priority, step.priority):<10} {step.name:<28} "
+              f"{step.duration or 0:6.2f}s  {status}")
+
+
+async def paced(items: Iterable[T], per_second: float = DEFAULT_RATE) -> AsyncIterator[T]:
+    """Yield items no faster than per_second, for REST-heavy recovery scans"""
+    interval = 1 / per_second
+    next_at = time.monotonic()
+    for item in items:
+        delay = next_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        next_at = max(next_at, time.monotonic()) + interval
+        yield item
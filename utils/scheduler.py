@@ -0,0 +1,306 @@
+# utils/scheduler.py
+
+"""Shared APScheduler instance used by every subsystem"""
+
+import asyncio
+import pickle
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from apscheduler.events import (
+    EVENT_JOB_SUBMITTED,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_ERROR,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_REMOVED,
+)
+from apscheduler.job import Job
+from apscheduler.jobstores.base import JobLookupError
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.util import datetime_to_utc_timestamp
+from bson import Binary
+
+from utils.metrics import SCHEDULER_JOBS, SCHEDULER_JOB_ERRORS, SCHEDULER_JOBS_MISSED, job_label
+
+# Job stores
+# - "default" (memory) holds periodic jobs that each extension re-registers on startup
+# - "persistent" holds one-off and stateful jobs that must survive restarts. It is
+#   served from memory and mirrored to Mongo in the background (see MirroredJobStore).
+#   Functions stored there must be module-level and take only picklable args.
+PERSISTENT = "persistent"
+JOBS_DATABASE = "settings"
+JOBS_COLLECTION = "scheduled_jobs"
+
+# bot_config document recording which legacy job backfills have run
+BACKFILL_DOC_ID = "scheduler_backfills"
+
+# A run that starts this long after its scheduled time counts as missed
+LATE_RUN_THRESHOLD = 60  # seconds
+
+scheduler = AsyncIOScheduler(
+    timezone="UTC",
+    job_defaults={
+        "coalesce": True,  # Collapse runs missed during downtime into one
+        "max_instances": 1,
+        "misfire_grace_time": None,  # Always run late jobs instead of dropping them
+    }
+)
+
+class MirroredJobStore(MemoryJobStore):
+    """
+    In-memory job store whose changes are written to Mongo in the background.
+
+    APScheduler's MongoDBJobStore uses synchronous pymongo, so every add/get/
+    remove (and each scheduler wakeup) blocked the event loop. Here reads never
+    leave memory; writes are queued and applied in order through the async
+    MongoClient. Documents keep MongoDBJobStore's format, so jobs it stored load
+    unchanged. load() restores them at startup.
+    """
+
+    def __init__(self, collection, pickle_protocol: int = pickle.HIGHEST_PROTOCOL):
+        super().__init__()
+        self.collection = collection
+        self.pickle_protocol = pickle_protocol
+        self._writes: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+
+    def _document(self, job: Job) -> dict:
+        # Pickled here, not in the writer, so an unpicklable job fails in the caller
+        return {
+            "next_run_time": datetime_to_utc_timestamp(job.next_run_time),
+            "job_state": Binary(pickle.dumps(job.__getstate__(), self.pickle_protocol)),
+        }
+
+    def _queue_write(self, operation: str, *args) -> None:
+        if self._writes is None:
+            self._writes = asyncio.Queue()
+            self._writer = asyncio.get_running_loop().create_task(self._write_loop())
+        self._writes.put_nowait((operation, args))
+
+    async def _write_loop(self) -> None:
+        while True:
+            operation, args = await self._writes.get()
+            try:
+                if operation == "upsert":
+                    job_id, document = args
+                    await self.collection.update_one({"_id": job_id}, {"$set": document}, upsert=True)
+                elif operation == "delete":
+                    await self.collection.delete_one({"_id": args[0]})
+                elif operation == "delete_all":
+                    await self.collection.delete_many({})
+            except Exception as e:
+                print(f"[Scheduler] Failed to save job change ({operation} {args[:1]}): {e}")
+            finally:
+                self._writes.task_done()
+
+    async def load(self) -> int:
+        """Restore saved jobs into memory; returns how many were loaded"""
+        failed = []
+        loaded = 0
+        async for document in self.collection.find({}, ["_id", "job_state"]):
+            try:
+                job = Job.__new__(Job)
+                job.__setstate__(pickle.loads(document["job_state"]))
+                job._scheduler = self._scheduler
+                job._jobstore_alias = self._alias
+                super().add_job(job)
+                loaded += 1
+            except Exception as e:
+                print(f"[Scheduler] Unable to restore job {document['_id']!r}, removing it: {e}")
+                failed.append(document["_id"])
+
+        if failed:
+            await self.collection.delete_many({"_id": {"$in": failed}})
+        return loaded
+
+    async def flush(self) -> None:
+        """Wait for queued writes to reach Mongo"""
+        if self._writes is not None:
+            await self._writes.join()
+
+    def add_job(self, job: Job) -> None:
+        document = self._document(job)
+        super().add_job(job)
+        self._queue_write("upsert", job.id, document)
+
+    def update_job(self, job: Job) -> None:
+        document = self._document(job)
+        super().update_job(job)
+        self._queue_write("upsert", job.id, document)
+
+    def remove_job(self, job_id: str) -> None:
+        super().remove_job(job_id)
+        self._queue_write("delete", job_id)
+
+    def remove_all_jobs(self) -> None:
+        super().remove_all_jobs()
+        self._queue_write("delete_all")
+
+    def shutdown(self) -> None:
+        if self._writer is not None and self._writes.empty():
+            self._writer.cancel()
+
+
+_persistent_store: Optional[MirroredJobStore] = None
+
+# Per-job runtime statistics, keyed by job id
+job_stats: Dict[str, Dict[str, Any]] = {}
+_running: Dict[str, datetime] = {}
+
+
+def _stats_for(job_id: str) -> Dict[str, Any]:
+    return job_stats.setdefault(job_id, {
+        "runs": 0,
+        "errors": 0,
+        "missed": 0,
+        "last_run_at": None,
+        "last_duration": None,
+        "last_error": None,
+    })
+
+
+def _on_job_event(event) -> None:
+    """Track start time, duration, failures and missed runs for each job"""
+    now = datetime.now(timezone.utc)
+
+    if event.code == EVENT_JOB_SUBMITTED:
+        _running[event.job_id] = now
+        stats = _stats_for(event.job_id)
+        for run_time in event.scheduled_run_times:
+            if (now - run_time).total_seconds() > LATE_RUN_THRESHOLD:
+                stats["missed"] += 1
+                SCHEDULER_JOBS_MISSED.inc(job=job_label(event.job_id))
+
+    elif event.code in (EVENT_JOB_EXECUTED, EVENT_JOB_ERROR):
+        stats = _stats_for(event.job_id)
+        started_at = _running.pop(event.job_id, None)
+        stats["runs"] += 1
+        stats["last_run_at"] = started_at or now
+        if started_at:
+            stats["last_duration"] = (now - started_at).total_seconds()
+            SCHEDULER_JOBS.observe(stats["last_duration"], job=job_label(event.job_id))
+        if event.code == EVENT_JOB_ERROR:
+            stats["errors"] += 1
+            SCHEDULER_JOB_ERRORS.inc(job=job_label(event.job_id))
+            stats["last_error"] = repr(event.exception)
+            print(f"[Scheduler] Job {event.job_id} failed: {event.exception!r}")
+
+    elif event.code in (EVENT_JOB_MISSED, EVENT_JOB_MAX_INSTANCES):
+        _stats_for(event.job_id)["missed"] += 1
+        SCHEDULER_JOBS_MISSED.inc(job=job_label(event.job_id))
+
+    elif event.code == EVENT_JOB_REMOVED:
+        job_stats.pop(event.job_id, None)
+        _running.pop(event.job_id, None)
+
+
+scheduler.add_listener(
+    _on_job_event,
+    EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR
+    | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES | EVENT_JOB_REMOVED
+)
+
+
+async def start_scheduler(mongo) -> None:
+    """
+    Attach the persistent job store, load saved jobs and start the scheduler paused.
+
+    Called before extensions load so they can add and look up persisted jobs.
+    Nothing runs until resume_scheduler() once the bot has fully started.
+    """
+    global _persistent_store
+
+    if scheduler.running:
+        return
+
+    _persistent_store = MirroredJobStore(mongo.get_database(JOBS_DATABASE).get_collection(JOBS_COLLECTION))
+    scheduler.add_jobstore(_persistent_store, PERSISTENT)
+    scheduler.start(paused=True)
+    loaded = await _persistent_store.load()
+    print(f"[Scheduler] Started with {loaded} saved job(s) (paused until bot is ready)")
+
+
+def resume_scheduler() -> None:
+    """Begin executing jobs, including any persisted runs missed while offline"""
+    if scheduler.running:
+        scheduler.resume()
+        print(f"[Scheduler] Running {len(scheduler.get_jobs())} job(s)")
+
+
+async def shutdown_scheduler() -> None:
+    """Stop the scheduler without waiting for running jobs, after saving pending job changes"""
+    if _persistent_store is not None:
+        await _persistent_store.flush()
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
+        print("[Scheduler] Shut down")
+
+
+def schedule_periodic(
+        func: Callable,
+        seconds: int,
+        job_id: str,
+        first_run_delay: int = 0,
+        **kwargs
+):
+    """Register (or replace) an in-memory interval job, first firing after first_run_delay seconds"""
+    return scheduler.add_job(
+        func,
+        trigger=IntervalTrigger(seconds=seconds),
+        id=job_id,
+        replace_existing=True,
+        next_run_time=datetime.now(timezone.utc) + timedelta(seconds=first_run_delay),
+        **kwargs
+    )
+
+
+def remove_job(job_id: str) -> bool:
+    """Remove a job if it exists, returning whether anything was removed"""
+    try:
+        scheduler.remove_job(job_id)
+        return True
+    except JobLookupError:
+        return False
+
+
+async def needs_backfill(mongo, name: str) -> bool:
+    """Whether jobs from before the shared scheduler still need to be copied into it"""
+    doc = await mongo.bot_config.find_one({"_id": BACKFILL_DOC_ID}, {name: 1})
+    return not (doc and doc.get(name))
+
+
+async def mark_backfilled(mongo, name: str) -> None:
+    """Record that a legacy backfill finished so it never rescans again"""
+    await mongo.bot_config.update_one(
+        {"_id": BACKFILL_DOC_ID},
+        {"$set": {name: datetime.now(timezone.utc)}},
+        upsert=True
+    )
+
+
+def describe_jobs() -> List[Dict[str, Any]]:
+    """Snapshot of every scheduled job with its runtime statistics, soonest first"""
+    jobs = []
+    for job in scheduler.get_jobs():
+        stats = job_stats.get(job.id, {})
+        jobs.append({
+            "id": job.id,
+            "name": job.name,
+            "store": getattr(job, "_jobstore_alias", None),
+            "next_run_time": job.next_run_time,
+            "running": job.id in _running,
+            "runs": stats.get("runs", 0),
+            "errors": stats.get("errors", 0),
+            "missed": stats.get("missed", 0),
+            "last_run_at": stats.get("last_run_at"),
+            "last_duration": stats.get("last_duration"),
+            "last_error": stats.get("last_error"),
+        })
+
+    far_future = datetime.max.replace(tzinfo=timezone.utc)
+    jobs.sort(key=lambda j: j["next_run_time"] or far_future)
+    return jobs
+
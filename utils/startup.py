@@ -12,7 +12,67 @@
 #             file_list.append(path)
 #     return file_list
 
+import importlib
 import os
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Extensions listed individually in the startup report
+SLOWEST_SHOWN = 10
+
+
+class StartupProfiler:
+    """Wall-clock timings of each startup step, printed as one report once the bot is ready"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.steps: List[Tuple[str, float]] = []
+        self.extensions: List[Tuple[str, float, float]] = []  # (name, import, load)
+
+    @contextmanager
+    def measure(self, label: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((label, time.perf_counter() - start))
+
+    async def timed(self, label: str, awaitable: Awaitable[T]) -> T:
+        """Await something and record how long it took"""
+        with self.measure(label):
+            return await awaitable
+
+    def report(self) -> None:
+        total = time.perf_counter() - self.started
+        imports = sum(i for _, i, _ in self.extensions)
+        loads = sum(l for _, _, l in self.extensions)
+
+        print(f"[Startup] Ready in {total:.2f}s")
+        for label, duration in self.steps:
+            print(f"[Startup]   {label:<28} {duration:6.2f}s")
+        print(f"[Startup]   {len(self.extensions)} extensions: import {imports:.2f}s, load {loads:.2f}s")
+
+        slowest = sorted(self.extensions, key=lambda e: e[1] + e[2], reverse=True)[:SLOWEST_SHOWN]
+        for name, import_time, load_time in slowest:
+            print(f"[Startup]     {name:<60} import {import_time:5.2f}s  load {load_time:5.2f}s")
+
+
+async def load_extensions(client, extensions: Iterable[str], profiler: StartupProfiler) -> None:
+    """
+    Load extensions one at a time, timing the module import separately from
+    lightbulb's load (command/listener registration)
+    """
+    with profiler.measure("extensions"):
+        for name in extensions:
+            start = time.perf_counter()
+            importlib.import_module(name)
+            imported = time.perf_counter()
+            await client.load_extensions(name)
+            profiler.extensions.append((name, imported - start, time.perf_counter() - imported))
+
 
 def load_cogs(disallowed: set):
     file_list = []
@@ -0,0 +1,187 @@
+# utils/user_cache.py
+
+"""
+User and member lookups that avoid REST round trips.
+
+Resolution order:
+1. hikari's gateway cache (kept current by GUILD_MEMBERS events)
+2. a small TTL'd LRU of recent REST results
+3. a REST fetch, shared by every caller asking for the same ID at once
+
+hikari.NotFoundError and other REST errors propagate exactly as with
+bot.rest.fetch_user / fetch_member, so callers keep their existing handling.
+load(bot) subscribes to member update/leave events so changed members are
+refetched instead of served from the LRU until they expire.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import hikari
+
+from utils.metrics import request_timer
+
+# Configuration
+USER_TTL = 600  # seconds
+MEMBER_TTL = 300  # Members change more often (nicknames, roles)
+MAX_ENTRIES = 2000  # Per cache
+
+stats: Dict[str, int] = {
+    "gateway_hits": 0,
+    "cache_hits": 0,
+    "rest_fetches": 0,
+    "coalesced": 0,
+    "rest_errors": 0,
+}
+
+
+class TTLCache:
+    """Least-recently-used mapping whose entries expire after a fixed age"""
+
+    def __init__(self, ttl: float, max_entries: int = MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_users = TTLCache(USER_TTL)
+_members = TTLCache(MEMBER_TTL)
+_inflight: Dict[Hashable, asyncio.Future] = {}
+
+
+async def _timed_fetch(key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    with request_timer("discord", f"fetch_{key[0]}"):
+        return await fetch()
+
+
+async def _coalesced_fetch(key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run one REST fetch per key no matter how many callers are waiting on it"""
+    task = _inflight.get(key)
+    if task is not None:
+        stats["coalesced"] += 1
+    else:
+        stats["rest_fetches"] += 1
+        task = asyncio.ensure_future(_timed_fetch(key, fetch))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    # Shield so one cancelled caller doesn't cancel the fetch for the others
+    try:
+        return await asyncio.shield(task)
+    except hikari.HikariError:
+        stats["rest_errors"] += 1
+        raise
+
+
+async def fetch_user(bot: hikari.GatewayBot, user_id: hikari.Snowflakeish) -> hikari.User:
+    """Resolve a user: gateway cache, then recent lookups, then REST"""
+    user_id = int(user_id)
+
+    user = bot.cache.get_user(user_id)
+    if user:
+        stats["gateway_hits"] += 1
+        return user
+
+    user = _users.get(user_id)
+    if user:
+        stats["cache_hits"] += 1
+        return user
+
+    user = await _coalesced_fetch(("user", user_id), lambda: bot.rest.fetch_user(user_id))
+    _users.put(user_id, user)
+    return user
+
+
+async def fetch_member(
+        bot: hikari.GatewayBot,
+        guild_id: hikari.Snowflakeish,
+        user_id: hikari.Snowflakeish
+) -> hikari.Member:
+    """Resolve a guild member: gateway cache, then recent lookups, then REST"""
+    guild_id, user_id = int(guild_id), int(user_id)
+
+    member = bot.cache.get_member(guild_id, user_id)
+    if member:
+        stats["gateway_hits"] += 1
+        return member
+
+    key = (guild_id, user_id)
+    member = _members.get(key)
+    if member:
+        stats["cache_hits"] += 1
+        return member
+
+    member = await _coalesced_fetch(
+        ("member", guild_id, user_id),
+        lambda: bot.rest.fetch_member(guild_id, user_id)
+    )
+    _members.put(key, member)
+    _users.put(user_id, member.user)
+    return member
+
+
+def invalidate(user_id: hikari.Snowflakeish, guild_id: Optional[hikari.Snowflakeish] = None) -> None:
+    """Forget cached REST results for a user (and their membership in a guild)"""
+    _users.pop(int(user_id))
+    if guild_id is not None:
+        _members.pop((int(guild_id), int(user_id)))
+
+
+async def _on_member_changed(event: "hikari.MemberUpdateEvent | hikari.MemberDeleteEvent") -> None:
+    # Roles and nicknames feed permission checks, so never serve a pre-change copy
+    invalidate(event.user_id, event.guild_id)
+
+
+def load(bot: hikari.GatewayBot) -> None:
+    """Drop cached members when the gateway reports they changed or left"""
+    bot.subscribe(hikari.MemberUpdateEvent, _on_member_changed)
+    bot.subscribe(hikari.MemberDeleteEvent, _on_member_changed)
+
+
+def unload(bot: hikari.GatewayBot) -> None:
+    bot.unsubscribe(hikari.MemberUpdateEvent, _on_member_changed)
+    bot.unsubscribe(hikari.MemberDeleteEvent, _on_member_changed)
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters and current sizes of the lookup caches"""
+    lookups = stats["gateway_hits"] + stats["cache_hits"] + stats["rest_fetches"] + stats["coalesced"]
+    served = stats["gateway_hits"] + stats["cache_hits"] + stats["coalesced"]
+    return {
+        **stats,
+        "lookups": lookups,
+        "hit_rate": served / lookups if lookups else 0.0,
+        "cached_users": len(_users),
+        "cached_members": len(_members),
+        "in_flight": len(_inflight),
+    }